@@ -0,0 +1,32 @@
+"""Meetings composite (user_id, status) index and named native enum
+
+Revision ID: 4443aea687d2
+Revises: 164cf67dea8e
+Create Date: 2026-10-15 09:12:41.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4443aea687d2'
+down_revision: Union[str, None] = '164cf67dea8e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Enum nativo de Postgres con nombre explícito (4 bytes por fila)
+    op.execute("ALTER TYPE meetingstatus RENAME TO meeting_status")
+    # (user_id, status) sustituye al índice simple de user_id (prefijo izquierdo)
+    op.create_index('ix_meetings_user_status', 'meetings', ['user_id', 'status'], unique=False)
+    op.drop_index(op.f('ix_meetings_user_id'), table_name='meetings')
+
+
+def downgrade() -> None:
+    op.create_index(op.f('ix_meetings_user_id'), 'meetings', ['user_id'], unique=False)
+    op.drop_index('ix_meetings_user_status', table_name='meetings')
+    op.execute("ALTER TYPE meeting_status RENAME TO meetingstatus")
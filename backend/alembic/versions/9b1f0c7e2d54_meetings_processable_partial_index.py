@@ -0,0 +1,33 @@
+"""Partial index for processable meetings
+
+Revision ID: 9b1f0c7e2d54
+Revises: 4443aea687d2
+Create Date: 2026-10-15 09:41:03.552871
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b1f0c7e2d54'
+down_revision: Union[str, None] = '4443aea687d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Solo indexa trabajo sin reclamar: se mantiene pequeño sin importar el tamaño de la tabla
+    op.create_index(
+        'ix_meetings_processable',
+        'meetings',
+        ['created_at'],
+        unique=False,
+        postgresql_where=sa.text("status = 'PENDING' AND retry_count < 3")
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_meetings_processable', table_name='meetings')
@@ -0,0 +1,73 @@
+"""Task priority/status as SMALLINT-backed IntEnums
+
+Revision ID: a8d6f4b2c9e1
+Revises: f2c4a8e6b1d3
+Create Date: 2026-10-15 12:38:09.274518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8d6f4b2c9e1'
+down_revision: Union[str, None] = 'f2c4a8e6b1d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Orden numérico de TaskPriority / TaskStatus (app.models.task)
+PRIORITIES = ('CRITICAL', 'HIGH', 'MEDIUM', 'LOW')
+STATUSES = ('PENDING', 'IN_PROGRESS', 'COMPLETED', 'BLOCKED')
+
+
+def _to_int(column: str, names: Sequence[str]) -> str:
+    whens = " ".join(f"WHEN '{name}' THEN {i}" for i, name in enumerate(names))
+    return f"CASE {column}::text {whens} END"
+
+
+def _to_name(column: str, names: Sequence[str], enum_name: str) -> str:
+    whens = " ".join(f"WHEN {i} THEN '{name}'" for i, name in enumerate(names))
+    return f"(CASE {column} {whens} END)::{enum_name}"
+
+
+def upgrade() -> None:
+    # Conversión in situ: los índices simples y compuestos se reconstruyen solos
+    op.alter_column(
+        'tasks', 'priority',
+        existing_type=postgresql.ENUM(*PRIORITIES, name='taskpriority'),
+        type_=sa.SmallInteger(),
+        existing_nullable=False,
+        postgresql_using=_to_int('priority', PRIORITIES)
+    )
+    op.alter_column(
+        'tasks', 'status',
+        existing_type=postgresql.ENUM(*STATUSES, name='taskstatus'),
+        type_=sa.SmallInteger(),
+        existing_nullable=False,
+        postgresql_using=_to_int('status', STATUSES)
+    )
+    op.execute("DROP TYPE IF EXISTS taskpriority")
+    op.execute("DROP TYPE IF EXISTS taskstatus")
+
+
+def downgrade() -> None:
+    postgresql.ENUM(*PRIORITIES, name='taskpriority').create(op.get_bind())
+    postgresql.ENUM(*STATUSES, name='taskstatus').create(op.get_bind())
+    op.alter_column(
+        'tasks', 'priority',
+        existing_type=sa.SmallInteger(),
+        type_=postgresql.ENUM(*PRIORITIES, name='taskpriority', create_type=False),
+        existing_nullable=False,
+        postgresql_using=_to_name('priority', PRIORITIES, 'taskpriority')
+    )
+    op.alter_column(
+        'tasks', 'status',
+        existing_type=sa.SmallInteger(),
+        type_=postgresql.ENUM(*STATUSES, name='taskstatus', create_type=False),
+        existing_nullable=False,
+        postgresql_using=_to_name('status', STATUSES, 'taskstatus')
+    )
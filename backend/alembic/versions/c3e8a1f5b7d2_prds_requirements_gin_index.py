@@ -0,0 +1,35 @@
+"""GIN index on prds.requirements
+
+Revision ID: c3e8a1f5b7d2
+Revises: 9b1f0c7e2d54
+Create Date: 2026-10-15 11:02:17.318406
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3e8a1f5b7d2'
+down_revision: Union[str, None] = '9b1f0c7e2d54'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # La columna es JSON: el índice se define sobre el cast a JSONB que usa
+    # PRDRepository.get_by_requirement_type (containment @>)
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute(
+        "CREATE INDEX ix_prds_requirements ON prds "
+        "USING GIN ((requirements::jsonb) jsonb_path_ops)"
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.drop_index('ix_prds_requirements', table_name='prds')
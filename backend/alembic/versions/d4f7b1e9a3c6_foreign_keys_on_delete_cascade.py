@@ -0,0 +1,42 @@
+"""ON DELETE CASCADE on prds.meeting_id and tasks.prd_id
+
+Revision ID: d4f7b1e9a3c6
+Revises: a8d6f4b2c9e1
+Create Date: 2026-10-15 13:02:41.518207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4f7b1e9a3c6'
+down_revision: Union[str, None] = 'a8d6f4b2c9e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Nombres por defecto de PostgreSQL para las FKs sin nombre del esquema inicial
+PRDS_MEETING_FK = 'prds_meeting_id_fkey'
+TASKS_PRD_FK = 'tasks_prd_id_fkey'
+
+
+def upgrade() -> None:
+    # El borrado en cascada lo resuelve la BD (un solo DELETE desde el repositorio)
+    op.drop_constraint(TASKS_PRD_FK, 'tasks', type_='foreignkey')
+    op.drop_constraint(PRDS_MEETING_FK, 'prds', type_='foreignkey')
+    op.create_foreign_key(
+        PRDS_MEETING_FK, 'prds', 'meetings', ['meeting_id'], ['id'], ondelete='CASCADE'
+    )
+    op.create_foreign_key(
+        TASKS_PRD_FK, 'tasks', 'prds', ['prd_id'], ['id'], ondelete='CASCADE'
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(TASKS_PRD_FK, 'tasks', type_='foreignkey')
+    op.drop_constraint(PRDS_MEETING_FK, 'prds', type_='foreignkey')
+    op.create_foreign_key(PRDS_MEETING_FK, 'prds', 'meetings', ['meeting_id'], ['id'])
+    op.create_foreign_key(TASKS_PRD_FK, 'tasks', 'prds', ['prd_id'], ['id'])
@@ -0,0 +1,33 @@
+"""Tasks composite (prd_id, priority) and (assigned_role, status) indexes
+
+Revision ID: e5b9d3c1a7f4
+Revises: c3e8a1f5b7d2
+Create Date: 2026-10-15 11:26:44.905113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b9d3c1a7f4'
+down_revision: Union[str, None] = 'c3e8a1f5b7d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Los compuestos sustituyen a los índices simples (prefijo izquierdo)
+    op.create_index('ix_tasks_prd_priority', 'tasks', ['prd_id', 'priority'], unique=False)
+    op.create_index('ix_tasks_role_status', 'tasks', ['assigned_role', 'status'], unique=False)
+    op.drop_index(op.f('ix_tasks_prd_id'), table_name='tasks')
+    op.drop_index(op.f('ix_tasks_assigned_role'), table_name='tasks')
+
+
+def downgrade() -> None:
+    op.create_index(op.f('ix_tasks_assigned_role'), 'tasks', ['assigned_role'], unique=False)
+    op.create_index(op.f('ix_tasks_prd_id'), 'tasks', ['prd_id'], unique=False)
+    op.drop_index('ix_tasks_role_status', table_name='tasks')
+    op.drop_index('ix_tasks_prd_priority', table_name='tasks')
@@ -0,0 +1,43 @@
+"""confidence_score as double precision on prds and tasks
+
+Revision ID: f2c4a8e6b1d3
+Revises: e5b9d3c1a7f4
+Create Date: 2026-10-15 12:05:31.640227
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2c4a8e6b1d3'
+down_revision: Union[str, None] = 'e5b9d3c1a7f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Valores como "0.85" pasan a numérico: filtrables por rango y agregables en SQL
+    for table in ('prds', 'tasks'):
+        op.alter_column(
+            table,
+            'confidence_score',
+            existing_type=sa.String(length=10),
+            type_=sa.Float(),
+            existing_nullable=True,
+            postgresql_using='confidence_score::double precision'
+        )
+
+
+def downgrade() -> None:
+    for table in ('prds', 'tasks'):
+        op.alter_column(
+            table,
+            'confidence_score',
+            existing_type=sa.Float(),
+            type_=sa.String(length=10),
+            existing_nullable=True,
+            postgresql_using='confidence_score::varchar(10)'
+        )
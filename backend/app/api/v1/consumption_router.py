@@ -5,7 +5,7 @@
 
 from fastapi import APIRouter, HTTPException, Depends, status
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 
 from ...domain.services.subscription_consumption_service import SubscriptionConsumptionService
@@ -102,6 +102,44 @@ class ProcessStartResponse(BaseModel):
         }
 
 
+class BulkVerificationItemRequest(BaseModel):
+    """✅ Elemento individual de una verificación masiva"""
+    user_id: str = Field(..., min_length=1, description="ID del usuario")
+    estimated_duration_minutes: int = Field(
+        ...,
+        gt=0,
+        le=480,
+        description="Duración estimada en minutos"
+    )
+
+
+class BulkVerificationRequest(BaseModel):
+    """✅ Request model para verificación masiva de consumo"""
+    items: List[BulkVerificationItemRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=500,
+        description="Verificaciones a realizar (máximo 500)"
+    )
+
+
+class BulkVerificationItemResponse(BaseModel):
+    """✅ Resultado individual de la verificación masiva"""
+    user_id: str
+    authorized: bool
+    remaining_hours: Optional[float] = None
+    consumption_percentage: Optional[float] = None
+    error: Optional[str] = None
+    message: Optional[str] = None
+
+
+class BulkVerificationResponse(BaseModel):
+    """✅ Response model para verificación masiva (mismo orden que el request)"""
+    results: List[BulkVerificationItemResponse]
+    authorized_count: int
+    rejected_count: int
+
+
 # ================================================================================================
 # 🛣️ ROUTER CONFIGURATION
 # ================================================================================================
@@ -211,7 +249,7 @@ async def iniciar_procesamiento_reunion(
             # 3. DISPARAR WEBHOOK A N8N/MAKE
             webhook_response = await webhook_trigger.trigger_workflow(webhook_payload)
             
-            if webhook_response.status.value == "SENT":
+            if webhook_response.is_successful():
                 # ✅ Webhook exitoso - Procesamiento iniciado
                 logger.info(
                     f"Webhook enviado exitosamente para procesamiento {processing_id}",
@@ -313,6 +351,62 @@ async def iniciar_procesamiento_reunion(
         )
 
 
+@router.post(
+    "/process/start/bulk",
+    response_model=BulkVerificationResponse,
+    status_code=status.HTTP_200_OK,
+    summary="📦 Verificación masiva de consumo (Gatekeeper batch)",
+    description="""
+    **ENDPOINT BATCH - RF8.0 Gatekeeper**
+    
+    Verifica hasta 500 solicitudes de consumo en una sola llamada. Todos los
+    usuarios se resuelven con UNA consulta a la base de datos en lugar de una
+    por elemento (eliminación del patrón N+1 en los jobs batch de n8n).
+    
+    **Casos de uso:**
+    - ✅ Cada elemento retorna `authorized` y las horas restantes
+    - ❌ Los rechazos (horas insuficientes, usuario inexistente...) se reportan
+      por elemento con su código de error, sin fallar el lote completo
+    """
+)
+async def verificar_consumo_masivo(
+    request: BulkVerificationRequest,
+    consumption_service: SubscriptionConsumptionService = Depends(get_consumption_service)
+) -> BulkVerificationResponse:
+    """
+    📦 GATEKEEPER BATCH - Verificar consumo de múltiples usuarios.
+    """
+    items = await consumption_service.verificar_consumo_disponible_bulk([
+        (item.user_id, item.estimated_duration_minutes / 60.0)
+        for item in request.items
+    ])
+    
+    results = []
+    for item in items:
+        if item.authorized:
+            results.append(BulkVerificationItemResponse(
+                user_id=item.user_id,
+                authorized=True,
+                remaining_hours=item.result.remaining_hours,
+                consumption_percentage=item.result.consumption_percentage
+            ))
+        else:
+            results.append(BulkVerificationItemResponse(
+                user_id=item.user_id,
+                authorized=False,
+                error=item.error.error_code if item.error else None,
+                message=item.error.message if item.error else None
+            ))
+    
+    authorized_count = sum(1 for result in results if result.authorized)
+    
+    return BulkVerificationResponse(
+        results=results,
+        authorized_count=authorized_count,
+        rejected_count=len(results) - authorized_count
+    )
+
+
 @router.put(
     "/process/update",
     response_model=ConsumptionUpdateResponse,
@@ -3,7 +3,7 @@ Database configuration and session management.
 
 Implements ACID-compliant transaction manager for M2PRD-001.
 """
-from .session_manager import DatabaseSessionManager, get_db_session
+from .session_manager import DatabaseSessionManager, get_db_session, refresh_expired_attributes
 from .base import Base
 
-__all__ = ["DatabaseSessionManager", "get_db_session", "Base"]
+__all__ = ["DatabaseSessionManager", "get_db_session", "refresh_expired_attributes", "Base"]
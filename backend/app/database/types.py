@@ -0,0 +1,32 @@
+"""
+Custom column types for M2PRD-001.
+
+Tipos reutilizables por los modelos de dominio.
+"""
+from enum import IntEnum
+from typing import Optional, Type
+
+from sqlalchemy import SmallInteger
+from sqlalchemy.types import TypeDecorator
+
+
+class IntEnumType(TypeDecorator):
+    """
+    ✅ IntEnum de Python persistido como SMALLINT.
+
+    2 bytes por fila, comparaciones por rango (``<=``) sobre un B-tree y
+    nuevos miembros sin ALTER TYPE.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_class: Type[IntEnum], *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.enum_class = enum_class
+
+    def process_bind_param(self, value, dialect) -> Optional[int]:
+        return None if value is None else int(value)
+
+    def process_result_value(self, value, dialect) -> Optional[IntEnum]:
+        return None if value is None else self.enum_class(value)
@@ -4,7 +4,33 @@
 # Excepciones específicas para el dominio de consumo y suscripciones
 # Estas excepciones representan violaciones de reglas de negocio críticas
 
-from typing import Optional
+from typing import Callable, Dict, Optional, Type, TypeVar
+
+
+_E = TypeVar("_E", bound=Type["DomainException"])
+
+# Registro error_code → status HTTP, poblado al importar mediante @register_exception
+EXCEPTION_STATUS_CODES: Dict[str, int] = {}
+
+
+def register_exception(error_code: str, status_code: int) -> Callable[[_E], _E]:
+    """
+    📋 Registrar el status HTTP asociado a un código de error de dominio.
+    
+    Permite que el handler de la API resuelva el status con una sola búsqueda
+    en diccionario: añadir un código nuevo no requiere tocar el handler. El
+    código queda además como ``error_code`` de la clase, así que se escribe
+    una sola vez.
+    
+    Args:
+        error_code: Código de error de la excepción
+        status_code: Status HTTP a retornar
+    """
+    def decorator(cls: _E) -> _E:
+        cls.error_code = error_code
+        EXCEPTION_STATUS_CODES[error_code] = status_code
+        return cls
+    return decorator
 
 
 class DomainException(Exception):
@@ -15,12 +41,15 @@ class DomainException(Exception):
     manejadas como errores técnicos.
     """
     
+    error_code: str = "DOMAIN_ERROR"
+    
     def __init__(self, message: str, error_code: Optional[str] = None):
         super().__init__(message)
         self.message = message
-        self.error_code = error_code or "DOMAIN_ERROR"
+        self.error_code = error_code or type(self).error_code
 
 
+@register_exception("INSUFFICIENT_HOURS", 403)
 class InsufficientHoursException(DomainException):
     """
     🔴 EXCEPCIÓN CRÍTICA - Horas insuficientes para procesamiento (RF8.0).
@@ -43,13 +72,14 @@ class InsufficientHoursException(DomainException):
             f"required={required_hours:.2f}, available={available_hours:.2f}, "
             f"subscription_status={subscription_status}"
         )
-        super().__init__(message, "INSUFFICIENT_HOURS")
+        super().__init__(message)
         self.user_id = user_id
         self.required_hours = required_hours
         self.available_hours = available_hours
         self.subscription_status = subscription_status
 
 
+@register_exception("SUBSCRIPTION_NOT_FOUND", 404)
 class SubscriptionNotFoundException(DomainException):
     """
     🔍 EXCEPCIÓN DE NEGOCIO - Suscripción no encontrada.
@@ -64,11 +94,12 @@ class SubscriptionNotFoundException(DomainException):
         else:
             message = f"No active subscription found for user {user_id}"
         
-        super().__init__(message, "SUBSCRIPTION_NOT_FOUND")
+        super().__init__(message)
         self.user_id = user_id
         self.subscription_id = subscription_id
 
 
+@register_exception("INVALID_CONSUMPTION", 400)
 class InvalidConsumptionException(DomainException):
     """
     ⚠️ EXCEPCIÓN DE VALIDACIÓN - Consumo inválido.
@@ -82,12 +113,13 @@ class InvalidConsumptionException(DomainException):
             f"Invalid consumption for user {user_id}: "
             f"hours={invalid_hours}, reason={reason}"
         )
-        super().__init__(message, "INVALID_CONSUMPTION")
+        super().__init__(message)
         self.user_id = user_id
         self.invalid_hours = invalid_hours
         self.reason = reason
 
 
+@register_exception("USER_NOT_FOUND", 404)
 class UserNotFoundException(DomainException):
     """
     👤 EXCEPCIÓN DE NEGOCIO - Usuario no encontrado.
@@ -98,10 +130,11 @@ class UserNotFoundException(DomainException):
     
     def __init__(self, user_id: str):
         message = f"User {user_id} not found"
-        super().__init__(message, "USER_NOT_FOUND")
+        super().__init__(message)
         self.user_id = user_id
 
 
+@register_exception("SUBSCRIPTION_EXPIRED", 403)
 class SubscriptionExpiredException(DomainException):
     """
     ⏰ EXCEPCIÓN DE NEGOCIO - Suscripción expirada.
@@ -114,12 +147,13 @@ class SubscriptionExpiredException(DomainException):
             f"Subscription {subscription_id} for user {user_id} "
             f"expired at {expired_at}"
         )
-        super().__init__(message, "SUBSCRIPTION_EXPIRED")
+        super().__init__(message)
         self.user_id = user_id
         self.subscription_id = subscription_id
         self.expired_at = expired_at
 
 
+@register_exception("SUBSCRIPTION_SUSPENDED", 403)
 class SubscriptionSuspendedException(DomainException):
     """
     🚫 EXCEPCIÓN DE NEGOCIO - Suscripción suspendida.
@@ -133,12 +167,13 @@ class SubscriptionSuspendedException(DomainException):
             f"Subscription {subscription_id} for user {user_id} "
             f"is suspended: {reason}"
         )
-        super().__init__(message, "SUBSCRIPTION_SUSPENDED")
+        super().__init__(message)
         self.user_id = user_id
         self.subscription_id = subscription_id
         self.reason = reason
 
 
+@register_exception("DATABASE_TRANSACTION_FAILED", 500)
 class DatabaseTransactionException(DomainException):
     """
     💾 EXCEPCIÓN TÉCNICA - Error en transacción de base de datos.
@@ -148,6 +183,6 @@ class DatabaseTransactionException(DomainException):
     """
     
     def __init__(self, message: str, transaction_id: str = None, user_id: str = None):
-        super().__init__(message, "DATABASE_TRANSACTION_FAILED")
+        super().__init__(message)
         self.transaction_id = transaction_id
         self.user_id = user_id
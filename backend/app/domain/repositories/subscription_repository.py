@@ -5,7 +5,7 @@
 # Principio DIP: El dominio define la interface, la infraestructura la implementa
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 from ..entities.subscription import Subscription
 
 
@@ -162,4 +162,53 @@ class UserRepository(ABC):
         Returns:
             bool: True si el usuario existe
         """
-        pass
\ No newline at end of file
+        pass
+    
+    @abstractmethod
+    async def get_users_with_active_subscriptions(
+        self,
+        user_ids: List[str]
+    ) -> Dict[str, Tuple['User', Optional[Subscription]]]:
+        """
+        📦 Obtener usuarios y sus suscripciones activas en UNA sola consulta.
+        
+        Operación batch para eliminar el patrón N+1 en verificaciones masivas.
+        La implementación debe resolver todos los IDs con un único
+        ``SELECT ... WHERE u.id = ANY($1::text[])`` (LEFT JOIN a suscripciones activas).
+        
+        Args:
+            user_ids: Identificadores de usuario a resolver
+            
+        Returns:
+            Dict[str, Tuple[User, Optional[Subscription]]]: Mapa user_id → (usuario,
+            suscripción activa o None). Los usuarios inexistentes no aparecen en el mapa.
+        """
+        pass
+
+
+class ConsumptionAuditRepository(ABC):
+    """
+    🧾 REPOSITORY INTERFACE - Port para el registro de auditoría de consumo.
+    
+    Sink de auditoría desacoplado de la transacción principal: se escribe
+    DESPUÉS del commit y no debe bloquear la respuesta del Gatekeeper.
+    """
+    
+    @abstractmethod
+    async def record_consumption(
+        self,
+        user_id: str,
+        subscription_id: str,
+        hours_consumed: float,
+        description: str
+    ) -> None:
+        """
+        📝 Registrar un consumo confirmado.
+        
+        Args:
+            user_id: Identificador del usuario
+            subscription_id: Suscripción afectada
+            hours_consumed: Horas consumidas
+            description: Descripción del consumo
+        """
+        pass
@@ -6,11 +6,13 @@
 from .subscription_consumption_service import (
     SubscriptionConsumptionService,
     ConsumptionVerificationResult,
-    ConsumptionResult
+    ConsumptionResult,
+    BulkVerificationItem
 )
 
 __all__ = [
     "SubscriptionConsumptionService",
     "ConsumptionVerificationResult", 
-    "ConsumptionResult"
+    "ConsumptionResult",
+    "BulkVerificationItem"
 ]
\ No newline at end of file
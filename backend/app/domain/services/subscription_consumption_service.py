@@ -4,20 +4,33 @@
 # 🟢 TDD GREEN PHASE - Implementación mínima para pasar los tests
 # Este es el COMPONENTE MÁS IMPORTANTE del sistema SaaS
 
-from typing import Optional
+import asyncio
+import logging
+from typing import List, Optional, Set, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 
 from ..entities.user import User
 from ..entities.subscription import Subscription, SubscriptionStatus
 from ..exceptions.consumption_exceptions import (
+    DomainException,
     InsufficientHoursException,
     SubscriptionNotFoundException,
     UserNotFoundException,
     InvalidConsumptionException,
     SubscriptionSuspendedException
 )
-from ..repositories.subscription_repository import SubscriptionRepository, UserRepository
+from ..repositories.subscription_repository import (
+    ConsumptionAuditRepository,
+    SubscriptionRepository,
+    UserRepository
+)
+
+logger = logging.getLogger(__name__)
+
+# Referencias fuertes a efectos secundarios en curso: el servicio se crea por
+# request, así que el conjunto vive a nivel de módulo (evita que el GC los cancele)
+_BACKGROUND_TASKS: Set[asyncio.Task] = set()
 
 
 @dataclass
@@ -53,6 +66,25 @@ class ConsumptionResult:
     transaction_id: Optional[str] = None
 
 
+@dataclass
+class BulkVerificationItem:
+    """
+    📦 Resultado individual de una verificación masiva.
+    
+    Value Object que conserva el orden de entrada: contiene el resultado
+    de la verificación o la excepción de dominio que la rechazó.
+    """
+    user_id: str
+    required_hours: float
+    result: Optional[ConsumptionVerificationResult] = None
+    error: Optional[DomainException] = None
+    
+    @property
+    def authorized(self) -> bool:
+        """Verificar si el consumo fue autorizado."""
+        return self.result is not None and self.result.can_consume
+
+
 class SubscriptionConsumptionService:
     """
     🔒 GATEKEEPER SERVICE - Servicio crítico de control de consumo (RF8.0).
@@ -76,12 +108,12 @@ class SubscriptionConsumptionService:
     
     # 🟢 REFACTOR: Constantes para mejorar legibilidad
     _MIN_REQUIRED_HOURS = 0.0
-    _CONSULTATION_HOURS = 0.1  # Para consultas de estado
     
     def __init__(
         self,
         subscription_repository: SubscriptionRepository,
-        user_repository: UserRepository
+        user_repository: UserRepository,
+        audit_repository: Optional[ConsumptionAuditRepository] = None
     ):
         """
         🏗️ Constructor con inyección de dependencias (DIP).
@@ -89,9 +121,11 @@ class SubscriptionConsumptionService:
         Args:
             subscription_repository: Repository para acceso a suscripciones
             user_repository: Repository para acceso a usuarios
+            audit_repository: Sink opcional de auditoría post-commit
         """
         self._subscription_repository = subscription_repository
         self._user_repository = user_repository
+        self._audit_repository = audit_repository
     
     async def verificar_consumo_disponible(
         self, 
@@ -125,13 +159,68 @@ class SubscriptionConsumptionService:
             InvalidConsumptionException: Si las horas requeridas son inválidas
         """
         # 🟢 REFACTOR: Validación mejorada con constante
-        if required_hours <= self._MIN_REQUIRED_HOURS:
-            raise InvalidConsumptionException(
-                user_id, 
-                required_hours, 
-                "Required hours must be positive"
-            )
+        self._validar_horas_requeridas(user_id, required_hours)
+        
+        # 1-3. Cargar usuario y suscripción activa
+        user, subscription = await self._load_user_and_subscription(user_id)
+        
+        return self._evaluar_consumo(user_id, required_hours, user, subscription)
+    
+    async def verificar_consumo_disponible_bulk(
+        self,
+        items: List[Tuple[str, float]]
+    ) -> List[BulkVerificationItem]:
+        """
+        📦 RF8.0 BATCH - Verificar consumo de muchos usuarios en una sola consulta.
+        
+        Elimina el patrón N+1 de los jobs batch del workflow: todos los usuarios
+        se resuelven con UNA llamada al repositorio y las reglas de negocio se
+        aplican en memoria, exactamente igual que en `verificar_consumo_disponible`.
         
+        Los rechazos no interrumpen el lote: cada elemento lleva su resultado
+        o la excepción de dominio correspondiente.
+        
+        Args:
+            items: Lista de tuplas (user_id, required_hours)
+            
+        Returns:
+            List[BulkVerificationItem]: Resultados en el mismo orden de entrada
+        """
+        if not items:
+            return []
+        
+        user_ids = list(dict.fromkeys(user_id for user_id, _ in items))
+        records = await self._user_repository.get_users_with_active_subscriptions(user_ids)
+        
+        results: List[BulkVerificationItem] = []
+        for user_id, required_hours in items:
+            item = BulkVerificationItem(user_id=user_id, required_hours=required_hours)
+            try:
+                self._validar_horas_requeridas(user_id, required_hours)
+                
+                record = records.get(user_id)
+                if record is None:
+                    raise UserNotFoundException(user_id)
+                
+                user, subscription = record
+                if not user.can_access_system():
+                    raise UserNotFoundException(f"User {user_id} cannot access system")
+                
+                item.result = self._evaluar_consumo(user_id, required_hours, user, subscription)
+            except DomainException as e:
+                item.error = e
+            results.append(item)
+        
+        return results
+    
+    async def _load_user_and_subscription(self, user_id: str) -> Tuple[User, Subscription]:
+        """
+        🔍 Cargar usuario y suscripción activa (camino de solo lectura compartido).
+        
+        Raises:
+            UserNotFoundException: Si el usuario no existe o no puede acceder
+            SubscriptionNotFoundException: Si no tiene suscripción activa
+        """
         # 1. Verificar que el usuario existe
         user = await self._user_repository.get_user_by_id(user_id)
         if not user:
@@ -146,6 +235,42 @@ class SubscriptionConsumptionService:
         if not subscription:
             raise SubscriptionNotFoundException(user_id)
         
+        return user, subscription
+    
+    def _validar_horas_requeridas(self, user_id: str, required_hours: float) -> None:
+        """
+        🛡️ Validar que las horas requeridas sean positivas.
+        
+        Raises:
+            InvalidConsumptionException: Si las horas requeridas son inválidas
+        """
+        if required_hours <= self._MIN_REQUIRED_HOURS:
+            raise InvalidConsumptionException(
+                user_id, 
+                required_hours, 
+                "Required hours must be positive"
+            )
+    
+    def _evaluar_consumo(
+        self,
+        user_id: str,
+        required_hours: float,
+        user: User,
+        subscription: Optional[Subscription]
+    ) -> ConsumptionVerificationResult:
+        """
+        🎯 Aplicar las reglas de consumo sobre entidades ya cargadas.
+        
+        Lógica pura compartida por la verificación individual y la masiva.
+        
+        Raises:
+            SubscriptionNotFoundException: Si no tiene suscripción activa
+            SubscriptionSuspendedException: Si la suscripción está suspendida
+            InsufficientHoursException: Si no tiene suficientes horas
+        """
+        if not subscription:
+            raise SubscriptionNotFoundException(user_id)
+        
         # 4. Verificar estado de la suscripción
         if subscription.status == SubscriptionStatus.SUSPENDED:
             raise SubscriptionSuspendedException(
@@ -220,13 +345,6 @@ class SubscriptionConsumptionService:
             
             await self._subscription_repository.commit_transaction()
             
-            return ConsumptionResult(
-                success=True,
-                updated_subscription=final_subscription,
-                consumed_hours=hours_to_consume,
-                remaining_hours=final_subscription.available_hours
-            )
-            
         except Exception as e:
             await self._subscription_repository.rollback_transaction()
             raise InvalidConsumptionException(
@@ -234,21 +352,76 @@ class SubscriptionConsumptionService:
                 hours_to_consume, 
                 f"Transaction failed: {str(e)}"
             )
+        
+        # 4. Efectos secundarios post-commit: fuera del try, no retrasan la respuesta
+        self._schedule_audit(user_id, final_subscription.id, hours_to_consume, description)
+        
+        return ConsumptionResult(
+            success=True,
+            updated_subscription=final_subscription,
+            consumed_hours=hours_to_consume,
+            remaining_hours=final_subscription.available_hours
+        )
+    
+    def _schedule_audit(
+        self,
+        user_id: str,
+        subscription_id: str,
+        hours_consumed: float,
+        description: str
+    ) -> None:
+        """
+        🔥 Registrar la auditoría en segundo plano sin esperar su resultado.
+        
+        Los fallos (también los síncronos) solo se registran en el log: la
+        transacción ya fue confirmada y las horas ya se consumieron.
+        """
+        if self._audit_repository is None:
+            return
+        try:
+            task = asyncio.create_task(
+                self._audit_repository.record_consumption(
+                    user_id=user_id,
+                    subscription_id=subscription_id,
+                    hours_consumed=hours_consumed,
+                    description=description
+                )
+            )
+        except Exception:
+            logger.exception("Post-commit side effect failed")
+            return
+        _BACKGROUND_TASKS.add(task)
+        task.add_done_callback(_on_background_task_done)
     
     async def obtener_estado_consumo(self, user_id: str) -> ConsumptionVerificationResult:
         """
         📊 Obtener estado actual de consumo del usuario.
         
-        🟢 REFACTOR: Función de consulta mejorada con constante.
-        Función que no modifica datos, útil para dashboards y monitoreo.
+        Camino de solo lectura: no simula un consumo ni lanza excepciones por
+        horas insuficientes. Útil para dashboards y monitoreo.
         
         Args:
             user_id: Identificador del usuario
             
         Returns:
             ConsumptionVerificationResult: Estado actual del consumo
+            
+        Raises:
+            UserNotFoundException: Si el usuario no existe
+            SubscriptionNotFoundException: Si no tiene suscripción activa
         """
-        return await self.verificar_consumo_disponible(user_id, self._CONSULTATION_HOURS)
+        user, subscription = await self._load_user_and_subscription(user_id)
+        
+        return ConsumptionVerificationResult(
+            can_consume=(
+                subscription.status == SubscriptionStatus.ACTIVE and
+                subscription.available_hours > 0
+            ),
+            user=user,
+            subscription=subscription,
+            remaining_hours=subscription.available_hours,
+            consumption_percentage=subscription.get_consumption_percentage()
+        )
     
     async def actualizar_registro_consumo(
         self, 
@@ -340,3 +513,13 @@ class SubscriptionConsumptionService:
             await self._subscription_repository.rollback_transaction()
             from ..exceptions.consumption_exceptions import DatabaseTransactionException
             raise DatabaseTransactionException(f"Failed to update consumption: {str(e)}")
+
+
+def _on_background_task_done(task: asyncio.Task) -> None:
+    """Liberar la referencia y registrar errores del efecto secundario."""
+    _BACKGROUND_TASKS.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error(
+            "Post-commit side effect failed",
+            exc_info=task.exception()
+        )
@@ -9,26 +9,60 @@ from fastapi.responses import JSONResponse, Response
 from fastapi.exceptions import RequestValidationError
 from contextlib import asynccontextmanager
 import logging
-import time
+import logging.handlers
+import queue
+import re
+from time import time as _now
 from typing import Dict, Any
 
 from prometheus_fastapi_instrumentator import Instrumentator
 from prometheus_client import Counter, Histogram, Gauge, Info
 
 from .api.v1.consumption_router import router as consumption_router
-from .domain.exceptions.consumption_exceptions import DomainException
+from .domain.exceptions.consumption_exceptions import DomainException, EXCEPTION_STATUS_CODES
+from .services.webhook_trigger import (
+    AiohttpWebhookClient,
+    circuit_breaker_state,
+    close_shared_http_client,
+    configure_shared_http_client
+)
 
 # ================================================================================================
 # 🔧 APPLICATION CONFIGURATION
 # ================================================================================================
 
-# Configuración de logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+# Configuración de logging - mientras la app está en marcha (lifespan) los requests
+# solo encolan (put_nowait); el formateo y la escritura a stdout ocurren en el hilo
+# del QueueListener. Fuera del lifespan se escribe directamente a stdout.
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_log_stream_handler = logging.StreamHandler()
+_log_stream_handler.setFormatter(
+    logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+)
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, _log_stream_handler, respect_handler_level=True
 )
+_log_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_log_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+logging.basicConfig(level=logging.INFO, handlers=[_log_stream_handler])
 logger = logging.getLogger(__name__)
 
+
+def _start_queued_logging() -> None:
+    """Arranca el QueueListener y solo entonces enruta el root logger a la cola."""
+    _log_listener.start()
+    root_logger = logging.getLogger()
+    root_logger.addHandler(_log_queue_handler)
+    root_logger.removeHandler(_log_stream_handler)
+
+
+def _stop_queued_logging() -> None:
+    """Vuelve a la escritura directa y drena la cola antes de parar el listener."""
+    root_logger = logging.getLogger()
+    root_logger.addHandler(_log_stream_handler)
+    root_logger.removeHandler(_log_queue_handler)
+    _log_listener.stop()
+
 # ================================================================================================
 # 📊 PROMETHEUS CUSTOM METRICS - RF8.0 (Consumo SaaS)
 # ================================================================================================
@@ -90,20 +124,24 @@ async def lifespan(app: FastAPI):
     pools de conexiones, etc.
     """
     # Startup
+    _start_queued_logging()
     logger.info("🚀 Starting Consumption Service (Gatekeeper)")
     logger.info("💰 RF8.0 Critical Service - SaaS Monetization Layer")
     
     # TODO: Inicializar conexiones de BD, Redis, etc.
     # await database.connect()
     # await redis.connect()
+    configure_shared_http_client(AiohttpWebhookClient.create())  # Hot path de webhooks n8n
     
     yield
     
     # Shutdown
     logger.info("🔻 Shutting down Consumption Service")
+    await close_shared_http_client()
     # TODO: Cerrar conexiones
     # await database.disconnect()
     # await redis.disconnect()
+    _stop_queued_logging()  # Drena la cola antes de salir
 
 
 # ================================================================================================
@@ -151,13 +189,17 @@ app = FastAPI(
 # ================================================================================================
 
 # CORS - Configuración para frontend SaaS
+_CORS_ALLOWED_ORIGINS = (
+    "http://localhost:3000",  # React frontend local
+    "https://app.memorymeet.com",  # Producción frontend
+    "https://n8n.company.com",  # n8n workflows
+)
+
+# Starlette compila el patrón una sola vez: un match en C en lugar de un
+# escaneo lineal de la lista por request (escala con orígenes por tenant)
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[
-        "http://localhost:3000",  # React frontend local
-        "https://app.memorymeet.com",  # Producción frontend
-        "https://n8n.company.com",  # n8n workflows
-    ],
+    allow_origin_regex="^(" + "|".join(re.escape(o) for o in _CORS_ALLOWED_ORIGINS) + ")$",
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE"],
     allow_headers=["*"],
@@ -171,7 +213,7 @@ async def log_requests(request: Request, call_next):
     
     Crítico para observabilidad del Gatekeeper.
     """
-    start_time = time.time()
+    start_time = _now()
     
     # Log de request entrante
     logger.info(
@@ -188,7 +230,7 @@ async def log_requests(request: Request, call_next):
     response = await call_next(request)
     
     # Calcular tiempo de procesamiento
-    process_time = time.time() - start_time
+    process_time = _now() - start_time
     
     # Log de response
     logger.info(
@@ -225,23 +267,12 @@ async def domain_exception_handler(request: Request, exc: DomainException):
         }
     )
     
-    # Mapeo de códigos de error a status HTTP
-    status_mapping = {
-        "INSUFFICIENT_HOURS": status.HTTP_403_FORBIDDEN,
-        "USER_NOT_FOUND": status.HTTP_404_NOT_FOUND,
-        "SUBSCRIPTION_NOT_FOUND": status.HTTP_404_NOT_FOUND,
-        "SUBSCRIPTION_SUSPENDED": status.HTTP_403_FORBIDDEN,
-        "SUBSCRIPTION_EXPIRED": status.HTTP_403_FORBIDDEN,
-        "INVALID_CONSUMPTION": status.HTTP_400_BAD_REQUEST,
-        "DATABASE_TRANSACTION_FAILED": status.HTTP_500_INTERNAL_SERVER_ERROR
-    }
-    
     return JSONResponse(
-        status_code=status_mapping.get(exc.error_code, status.HTTP_400_BAD_REQUEST),
+        status_code=EXCEPTION_STATUS_CODES.get(exc.error_code, status.HTTP_400_BAD_REQUEST),
         content={
             "error": exc.error_code,
             "message": exc.message,
-            "timestamp": time.time()
+            "timestamp": _now()
         }
     )
 
@@ -265,7 +296,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
             "error": "VALIDATION_ERROR",
             "message": "Invalid request data",
             "details": exc.errors(),
-            "timestamp": time.time()
+            "timestamp": _now()
         }
     )
 
@@ -292,7 +323,7 @@ async def general_exception_handler(request: Request, exc: Exception):
         content={
             "error": "INTERNAL_SERVER_ERROR",
             "message": "An unexpected error occurred",
-            "timestamp": time.time()
+            "timestamp": _now()
         }
     )
 
@@ -352,9 +383,10 @@ async def health_check():
         "status": "healthy",
         "service": "consumption-service",
         "version": "1.0.0",
-        "timestamp": time.time(),
+        "timestamp": _now(),
         "checks": {
             "api": "ok",
+            "n8n_webhook": "circuit_open" if circuit_breaker_state() == "open" else "ok",
             # TODO: Agregar checks de BD, Redis, etc.
             # "database": await check_database(),
             # "redis": await check_redis()
@@ -379,6 +411,7 @@ async def root():
         "health_url": "/health",
         "endpoints": {
             "start_processing": "/api/v1/consumption/process/start",
+            "bulk_verification": "/api/v1/consumption/process/start/bulk",
             "update_consumption": "/api/v1/consumption/process/update",
             "user_status": "/api/v1/consumption/user/{user_id}/status"
         }
@@ -7,8 +7,8 @@ from datetime import datetime
 from enum import Enum as PyEnum
 from typing import Optional
 
-from sqlalchemy import Column, String, DateTime, Enum, Integer, Text
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, DateTime, Enum, Index, Integer, Text, text
+from sqlalchemy.orm import relationship, validates
 
 from ..database.base import Base
 
@@ -28,6 +28,17 @@ class Meeting(Base):
     Represents a meeting that will be transcribed and processed.
     """
     __tablename__ = "meetings"
+    __table_args__ = (
+        # Cola de procesamiento: WHERE user_id = ? AND status = ? en un solo range scan
+        Index("ix_meetings_user_status", "user_id", "status"),
+        # Índice parcial: solo trabajo sin reclamar (mismo predicado que is_processable)
+        Index(
+            "ix_meetings_processable",
+            "created_at",
+            postgresql_where=text("status = 'PENDING' AND retry_count < 3"),
+            sqlite_where=text("status = 'PENDING' AND retry_count < 3"),
+        ),
+    )
     
     # Primary Key
     id = Column(String(50), primary_key=True, index=True)
@@ -39,14 +50,14 @@ class Meeting(Base):
     
     # Processing Status
     status = Column(
-        Enum(MeetingStatus),
+        Enum(MeetingStatus, native_enum=True, name="meeting_status"),
         default=MeetingStatus.PENDING,
         nullable=False,
         index=True
     )
     
     # User Information (for RF8.0 - Consumption Control)
-    user_id = Column(String(50), nullable=False, index=True)
+    user_id = Column(String(50), nullable=False)  # Cubierto por ix_meetings_user_status
     
     # Transcription
     transcription_text = Column(Text, nullable=True)
@@ -61,7 +72,15 @@ class Meeting(Base):
     retry_count = Column(Integer, default=0, nullable=False)
     
     # Relationships
-    prd = relationship("PRD", back_populates="meeting", uselist=False, cascade="all, delete-orphan")
+    prd = relationship(
+        "PRD", back_populates="meeting", uselist=False,
+        cascade="all, delete-orphan", passive_deletes=True
+    )  # ON DELETE CASCADE en la BD
+    
+    @validates("meeting_url", "user_id")
+    def _normalize_text(self, key: str, value: Optional[str]) -> Optional[str]:
+        """Normaliza meeting_url y user_id una sola vez al asignar (strip)."""
+        return value.strip() if isinstance(value, str) else value
     
     def __repr__(self) -> str:
         return f"<Meeting(id={self.id}, status={self.status}, user_id={self.user_id})>"
@@ -70,13 +89,20 @@ class Meeting(Base):
         """
         ✅ Domain Logic - Verifica si la reunión puede ser procesada.
         
+        Mantener sincronizado con el predicado de ix_meetings_processable.
+        
         Returns:
             bool: True si puede procesarse
         """
         return self.status == MeetingStatus.PENDING and self.retry_count < 3
     
     def mark_as_processing(self) -> None:
-        """✅ Domain Logic - Marca reunión como en procesamiento."""
+        """
+        ✅ Domain Logic - Marca reunión como en procesamiento.
+        
+        Los UPDATE de MeetingRepository sellan estas transiciones con NOW()
+        en la BD; aquí la entidad necesita un datetime real y legible.
+        """
         self.status = MeetingStatus.PROCESSING
         self.processing_started_at = datetime.utcnow()
     
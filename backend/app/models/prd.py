@@ -4,10 +4,11 @@
 Represents a generated PRD with requirements extracted from meeting transcription.
 """
 from datetime import datetime
-from typing import List, Optional
+from functools import cached_property
+from typing import Dict, List, Optional
 
-from sqlalchemy import Column, String, DateTime, Text, ForeignKey, JSON
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, DateTime, Float, Text, ForeignKey, JSON
+from sqlalchemy.orm import deferred, relationship, validates
 
 from ..database.base import Base
 
@@ -28,14 +29,16 @@ class PRD(Base):
     description = Column(Text, nullable=True)
     
     # Requirements (stored as JSON for flexibility)
-    requirements = Column(JSON, nullable=False, default=list)
+    # Diferido: listados y vistas de metadatos no transfieren el blob JSON;
+    # los repositorios lo cargan con undefer() cuando se necesita.
+    requirements = deferred(Column(JSON, nullable=False, default=list))
     
     # Metadata
-    confidence_score = Column(String(10), nullable=True)  # e.g., "0.85"
+    confidence_score = Column(Float, nullable=True)  # e.g., 0.85
     language_detected = Column(String(10), nullable=True)  # e.g., "es", "en"
     
     # Foreign Keys
-    meeting_id = Column(String(50), ForeignKey("meetings.id"), nullable=False, unique=True)
+    meeting_id = Column(String(50), ForeignKey("meetings.id", ondelete="CASCADE"), nullable=False, unique=True)
     
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -43,26 +46,49 @@ class PRD(Base):
     
     # Relationships
     meeting = relationship("Meeting", back_populates="prd")
-    tasks = relationship("Task", back_populates="prd", cascade="all, delete-orphan")
+    tasks = relationship(
+        "Task", back_populates="prd", cascade="all, delete-orphan", passive_deletes=True
+    )  # ON DELETE CASCADE en la BD
+    
+    @validates("title")
+    def _normalize_text(self, key: str, value: Optional[str]) -> Optional[str]:
+        """Normaliza el título una sola vez al asignar (strip)."""
+        return value.strip() if isinstance(value, str) else value
     
     def __repr__(self) -> str:
         return f"<PRD(id={self.id}, title={self.title}, meeting_id={self.meeting_id})>"
     
+    @cached_property
+    def requirements_by_type(self) -> Dict[Optional[str], List[dict]]:
+        """
+        ✅ Domain Logic - Requisitos agrupados por tipo en una sola pasada.
+        
+        Memoizado por instancia: todas las vistas por tipo comparten el índice.
+        """
+        buckets: Dict[Optional[str], List[dict]] = {}
+        for req in self.requirements:
+            buckets.setdefault(req.get("type"), []).append(req)
+        return buckets
+    
     @property
     def functional_requirements(self) -> List[dict]:
         """✅ Domain Logic - Obtiene solo requisitos funcionales."""
-        return [
-            req for req in self.requirements 
-            if req.get("type") == "functional"
-        ]
+        return self.requirements_by_type.get("functional", [])
     
     @property
     def non_functional_requirements(self) -> List[dict]:
         """✅ Domain Logic - Obtiene solo requisitos no funcionales."""
-        return [
-            req for req in self.requirements 
-            if req.get("type") == "non_functional"
-        ]
+        return self.requirements_by_type.get("non_functional", [])
+    
+    @validates("requirements")
+    def _reset_requirement_views_on_set(self, key: str, value: List[dict]) -> List[dict]:
+        """Invalida las vistas memoizadas al reasignar requirements."""
+        self._invalidate_requirement_views()
+        return value
+    
+    def _invalidate_requirement_views(self) -> None:
+        """Descarta el índice por tipo cacheado en la instancia."""
+        self.__dict__.pop("requirements_by_type", None)
     
     def add_requirement(self, requirement: dict) -> None:
         """
@@ -74,6 +100,7 @@ class PRD(Base):
         if not isinstance(self.requirements, list):
             self.requirements = []
         self.requirements.append(requirement)
+        self._invalidate_requirement_views()
     
     def calculate_complexity(self) -> str:
         """
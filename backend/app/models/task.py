@@ -4,28 +4,30 @@
 Represents an assigned task generated from a requirement in the PRD.
 """
 from datetime import datetime
-from enum import Enum as PyEnum
+from enum import IntEnum
+from typing import Optional
 
-from sqlalchemy import Column, String, DateTime, Text, ForeignKey, Enum
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, DateTime, Float, Text, ForeignKey, Index
+from sqlalchemy.orm import relationship, validates
 
 from ..database.base import Base
+from ..database.types import IntEnumType
 
 
-class TaskPriority(PyEnum):
-    """Prioridades de tareas."""
-    CRITICAL = "critical"
-    HIGH = "high"
-    MEDIUM = "medium"
-    LOW = "low"
+class TaskPriority(IntEnum):
+    """Prioridades de tareas (orden numérico = orden de urgencia)."""
+    CRITICAL = 0
+    HIGH = 1
+    MEDIUM = 2
+    LOW = 3
 
 
-class TaskStatus(PyEnum):
+class TaskStatus(IntEnum):
     """Estados de tareas."""
-    PENDING = "pending"
-    IN_PROGRESS = "in_progress"
-    COMPLETED = "completed"
-    BLOCKED = "blocked"
+    PENDING = 0
+    IN_PROGRESS = 1
+    COMPLETED = 2
+    BLOCKED = 3
 
 
 class Task(Base):
@@ -35,6 +37,12 @@ class Task(Base):
     Represents a task assigned to a developer role.
     """
     __tablename__ = "tasks"
+    __table_args__ = (
+        # get_by_prd_id / tareas de un PRD por prioridad
+        Index("ix_tasks_prd_priority", "prd_id", "priority"),
+        # Tablero por rol: WHERE assigned_role = ? AND status = ?
+        Index("ix_tasks_role_status", "assigned_role", "status"),
+    )
     
     # Primary Key
     id = Column(String(50), primary_key=True, index=True)
@@ -44,28 +52,28 @@ class Task(Base):
     description = Column(Text, nullable=True)
     
     # Assignment
-    assigned_role = Column(String(100), nullable=False, index=True)
+    assigned_role = Column(String(100), nullable=False)  # Cubierto por ix_tasks_role_status
     
     # Priority and Status
     priority = Column(
-        Enum(TaskPriority),
+        IntEnumType(TaskPriority),
         default=TaskPriority.MEDIUM,
         nullable=False,
         index=True
     )
     status = Column(
-        Enum(TaskStatus),
+        IntEnumType(TaskStatus),
         default=TaskStatus.PENDING,
         nullable=False,
         index=True
     )
     
     # Metadata
-    confidence_score = Column(String(10), nullable=True)
+    confidence_score = Column(Float, nullable=True)  # e.g., 0.90
     requirement_id = Column(String(50), nullable=True)  # ID del requisito origen
     
     # Foreign Keys
-    prd_id = Column(String(50), ForeignKey("prds.id"), nullable=False, index=True)
+    prd_id = Column(String(50), ForeignKey("prds.id", ondelete="CASCADE"), nullable=False)  # Cubierto por ix_tasks_prd_priority
     
     # External Integration (RF5.0 - PMS Integration)
     external_task_id = Column(String(100), nullable=True)  # ID en Jira/Trello/Linear
@@ -78,12 +86,17 @@ class Task(Base):
     # Relationships
     prd = relationship("PRD", back_populates="tasks")
     
+    @validates("title", "assigned_role")
+    def _normalize_text(self, key: str, value: Optional[str]) -> Optional[str]:
+        """Normaliza title y assigned_role una sola vez al asignar (strip)."""
+        return value.strip() if isinstance(value, str) else value
+    
     def __repr__(self) -> str:
         return f"<Task(id={self.id}, title={self.title}, assigned_role={self.assigned_role})>"
     
     def is_high_priority(self) -> bool:
         """✅ Domain Logic - Verifica si la tarea es de alta prioridad."""
-        return self.priority in [TaskPriority.CRITICAL, TaskPriority.HIGH]
+        return self.priority <= TaskPriority.HIGH
     
     def mark_as_in_progress(self) -> None:
         """✅ Domain Logic - Marca tarea como en progreso."""
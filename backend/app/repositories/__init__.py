@@ -5,6 +5,6 @@ Data persistence layer implementing Repository Pattern.
 """
 from .meeting_repository import MeetingRepository
 from .prd_repository import PRDRepository
-from .task_repository import TaskRepository
+from .task_repository import TaskRepository, TaskSummary
 
-__all__ = ["MeetingRepository", "PRDRepository", "TaskRepository"]
+__all__ = ["MeetingRepository", "PRDRepository", "TaskRepository", "TaskSummary"]
@@ -0,0 +1,38 @@
+"""
+Eager-loading helpers shared by the repositories.
+
+Cada repositorio declara un mapa ``{ruta: opción de carga}`` y los callers
+eligen por endpoint qué relaciones precargar (``load=("prd", "prd.tasks")``),
+evitando el patrón N+1 de las relaciones lazy.
+"""
+from typing import Iterable, List, Mapping
+
+from sqlalchemy.orm.interfaces import LoaderOption
+
+
+def build_loader_options(
+    available: Mapping[str, LoaderOption],
+    load: Iterable[str]
+) -> List[LoaderOption]:
+    """
+    ✅ Traduce las rutas solicitadas a opciones de carga de SQLAlchemy.
+
+    Args:
+        available: Rutas soportadas por el repositorio y su loader option
+        load: Rutas de relación a precargar (e.g. "prd.tasks")
+
+    Returns:
+        List of loader options to pass to ``select(...).options(...)``
+
+    Raises:
+        ValueError: Si se solicita una ruta no soportada
+    """
+    options = []
+    for path in load:
+        if path not in available:
+            raise ValueError(
+                f"Unsupported eager load path '{path}'. "
+                f"Expected one of: {', '.join(sorted(available))}"
+            )
+        options.append(available[path])
+    return options
@@ -4,14 +4,41 @@
 Implementación mínima que satisface los tests TDD RED.
 Garantiza principios ACID mediante DatabaseSessionManager.
 """
-from typing import List, Optional
+from typing import Iterator, List, Optional, Sequence
 from datetime import datetime
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, delete, func, select, update
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import selectinload
 
-from ..models import Meeting, MeetingStatus
-from ..database import DatabaseSessionManager
+from ..models import Meeting, MeetingStatus, PRD
+from ..database import DatabaseSessionManager, refresh_expired_attributes
+from .loader_options import build_loader_options
+from .prd_repository import prd_cache_keys
+from .read_cache import TTLCache, restore_entity, shared_cache, snapshot_entity
+
+
+# Esquemas aceptados para meeting_url
+_URL_SCHEMES = ("http://", "https://")
+
+# ✅ Relaciones precargables bajo demanda (evita N+1 en meeting.prd.tasks)
+_MEETING_LOADERS = {
+    "prd": selectinload(Meeting.prd),
+    "prd.tasks": selectinload(Meeting.prd).selectinload(PRD.tasks),
+}
+
+# ✅ Sentencias precompiladas: se construyen una vez y se ejecutan con parámetros
+# (las búsquedas por PK usan session.get y el identity map)
+_SELECT_BY_USER = (
+    select(Meeting)
+    .where(Meeting.user_id == bindparam("user_id"))
+    .order_by(Meeting.created_at, Meeting.id)
+)
+_SELECT_PENDING = (
+    select(Meeting)
+    .where(Meeting.status == MeetingStatus.PENDING)
+    .order_by(Meeting.created_at, Meeting.id)
+)
 
 
 class MeetingRepository:
@@ -21,14 +48,21 @@ class MeetingRepository:
     Implementa operaciones de persistencia garantizando ACID compliance.
     """
     
-    def __init__(self, db_manager: DatabaseSessionManager):
+    def __init__(
+        self,
+        db_manager: DatabaseSessionManager,
+        cache: Optional[TTLCache] = None
+    ):
         """
         Initialize repository with database manager.
         
         Args:
             db_manager: ACID-compliant database session manager
+            cache: Caché de lecturas por id (por defecto, la compartida con
+                los demás repositorios del db_manager)
         """
         self.db_manager = db_manager
+        self._cache = cache if cache is not None else shared_cache(db_manager)
     
     def save(self, meeting: Meeting) -> Meeting:
         """
@@ -54,63 +88,199 @@ class MeetingRepository:
             try:
                 session.add(meeting)
                 session.flush()  # Forzar escritura para detectar errores
-                session.refresh(meeting)  # Refrescar para evitar DetachedInstanceError
-                return meeting
+                # Sin SELECT extra salvo valores calculados por la BD (evita DetachedInstanceError)
+                refresh_expired_attributes(session, meeting)
             except IntegrityError as e:
                 # ✅ ATOMICITY - Rollback automático por el context manager
                 raise e
+        
+        self._invalidate(meeting.id)
+        return meeting
     
-    def get_by_id(self, meeting_id: str) -> Optional[Meeting]:
+    def save_many(self, meetings: List[Meeting]) -> List[Meeting]:
+        """
+        ✅ Guarda un lote de reuniones en una única transacción.
+        
+        Un solo flush para todo el lote, sin refresh por fila.
+        
+        Args:
+            meetings: Meeting entities to save
+            
+        Returns:
+            List[Meeting]: Saved entities
+            
+        Raises:
+            ValueError: Si algún elemento del lote no es válido
+            IntegrityError: Si viola constraints de BD
+        """
+        # ✅ CONSISTENCY - Validar todo el lote antes de abrir la transacción
+        for meeting in meetings:
+            self._validate_meeting(meeting)
+        
+        with self.db_manager.transaction() as session:
+            session.add_all(meetings)
+            session.flush()  # Un único flush para todo el lote
+        
+        for meeting in meetings:
+            self._invalidate(meeting.id)
+        return list(meetings)
+    
+    def get_by_id(
+        self,
+        meeting_id: str,
+        load: Sequence[str] = ()
+    ) -> Optional[Meeting]:
         """
         ✅ GREEN - Obtiene una reunión por ID.
         
+        Sin ``load`` la lectura pasa por la caché LRU + TTL del repositorio.
+        
         Args:
             meeting_id: Unique identifier
+            load: Relaciones a precargar ("prd", "prd.tasks")
             
         Returns:
             Meeting or None if not found
         """
-        with self.db_manager.transaction() as session:
-            statement = select(Meeting).where(Meeting.id == meeting_id)
-            result = session.execute(statement).scalar_one_or_none()
-            
-            # No hacer expunge - mantener objeto attached
-            # SQLAlchemy maneja el ciclo de vida del objeto
-            return result
+        if not load:
+            cached = self._cache.get((Meeting, meeting_id))
+            if cached is not None:
+                return restore_entity(cached)
+        
+        with self.db_manager.read_session() as session:
+            # ✅ session.get: identity map primero, SELECT por PK si no está
+            result = session.get(
+                Meeting,
+                meeting_id,
+                options=build_loader_options(_MEETING_LOADERS, load)
+            )
+        
+        if result is not None and not load:
+            self._cache.set((Meeting, meeting_id), snapshot_entity(result))
+        return result
     
-    def get_by_user_id(self, user_id: str) -> List[Meeting]:
+    def get_by_user_id(
+        self,
+        user_id: str,
+        load: Sequence[str] = (),
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> List[Meeting]:
         """
-        ✅ GREEN - Obtiene todas las reuniones de un usuario.
+        ✅ GREEN - Obtiene las reuniones de un usuario (paginable).
         
         Args:
             user_id: User identifier
+            load: Relaciones a precargar ("prd", "prd.tasks")
+            limit: Máximo de reuniones a devolver (None = todas)
+            offset: Reuniones a saltar
             
         Returns:
-            List of meetings for the user
+            List of meetings for the user, oldest first
         """
-        with self.db_manager.transaction() as session:
-            statement = select(Meeting).where(Meeting.user_id == user_id)
-            results = session.execute(statement).scalars().all()
+        with self.db_manager.read_session() as session:
+            statement = (
+                self._by_user_statement(load)
+                .limit(limit)
+                .offset(offset)
+            )
+            results = session.execute(statement, {"user_id": user_id}).scalars().all()
             
             # Retornar lista sin expunge
             return list(results)
     
-    def get_pending_meetings(self) -> List[Meeting]:
+    def iter_by_user_id(
+        self,
+        user_id: str,
+        load: Sequence[str] = (),
+        batch: int = 200
+    ) -> Iterator[Meeting]:
         """
-        ✅ GREEN - Obtiene todas las reuniones pendientes.
+        ✅ Recorre las reuniones de un usuario en streaming (yield_per).
         
-        Returns:
-            List of meetings with PENDING status
+        La memoria queda acotada a ``batch`` filas; la sesión permanece
+        abierta mientras se consume el iterador.
+        
+        Args:
+            user_id: User identifier
+            load: Relaciones a precargar ("prd", "prd.tasks")
+            batch: Filas por lote
+            
+        Yields:
+            Meeting instances, oldest first
         """
-        with self.db_manager.transaction() as session:
-            statement = select(Meeting).where(
-                Meeting.status == MeetingStatus.PENDING
+        with self.db_manager.stream_session() as session:
+            statement = self._by_user_statement(load).execution_options(
+                yield_per=batch
             )
+            yield from session.execute(statement, {"user_id": user_id}).scalars()
+    
+    def get_pending_meetings(
+        self,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> List[Meeting]:
+        """
+        ✅ GREEN - Obtiene las reuniones pendientes (paginable).
+        
+        Args:
+            limit: Máximo de reuniones a devolver (None = todas)
+            offset: Reuniones a saltar
+            
+        Returns:
+            List of meetings with PENDING status, oldest first
+        """
+        with self.db_manager.read_session() as session:
+            statement = _SELECT_PENDING.limit(limit).offset(offset)
             results = session.execute(statement).scalars().all()
             
             # Retornar lista sin expunge
             return list(results)
     
+    def claim_processable_meetings(self, limit: int = 10) -> List[Meeting]:
+        """
+        ✅ Reclama el siguiente lote de reuniones procesables para un worker.
+        
+        Un único UPDATE ... RETURNING pasa las filas a PROCESSING; la subconsulta
+        usa el índice parcial ix_meetings_processable y FOR UPDATE SKIP LOCKED,
+        así que pollers concurrentes reciben lotes disjuntos.
+        
+        Args:
+            limit: Máximo de reuniones a reclamar
+            
+        Returns:
+            List of claimed meetings (ya en PROCESSING), oldest first
+        """
+        claimable = (
+            select(Meeting.id)
+            .where(
+                Meeting.status == MeetingStatus.PENDING,
+                Meeting.retry_count < 3
+            )
+            .order_by(Meeting.created_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        with self.db_manager.transaction() as session:
+            statement = (
+                update(Meeting)
+                .where(Meeting.id.in_(claimable))
+                .values(
+                    status=MeetingStatus.PROCESSING,
+                    processing_started_at=func.now()
+                )
+                .returning(Meeting)
+                .execution_options(synchronize_session=False)
+            )
+            claimed = list(session.execute(statement).scalars().all())
+        
+        for meeting in claimed:
+            self._invalidate(meeting.id)
+        # RETURNING no garantiza orden
+        claimed.sort(key=lambda meeting: (meeting.created_at, meeting.id))
+        return claimed
+    
     def update_status(
         self, 
         meeting_id: str, 
@@ -129,25 +299,28 @@ class MeetingRepository:
         Raises:
             ValueError: Si la reunión no existe
         """
+        values = {"status": new_status}
+        # Timestamps de transición resueltos en la BD (NOW()), como en el dominio
+        if new_status == MeetingStatus.PROCESSING:
+            values["processing_started_at"] = func.now()
+        elif new_status == MeetingStatus.COMPLETED:
+            values["processing_completed_at"] = func.now()
+        
         with self.db_manager.transaction() as session:
-            statement = select(Meeting).where(Meeting.id == meeting_id)
+            # ✅ Un único UPDATE ... RETURNING (sin SELECT previo ni refresh)
+            statement = (
+                update(Meeting)
+                .where(Meeting.id == meeting_id)
+                .values(**values)
+                .returning(Meeting)
+            )
             meeting = session.execute(statement).scalar_one_or_none()
             
             if not meeting:
                 raise ValueError(f"Meeting {meeting_id} not found")
-            
-            # Update status using domain logic
-            meeting.status = new_status
-            
-            if new_status == MeetingStatus.PROCESSING:
-                meeting.mark_as_processing()
-            elif new_status == MeetingStatus.COMPLETED:
-                meeting.mark_as_completed()
-            
-            session.flush()
-            session.refresh(meeting)  # Refrescar objeto
-            
-            return meeting
+        
+        self._invalidate(meeting_id)
+        return meeting
     
     def delete(self, meeting_id: str) -> bool:
         """
@@ -160,16 +333,31 @@ class MeetingRepository:
             True if deleted, False if not found
         """
         with self.db_manager.transaction() as session:
-            statement = select(Meeting).where(Meeting.id == meeting_id)
-            meeting = session.execute(statement).scalar_one_or_none()
-            
-            if not meeting:
-                return False
-            
-            session.delete(meeting)
-            session.flush()
-            
-            return True
+            # ✅ PRD que arrastrará la cascada: sus entradas de caché también caducan
+            prd_id = session.scalar(select(PRD.id).where(PRD.meeting_id == meeting_id))
+            # ✅ DELETE directo: PRD y tareas se borran por ON DELETE CASCADE en la BD
+            result = session.execute(
+                delete(Meeting)
+                .where(Meeting.id == meeting_id)
+                .execution_options(synchronize_session=False)
+            )
+        
+        if result.rowcount == 0:
+            return False
+        
+        self._invalidate(meeting_id)
+        if prd_id is not None:
+            for key in prd_cache_keys(prd_id, meeting_id):
+                self._cache.invalidate(key)
+        return True
+    
+    def _invalidate(self, meeting_id: str) -> None:
+        """Descarta la entrada cacheada de una reunión tras una escritura confirmada."""
+        self._cache.invalidate((Meeting, meeting_id))
+    
+    def _by_user_statement(self, load: Sequence[str]):
+        """SELECT ordenado de reuniones de un usuario (parámetro :user_id)."""
+        return _SELECT_BY_USER.options(*build_loader_options(_MEETING_LOADERS, load))
     
     def _validate_meeting(self, meeting: Meeting) -> None:
         """
@@ -181,12 +369,13 @@ class MeetingRepository:
         Raises:
             ValueError: Si alguna validación falla
         """
-        if not meeting.meeting_url or meeting.meeting_url.strip() == "":
+        # Los campos ya llegan normalizados (strip) por los validates del modelo
+        if not meeting.meeting_url:
             raise ValueError("meeting_url is required")
         
-        if not meeting.user_id or meeting.user_id.strip() == "":
+        if not meeting.user_id:
             raise ValueError("user_id is required")
         
         # Validar formato de URL básico
-        if not meeting.meeting_url.startswith("http"):
+        if not meeting.meeting_url.startswith(_URL_SCHEMES):
             raise ValueError("meeting_url must be a valid URL")
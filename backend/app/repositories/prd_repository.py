@@ -4,14 +4,36 @@
 Implementación mínima que satisface los tests TDD RED.
 Garantiza persistencia ACID de PRDs con requisitos JSON.
 """
-from typing import Optional, List
+from typing import Optional, List, Sequence
 from datetime import datetime
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, cast, delete, exists, select, update
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import joinedload, selectinload, undefer
 
 from ..models import PRD
-from ..database import DatabaseSessionManager
+from ..database import DatabaseSessionManager, refresh_expired_attributes
+from .loader_options import build_loader_options
+from .read_cache import TTLCache, restore_entity, shared_cache, snapshot_entity
+
+
+# ✅ Relaciones precargables bajo demanda (evita N+1 en prd.tasks)
+_PRD_LOADERS = {
+    "tasks": selectinload(PRD.tasks),
+    "meeting": joinedload(PRD.meeting),
+}
+
+# ✅ requirements es diferido en el modelo: se pide explícitamente cuando hace falta
+_WITH_REQUIREMENTS = undefer(PRD.requirements)
+
+# ✅ Sentencias precompiladas: se construyen una vez y se ejecutan con parámetros
+_SELECT_BY_MEETING_ID = select(PRD).where(PRD.meeting_id == bindparam("meeting_id"))
+
+
+def prd_cache_keys(prd_id: str, meeting_id: str) -> tuple:
+    """Claves de caché de un PRD (por id y por reunión), también para MeetingRepository."""
+    return (PRD, prd_id), (PRD, "meeting", meeting_id)
 
 
 class PRDRepository:
@@ -21,14 +43,21 @@ class PRDRepository:
     Implementa persistencia de PRDs con requisitos JSON y relaciones con Meeting.
     """
     
-    def __init__(self, db_manager: DatabaseSessionManager):
+    def __init__(
+        self,
+        db_manager: DatabaseSessionManager,
+        cache: Optional[TTLCache] = None
+    ):
         """
         Initialize repository with database manager.
         
         Args:
             db_manager: ACID-compliant database session manager
+            cache: Caché de lecturas por id/meeting_id (por defecto, la
+                compartida con los demás repositorios del db_manager)
         """
         self.db_manager = db_manager
+        self._cache = cache if cache is not None else shared_cache(db_manager)
     
     def save(self, prd: PRD) -> PRD:
         """
@@ -54,39 +83,159 @@ class PRDRepository:
             try:
                 session.add(prd)
                 session.flush()
-                session.refresh(prd)
-                return prd
+                # Sin SELECT extra salvo valores calculados por la BD (evita DetachedInstanceError)
+                refresh_expired_attributes(session, prd)
             except IntegrityError as e:
                 # ✅ ATOMICITY - Rollback automático
                 raise e
+        
+        self._invalidate(prd.id, prd.meeting_id)
+        return prd
     
-    def get_by_id(self, prd_id: str) -> Optional[PRD]:
+    def save_many(self, prds: List[PRD]) -> List[PRD]:
+        """
+        ✅ Guarda un lote de PRDs en una única transacción.
+        
+        Un solo flush para todo el lote, sin refresh por fila.
+        
+        Args:
+            prds: PRD entities to save
+            
+        Returns:
+            List[PRD]: Saved entities
+            
+        Raises:
+            ValueError: Si algún elemento del lote no es válido
+            IntegrityError: Si viola constraints de BD
+        """
+        # ✅ CONSISTENCY - Validar todo el lote antes de abrir la transacción
+        for prd in prds:
+            self._validate_prd(prd)
+        
+        with self.db_manager.transaction() as session:
+            session.add_all(prds)
+            session.flush()  # Un único flush para todo el lote
+        
+        for prd in prds:
+            self._invalidate(prd.id, prd.meeting_id)
+        return list(prds)
+    
+    def get_by_id(
+        self,
+        prd_id: str,
+        load: Sequence[str] = (),
+        with_requirements: bool = True
+    ) -> Optional[PRD]:
         """
         ✅ GREEN - Obtiene un PRD por ID.
         
+        Sin ``load`` (y con requirements) la lectura pasa por la caché LRU + TTL.
+        
         Args:
             prd_id: Unique identifier
+            load: Relaciones a precargar ("tasks", "meeting")
+            with_requirements: False para omitir el JSON de requirements
             
         Returns:
             PRD or None if not found
         """
-        with self.db_manager.transaction() as session:
-            statement = select(PRD).where(PRD.id == prd_id)
-            return session.execute(statement).scalar_one_or_none()
+        cacheable = not load and with_requirements
+        if cacheable:
+            cached = self._cache.get((PRD, prd_id))
+            if cached is not None:
+                return restore_entity(cached)
+        
+        with self.db_manager.read_session() as session:
+            # ✅ session.get: identity map primero, SELECT por PK si no está
+            prd = session.get(
+                PRD, prd_id, options=self._read_options(load, with_requirements)
+            )
+        
+        if prd is not None and cacheable:
+            self._cache.set((PRD, prd_id), snapshot_entity(prd))
+        return prd
     
-    def get_by_meeting_id(self, meeting_id: str) -> Optional[PRD]:
+    def get_by_meeting_id(
+        self,
+        meeting_id: str,
+        load: Sequence[str] = (),
+        with_requirements: bool = True
+    ) -> Optional[PRD]:
         """
         ✅ GREEN - Obtiene PRD asociado a una reunión.
         
+        Sin ``load`` (y con requirements) la lectura pasa por la caché LRU + TTL.
+        
         Args:
             meeting_id: Meeting identifier
+            load: Relaciones a precargar ("tasks", "meeting")
+            with_requirements: False para omitir el JSON de requirements
             
         Returns:
             PRD or None if not found
         """
-        with self.db_manager.transaction() as session:
-            statement = select(PRD).where(PRD.meeting_id == meeting_id)
-            return session.execute(statement).scalar_one_or_none()
+        cacheable = not load and with_requirements
+        if cacheable:
+            cached = self._cache.get((PRD, "meeting", meeting_id))
+            if cached is not None:
+                return restore_entity(cached)
+        
+        with self.db_manager.read_session() as session:
+            statement = _SELECT_BY_MEETING_ID.options(
+                *self._read_options(load, with_requirements)
+            )
+            prd = session.execute(
+                statement, {"meeting_id": meeting_id}
+            ).scalar_one_or_none()
+        
+        if prd is not None and cacheable:
+            self._cache.set((PRD, "meeting", meeting_id), snapshot_entity(prd))
+        return prd
+    
+    def get_by_requirement_type(self, requirement_type: str) -> List[PRD]:
+        """
+        ✅ Obtiene los PRDs que contienen al menos un requisito del tipo dado.
+        
+        En PostgreSQL filtra con containment JSONB (@>), respaldado por el
+        índice GIN ix_prds_requirements; en otros dialectos filtra en Python.
+        
+        Args:
+            requirement_type: Tipo de requisito (e.g. "functional")
+            
+        Returns:
+            List of PRDs with at least one requirement of that type
+        """
+        with self.db_manager.read_session() as session:
+            if session.get_bind().dialect.name == "postgresql":
+                statement = select(PRD).options(_WITH_REQUIREMENTS).where(
+                    cast(PRD.requirements, JSONB).contains(
+                        [{"type": requirement_type}]
+                    )
+                )
+                return list(session.execute(statement).scalars().all())
+            
+            prds = session.execute(
+                select(PRD).options(_WITH_REQUIREMENTS)
+            ).scalars().all()
+            return [
+                prd for prd in prds
+                if any(req.get("type") == requirement_type for req in prd.requirements)
+            ]
+    
+    def has_prd_for_meeting(self, meeting_id: str) -> bool:
+        """
+        ✅ Comprueba si una reunión ya tiene PRD sin transferir la fila.
+        
+        Args:
+            meeting_id: Meeting identifier
+            
+        Returns:
+            True if a PRD exists for the meeting
+        """
+        with self.db_manager.read_session() as session:
+            return session.scalar(
+                select(exists().where(PRD.meeting_id == meeting_id))
+            )
     
     def update_requirements(
         self, 
@@ -107,20 +256,24 @@ class PRDRepository:
             ValueError: Si el PRD no existe
         """
         with self.db_manager.transaction() as session:
-            statement = select(PRD).where(PRD.id == prd_id)
+            # ✅ Un único UPDATE ... RETURNING (sin SELECT previo ni refresh)
+            statement = (
+                update(PRD)
+                .where(PRD.id == prd_id)
+                .values(
+                    requirements=new_requirements,
+                    updated_at=datetime.utcnow()
+                )
+                .returning(PRD)
+                .options(_WITH_REQUIREMENTS)
+            )
             prd = session.execute(statement).scalar_one_or_none()
             
             if not prd:
                 raise ValueError(f"PRD {prd_id} not found")
-            
-            # Actualizar requisitos
-            prd.requirements = new_requirements
-            prd.updated_at = datetime.utcnow()
-            
-            session.flush()
-            session.refresh(prd)
-            
-            return prd
+        
+        self._invalidate(prd.id, prd.meeting_id)
+        return prd
     
     def delete(self, prd_id: str) -> bool:
         """
@@ -133,16 +286,30 @@ class PRDRepository:
             True if deleted, False if not found
         """
         with self.db_manager.transaction() as session:
-            statement = select(PRD).where(PRD.id == prd_id)
-            prd = session.execute(statement).scalar_one_or_none()
-            
-            if not prd:
-                return False
-            
-            session.delete(prd)
-            session.flush()
-            
-            return True
+            # ✅ DELETE directo: sin cargar el JSON de requirements ni hidratar el PRD
+            # (las tareas se borran por ON DELETE CASCADE en la BD)
+            meeting_id = session.execute(
+                delete(PRD).where(PRD.id == prd_id).returning(PRD.meeting_id)
+            ).scalar_one_or_none()
+        
+        if meeting_id is None:
+            return False
+        
+        self._invalidate(prd_id, meeting_id)
+        return True
+    
+    @staticmethod
+    def _read_options(load: Sequence[str], with_requirements: bool) -> list:
+        """Loader options de lectura: relaciones pedidas y, opcionalmente, requirements."""
+        options = build_loader_options(_PRD_LOADERS, load)
+        if with_requirements:
+            options.append(_WITH_REQUIREMENTS)
+        return options
+    
+    def _invalidate(self, prd_id: str, meeting_id: str) -> None:
+        """Descarta las entradas cacheadas de un PRD tras una escritura confirmada."""
+        for key in prd_cache_keys(prd_id, meeting_id):
+            self._cache.invalidate(key)
     
     def _validate_prd(self, prd: PRD) -> None:
         """
@@ -154,10 +321,11 @@ class PRDRepository:
         Raises:
             ValueError: Si alguna validación falla
         """
-        if not prd.title or prd.title.strip() == "":
+        # title ya llega normalizado (strip) por el validates del modelo
+        if not prd.title:
             raise ValueError("title is required")
         
-        if not prd.requirements or len(prd.requirements) == 0:
+        if not prd.requirements:
             raise ValueError("PRD must have at least one requirement")
         
         if not prd.meeting_id:
@@ -0,0 +1,123 @@
+"""
+In-process read-through cache for repository lookups.
+
+LRU acotado con expiración por TTL. Pensado para entidades que casi no
+cambian una vez escritas (PRDs, reuniones completadas); los repositorios
+invalidan las claves en cada escritura y el TTL acota la obsolescencia
+entre procesos.
+
+Las entidades se guardan como instantáneas de sus columnas cargadas y cada
+lectura reconstruye una instancia detached nueva: ningún llamador comparte
+(ni puede mutar) el objeto cacheado. Los repositorios de una misma base de
+datos comparten la caché (``shared_cache``) para poder invalidar en cascada.
+"""
+import copy
+import threading
+import weakref
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Callable, Hashable, Optional, Tuple, Type, TypeVar
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+
+_Entity = TypeVar("_Entity")
+
+
+class TTLCache:
+    """
+    ✅ LRU + TTL thread-safe.
+
+    Los valores expirados se descartan al leerlos; al superar ``maxsize`` se
+    desaloja la entrada menos usada recientemente.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 10_000,
+        ttl: float = 60.0,
+        timer: Callable[[], float] = monotonic
+    ):
+        """
+        Args:
+            maxsize: Máximo de entradas retenidas
+            ttl: Segundos de vida de cada entrada
+            timer: Reloj monotónico (inyectable para tests)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._timer = timer
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Devuelve el valor cacheado o None si no existe o expiró."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= self._timer():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Guarda un valor, desalojando la entrada LRU si se supera maxsize."""
+        with self._lock:
+            self._data[key] = (self._timer() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Elimina una clave si está presente."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Vacía la caché."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+# ✅ Una caché por gestor de sesiones: las claves de Meeting y PRD conviven
+_SHARED_CACHES: "weakref.WeakKeyDictionary[Any, TTLCache]" = weakref.WeakKeyDictionary()
+_SHARED_LOCK = threading.Lock()
+
+
+def shared_cache(owner: Any) -> TTLCache:
+    """Devuelve la caché compartida por los repositorios de ``owner`` (db_manager)."""
+    with _SHARED_LOCK:
+        cache = _SHARED_CACHES.get(owner)
+        if cache is None:
+            cache = _SHARED_CACHES[owner] = TTLCache()
+        return cache
+
+
+def snapshot_entity(entity: Any) -> Tuple[Type, dict]:
+    """Copia inmutable de las columnas cargadas de una entidad ORM."""
+    state = inspect(entity)
+    values = {
+        attr.key: copy.deepcopy(state.dict[attr.key])
+        for attr in state.mapper.column_attrs
+        if attr.key in state.dict
+    }
+    return type(entity), values
+
+
+def restore_entity(snapshot: Tuple[Type[_Entity], dict]) -> _Entity:
+    """Reconstruye una instancia detached propia a partir de una instantánea."""
+    model, values = snapshot
+    entity = model.__mapper__.class_manager.new_instance()
+    for key, value in values.items():
+        set_committed_value(entity, key, copy.deepcopy(value))
+    # ✅ Lo no cargado (relaciones, columnas diferidas) queda expirado como en
+    # cualquier instancia detached
+    make_transient_to_detached(entity)
+    return entity
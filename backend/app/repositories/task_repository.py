@@ -4,14 +4,56 @@
 Implementación mínima que satisface los tests TDD RED.
 Garantiza persistencia ACID de tareas con relaciones a PRD.
 """
-from typing import Optional, List
+from typing import Dict, Iterator, NamedTuple, Optional, List
 from datetime import datetime
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, delete, select, update
 from sqlalchemy.exc import IntegrityError
 
 from ..models import Task, TaskPriority, TaskStatus
-from ..database import DatabaseSessionManager
+from ..database import DatabaseSessionManager, refresh_expired_attributes
+
+
+# ✅ A partir de este tamaño save_many usa bulk_insert_mappings
+BULK_INSERT_THRESHOLD = 200
+
+# ✅ Sentencias precompiladas: se construyen una vez y se ejecutan con parámetros
+_SELECT_BY_PRD = (
+    select(Task)
+    .where(Task.prd_id == bindparam("prd_id"))
+    .order_by(Task.created_at, Task.id)
+)
+_SELECT_BY_ROLE = (
+    select(Task)
+    .where(Task.assigned_role == bindparam("role"))
+    .order_by(Task.created_at, Task.id)
+)
+_UPDATE_MANY_STATUS = (
+    update(Task)
+    .where(Task.id.in_(bindparam("ids", expanding=True)))
+    .values(status=bindparam("new_status"), updated_at=bindparam("updated_at"))
+)
+_SELECT_HIGH_PRIORITY = (
+    select(Task)
+    .where(Task.priority <= TaskPriority.HIGH)  # CRITICAL(0) y HIGH(1): rango en B-tree
+    .order_by(Task.created_at, Task.id)
+)
+# Solo las columnas del dashboard: sin description (TEXT) ni hidratación ORM
+_SELECT_HIGH_PRIORITY_SUMMARY = (
+    select(Task.id, Task.title, Task.assigned_role, Task.priority, Task.status)
+    .where(Task.priority <= TaskPriority.HIGH)
+    .order_by(Task.created_at, Task.id)
+)
+
+
+class TaskSummary(NamedTuple):
+    """✅ Vista ligera de una tarea para listados (dashboard de prioridades)."""
+    
+    id: str
+    title: str
+    assigned_role: str
+    priority: TaskPriority
+    status: TaskStatus
 
 
 class TaskRepository:
@@ -54,12 +96,52 @@ class TaskRepository:
             try:
                 session.add(task)
                 session.flush()
-                session.refresh(task)
+                # Sin SELECT extra salvo valores calculados por la BD (evita DetachedInstanceError)
+                refresh_expired_attributes(session, task)
                 return task
             except IntegrityError as e:
                 # ✅ ATOMICITY - Rollback automático
                 raise e
     
+    def save_many(self, tasks: List[Task]) -> List[Task]:
+        """
+        ✅ Guarda un lote de tareas (e.g. las generadas por un PRD) en una única transacción.
+        
+        Un solo flush para todo el lote, sin refresh por fila. Los lotes de
+        BULK_INSERT_THRESHOLD o más tareas se insertan con bulk_insert_mappings
+        (las instancias devueltas no quedan vinculadas a la sesión).
+        
+        Args:
+            tasks: Task entities to save
+            
+        Returns:
+            List[Task]: Saved entities
+            
+        Raises:
+            ValueError: Si algún elemento del lote no es válido
+            IntegrityError: Si viola constraints de BD
+        """
+        # ✅ CONSISTENCY - Validar todo el lote antes de abrir la transacción
+        for task in tasks:
+            self._validate_task(task)
+        
+        with self.db_manager.transaction() as session:
+            if len(tasks) >= BULK_INSERT_THRESHOLD:
+                # Lotes grandes: INSERT executemany sin unit-of-work por objeto
+                columns = [column.key for column in Task.__table__.columns]
+                session.bulk_insert_mappings(Task, [
+                    {
+                        key: getattr(task, key)
+                        for key in columns
+                        if getattr(task, key) is not None
+                    }
+                    for task in tasks
+                ])
+            else:
+                session.add_all(tasks)
+                session.flush()  # Un único flush para todo el lote
+            return list(tasks)
+    
     def get_by_id(self, task_id: str) -> Optional[Task]:
         """
         ✅ GREEN - Obtiene una tarea por ID.
@@ -70,51 +152,108 @@ class TaskRepository:
         Returns:
             Task or None if not found
         """
-        with self.db_manager.transaction() as session:
-            statement = select(Task).where(Task.id == task_id)
-            return session.execute(statement).scalar_one_or_none()
+        with self.db_manager.read_session() as session:
+            # ✅ session.get: identity map primero, SELECT por PK si no está
+            return session.get(Task, task_id)
     
-    def get_by_prd_id(self, prd_id: str) -> List[Task]:
+    def get_by_prd_id(
+        self,
+        prd_id: str,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> List[Task]:
         """
-        ✅ GREEN - Obtiene todas las tareas de un PRD.
+        ✅ GREEN - Obtiene las tareas de un PRD (paginable).
         
         Args:
             prd_id: PRD identifier
+            limit: Máximo de tareas a devolver (None = todas)
+            offset: Tareas a saltar
             
         Returns:
             List of tasks for the PRD
         """
-        with self.db_manager.transaction() as session:
-            statement = select(Task).where(Task.prd_id == prd_id)
-            return list(session.execute(statement).scalars().all())
+        with self.db_manager.read_session() as session:
+            statement = _SELECT_BY_PRD.limit(limit).offset(offset)
+            return list(session.execute(statement, {"prd_id": prd_id}).scalars().all())
+    
+    def iter_by_prd_id(self, prd_id: str, batch: int = 200) -> Iterator[Task]:
+        """
+        ✅ Recorre las tareas de un PRD en streaming (yield_per).
+        
+        Args:
+            prd_id: PRD identifier
+            batch: Filas por lote
+            
+        Yields:
+            Task instances
+        """
+        with self.db_manager.stream_session() as session:
+            statement = _SELECT_BY_PRD.execution_options(yield_per=batch)
+            yield from session.execute(statement, {"prd_id": prd_id}).scalars()
     
-    def get_by_assigned_role(self, role: str) -> List[Task]:
+    def get_by_assigned_role(
+        self,
+        role: str,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> List[Task]:
         """
-        ✅ GREEN - Obtiene tareas asignadas a un rol específico.
+        ✅ GREEN - Obtiene tareas asignadas a un rol específico (paginable).
         
         Args:
             role: Developer role (e.g., "Backend Developer")
+            limit: Máximo de tareas a devolver (None = todas)
+            offset: Tareas a saltar
             
         Returns:
             List of tasks assigned to the role
         """
-        with self.db_manager.transaction() as session:
-            statement = select(Task).where(Task.assigned_role == role)
-            return list(session.execute(statement).scalars().all())
+        with self.db_manager.read_session() as session:
+            statement = _SELECT_BY_ROLE.limit(limit).offset(offset)
+            return list(session.execute(statement, {"role": role}).scalars().all())
     
-    def get_high_priority_tasks(self) -> List[Task]:
+    def get_high_priority_tasks(
+        self,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> List[Task]:
         """
         ✅ GREEN - Obtiene tareas de alta prioridad (CRITICAL y HIGH).
         
+        Args:
+            limit: Máximo de tareas a devolver (None = todas)
+            offset: Tareas a saltar
+            
         Returns:
             List of high priority tasks
         """
-        with self.db_manager.transaction() as session:
-            statement = select(Task).where(
-                Task.priority.in_([TaskPriority.CRITICAL, TaskPriority.HIGH])
-            )
+        with self.db_manager.read_session() as session:
+            statement = _SELECT_HIGH_PRIORITY.limit(limit).offset(offset)
             return list(session.execute(statement).scalars().all())
     
+    def get_high_priority_tasks_summary(
+        self,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> List[TaskSummary]:
+        """
+        ✅ Resumen de tareas CRITICAL y HIGH (id, título, rol, prioridad, estado).
+        
+        Selecciona solo las columnas necesarias y devuelve tuplas, sin
+        cargar ``description`` ni construir entidades ORM.
+        
+        Args:
+            limit: Máximo de tareas a devolver (None = todas)
+            offset: Tareas a saltar
+            
+        Returns:
+            List of TaskSummary, oldest first
+        """
+        with self.db_manager.read_session() as session:
+            statement = _SELECT_HIGH_PRIORITY_SUMMARY.limit(limit).offset(offset)
+            return [TaskSummary(*row) for row in session.execute(statement)]
+    
     def update_status(self, task_id: str, new_status: TaskStatus) -> Task:
         """
         ✅ GREEN - Actualiza el estado de una tarea.
@@ -130,26 +269,48 @@ class TaskRepository:
             ValueError: Si la tarea no existe
         """
         with self.db_manager.transaction() as session:
-            statement = select(Task).where(Task.id == task_id)
+            # ✅ Un único UPDATE ... RETURNING (sin SELECT previo ni refresh)
+            statement = (
+                update(Task)
+                .where(Task.id == task_id)
+                .values(status=new_status, updated_at=datetime.utcnow())
+                .returning(Task)
+            )
             task = session.execute(statement).scalar_one_or_none()
             
             if not task:
                 raise ValueError(f"Task {task_id} not found")
             
-            # Actualizar estado usando lógica de dominio
-            if new_status == TaskStatus.IN_PROGRESS:
-                task.mark_as_in_progress()
-            elif new_status == TaskStatus.COMPLETED:
-                task.mark_as_completed()
-            else:
-                task.status = new_status
-                task.updated_at = datetime.utcnow()
-            
-            session.flush()
-            session.refresh(task)
-            
             return task
     
+    def update_many_status(self, task_ids: List[str], new_status: TaskStatus) -> int:
+        """
+        ✅ Transición de estado en bloque (e.g. al completar un PRD).
+        
+        Un único UPDATE ... WHERE id IN (...) en lugar de N llamadas a update_status.
+        
+        Args:
+            task_ids: Tasks to update
+            new_status: New status to set
+            
+        Returns:
+            int: Number of tasks updated
+        """
+        if not task_ids:
+            return 0
+        
+        with self.db_manager.transaction() as session:
+            result = session.execute(
+                _UPDATE_MANY_STATUS,
+                {
+                    "ids": list(task_ids),
+                    "new_status": new_status,
+                    "updated_at": datetime.utcnow()
+                },
+                execution_options={"synchronize_session": False}
+            )
+            return result.rowcount
+    
     def link_external_task(
         self, 
         task_id: str, 
@@ -171,20 +332,41 @@ class TaskRepository:
             ValueError: Si la tarea no existe
         """
         with self.db_manager.transaction() as session:
-            statement = select(Task).where(Task.id == task_id)
+            # ✅ Un único UPDATE ... RETURNING (sin SELECT previo ni refresh)
+            statement = (
+                update(Task)
+                .where(Task.id == task_id)
+                .values(
+                    external_task_id=external_id,
+                    external_task_url=external_url,
+                    updated_at=datetime.utcnow()
+                )
+                .returning(Task)
+            )
             task = session.execute(statement).scalar_one_or_none()
             
             if not task:
                 raise ValueError(f"Task {task_id} not found")
             
-            # Usar método de dominio para vincular
-            task.link_external_task(external_id, external_url)
-            
-            session.flush()
-            session.refresh(task)
-            
             return task
     
+    def bulk_link_external_tasks(self, links: List[Dict[str, str]]) -> None:
+        """
+        ✅ Vincula varias tareas externas en un único executemany por PK.
+        
+        Args:
+            links: Dicts con "id", "external_task_id" y "external_task_url"
+        """
+        if not links:
+            return
+        
+        now = datetime.utcnow()
+        with self.db_manager.transaction() as session:
+            session.execute(
+                update(Task),
+                [{**link, "updated_at": now} for link in links]
+            )
+    
     def delete(self, task_id: str) -> bool:
         """
         ✅ GREEN - Elimina una tarea.
@@ -196,16 +378,9 @@ class TaskRepository:
             True if deleted, False if not found
         """
         with self.db_manager.transaction() as session:
-            statement = select(Task).where(Task.id == task_id)
-            task = session.execute(statement).scalar_one_or_none()
-            
-            if not task:
-                return False
-            
-            session.delete(task)
-            session.flush()
-            
-            return True
+            # ✅ Un único DELETE (sin SELECT previo ni hidratación ORM)
+            result = session.execute(delete(Task).where(Task.id == task_id))
+            return result.rowcount > 0
     
     def _validate_task(self, task: Task) -> None:
         """
@@ -217,10 +392,11 @@ class TaskRepository:
         Raises:
             ValueError: Si alguna validación falla
         """
-        if not task.title or task.title.strip() == "":
+        # title y assigned_role ya llegan normalizados (strip) por el modelo
+        if not task.title:
             raise ValueError("title is required")
         
-        if not task.assigned_role or task.assigned_role.strip() == "":
+        if not task.assigned_role:
             raise ValueError("assigned_role is required")
         
         if not task.prd_id:
@@ -4,17 +4,235 @@
 # Componente que dispara workflows en n8n mediante webhooks HTTP
 
 import httpx
+import orjson
 import asyncio
-from typing import Optional, Dict, Any, List
+import hashlib
+import importlib.util
+import random
+import time
+from typing import Optional, Dict, Any, List, Union
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 import logging
 import json
 from enum import Enum
+from uuid import uuid4
 
 from ..domain.exceptions.consumption_exceptions import DatabaseTransactionException
 
 
+# ================================================================================================
+# 🌐 SHARED HTTP CLIENT
+# ================================================================================================
+
+_DEFAULT_HEADERS = {
+    "Content-Type": "application/json",
+    "User-Agent": "M2PRD-Gatekeeper/1.0"
+}
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Tope de cuerpo de respuesta procesado por webhook (memoria acotada por llamada)
+MAX_RESPONSE_BYTES = 64 * 1024
+
+# HTTP/2 requiere el extra httpx[http2] (paquete h2); sin él se usa HTTP/1.1
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+class AiohttpWebhookClient:
+    """
+    ⚡ Cliente aiohttp para el hot path de dispatch de webhooks.
+    
+    Expone la misma superficie que usa WebhookTrigger de httpx.AsyncClient
+    (``post``/``aclose``/``is_closed``) y devuelve ``httpx.Response``, de modo
+    que el procesamiento de respuestas y errores es idéntico con ambos clientes.
+    """
+    
+    def __init__(self, session):
+        self._session = session
+    
+    @classmethod
+    def create(cls, timeout_seconds: float = 30) -> "AiohttpWebhookClient":
+        """🏭 Sesión aiohttp con connector keep-alive acotado por host."""
+        import aiohttp  # Solo necesario cuando se instala este cliente
+        
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, limit_per_host=30, keepalive_timeout=30),
+            timeout=aiohttp.ClientTimeout(total=timeout_seconds),
+            headers=_DEFAULT_HEADERS,
+            json_serialize=lambda obj: orjson.dumps(obj).decode()
+        )
+        return cls(session)
+    
+    @property
+    def is_closed(self) -> bool:
+        return self._session.closed
+    
+    async def post(
+        self,
+        url: Union[str, httpx.URL],
+        json: Optional[Dict[str, Any]] = None,
+        content: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[httpx.Timeout] = None
+    ) -> httpx.Response:
+        """POST con la semántica de errores de httpx (TimeoutException / RequestError)."""
+        import aiohttp
+        
+        request_timeout = None
+        if timeout is not None:
+            request_timeout = aiohttp.ClientTimeout(
+                sock_connect=timeout.connect, sock_read=timeout.read
+            )
+        
+        try:
+            async with self._session.post(
+                str(url), json=json, data=content, headers=headers, timeout=request_timeout
+            ) as resp:
+                body = await self._read_capped(resp)
+                return httpx.Response(
+                    resp.status,
+                    headers=list(resp.headers.items()),
+                    content=body
+                )
+        except asyncio.TimeoutError as e:
+            raise httpx.TimeoutException(str(e) or "Request timeout") from e
+        except aiohttp.ClientConnectionError as e:
+            raise httpx.ConnectError(str(e)) from e
+        except aiohttp.ClientError as e:
+            raise httpx.RequestError(str(e)) from e
+    
+    @staticmethod
+    async def _read_capped(resp) -> bytes:
+        """Leer el cuerpo en streaming hasta MAX_RESPONSE_BYTES + 1 (detecta el exceso)."""
+        body = bytearray()
+        async for chunk in resp.content.iter_chunked(8192):
+            body += chunk
+            if len(body) > MAX_RESPONSE_BYTES:
+                break
+        return bytes(body[:MAX_RESPONSE_BYTES + 1])
+    
+    async def aclose(self) -> None:
+        await self._session.close()
+
+
+WebhookHTTPClient = Union[httpx.AsyncClient, AiohttpWebhookClient]
+
+# Pool keep-alive compartido por todos los WebhookTrigger del proceso
+_SHARED_CLIENT: Optional[WebhookHTTPClient] = None
+
+
+def configure_shared_http_client(client: WebhookHTTPClient) -> None:
+    """⚙️ Instalar el cliente compartido del proceso (startup de la aplicación)."""
+    global _SHARED_CLIENT
+    _SHARED_CLIENT = client
+
+
+def get_shared_http_client() -> WebhookHTTPClient:
+    """
+    🌐 Cliente HTTP compartido (lazy) con pool de conexiones keep-alive.
+    
+    Reutilizar el cliente evita un handshake TCP/TLS por cada webhook. Si la
+    aplicación no instaló otro cliente, se usa httpx.
+    """
+    global _SHARED_CLIENT
+    if _SHARED_CLIENT is None or _SHARED_CLIENT.is_closed:
+        # HTTP/2 multiplexa los triggers concurrentes sobre una conexión; ALPN
+        # negocia HTTP/1.1 si el proxy de n8n no lo soporta
+        transport = httpx.AsyncHTTPTransport(
+            http2=_HTTP2_AVAILABLE,
+            retries=1,  # Reintenta solo fallos de conexión (no re-POSTea)
+            limits=httpx.Limits(
+                max_keepalive_connections=20,
+                max_connections=100,
+                keepalive_expiry=30
+            )
+        )
+        _SHARED_CLIENT = httpx.AsyncClient(transport=transport, headers=_DEFAULT_HEADERS)
+    return _SHARED_CLIENT
+
+
+async def close_shared_http_client() -> None:
+    """🔻 Cerrar el cliente compartido (shutdown de la aplicación)."""
+    global _SHARED_CLIENT
+    if _SHARED_CLIENT is not None:
+        await _SHARED_CLIENT.aclose()
+        _SHARED_CLIENT = None
+
+
+def _parse_webhook_url(webhook_url: Optional[str]) -> Optional[httpx.URL]:
+    """
+    Parsear (e IDNA-codificar) la URL una sola vez al configurarla.
+    
+    Una URL inválida se deja como texto: el POST la rechaza con
+    ``httpx.InvalidURL`` y el error llega como respuesta no recuperable.
+    """
+    if not webhook_url:
+        return None
+    try:
+        return httpx.URL(webhook_url)
+    except httpx.InvalidURL:
+        return None
+
+
+def _elapsed_ms(start_ns: int) -> float:
+    """Milisegundos transcurridos desde ``start_ns`` (reloj monotónico)."""
+    return (time.perf_counter_ns() - start_ns) / 1e6
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Segundos indicados por un header Retry-After (delta-seconds o HTTP-date)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+# 4xx que sí merecen reintento (timeout del servidor / rate limit)
+_RETRYABLE_CLIENT_ERRORS = frozenset({408, 425, 429})
+
+# Errores de transporte transitorios; cualquier otro (URL inválida, protocolo
+# no soportado...) no se resuelve reintentando
+_RECOVERABLE_ERRORS = (
+    httpx.TimeoutException,
+    httpx.ConnectError,
+    httpx.RemoteProtocolError,
+    httpx.ReadError
+)
+
+# Circuit breaker por URL de webhook. Es estado de proceso, como el pool HTTP:
+# los WebhookTrigger se crean por request y uno por instancia no vería la caída
+BREAKER_FAILURE_THRESHOLD = 3
+BREAKER_COOLDOWN_SECONDS = 30.0
+_BREAKERS: Dict[str, Dict[str, float]] = {}
+
+
+def _breaker_for(url: str) -> Dict[str, float]:
+    return _BREAKERS.setdefault(url, {"fails": 0, "open_until": 0.0})
+
+
+def circuit_breaker_state() -> str:
+    """🩺 "open" si algún webhook está en cooldown, "closed" si no (para /health)."""
+    now = time.monotonic()
+    if any(breaker["open_until"] > now for breaker in _BREAKERS.values()):
+        return "open"
+    return "closed"
+
+
+def reset_circuit_breakers() -> None:
+    """Cerrar todos los breakers (tests / reconfiguración de n8n)."""
+    _BREAKERS.clear()
+
+
 class WebhookStatus(Enum):
     """Estados de llamadas a webhook"""
     PENDING = "pending"
@@ -23,7 +241,14 @@ class WebhookStatus(Enum):
     TIMEOUT = "timeout"
 
 
-@dataclass
+# URLs de servicios que n8n necesita (iguales para todos los payloads)
+_STATIC_SERVICES = {
+    "nlp_service_url": "http://localhost:8003",
+    "gatekeeper_service_url": "http://localhost:8002"
+}
+
+
+@dataclass(slots=True)
 class WebhookPayload:
     """
     📤 Payload estándar para webhook de n8n.
@@ -46,16 +271,26 @@ class WebhookPayload:
     consumption_percentage: float = 0.0
     
     # Metadatos del workflow
-    workflow_trigger_id: str = field(default_factory=lambda: f"trigger-{int(datetime.utcnow().timestamp())}")
+    # ✅ Único por payload: es la Idempotency-Key y la clave del fan-out por lotes
+    workflow_trigger_id: str = field(default_factory=lambda: f"trigger-{uuid4().hex}")
     triggered_at: datetime = field(default_factory=datetime.utcnow)
     
     # URLs de callback para n8n
     consumption_callback_url: str = ""
     status_callback_url: str = ""
     
+    # Cuerpo JSON serializado (se calcula una vez y se reutiliza en los reintentos)
+    _cached_body: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+    
+    def to_json_bytes(self) -> bytes:
+        """Serializar con orjson, memoizado: el payload no cambia entre reintentos."""
+        if self._cached_body is None:
+            self._cached_body = orjson.dumps(self.to_dict(), option=orjson.OPT_UTC_Z)
+        return self._cached_body
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convertir a diccionario para JSON"""
-        return {
+        data = {
             "user_id": self.user_id,
             "meeting_id": self.meeting_id,
             "meeting_url": self.meeting_url,
@@ -67,21 +302,25 @@ class WebhookPayload:
             "consumption_percentage": self.consumption_percentage,
             "workflow_trigger_id": self.workflow_trigger_id,
             "triggered_at": self.triggered_at.isoformat(),
-            "callbacks": {
+            "services": _STATIC_SERVICES
+        }
+        # Sin callbacks configurados no se envía la clave
+        if self.consumption_callback_url or self.status_callback_url:
+            data["callbacks"] = {
                 "consumption_update": self.consumption_callback_url,
                 "status_update": self.status_callback_url
-            },
-            "services": {
-                "nlp_service_url": "http://localhost:8003",
-                "gatekeeper_service_url": "http://localhost:8002"
             }
-        }
+        return data
 
 
-@dataclass
+@dataclass(slots=True)
 class WebhookResponse:
     """
     📥 Respuesta del webhook de n8n.
+    
+    Se construye una por intento, así que va con ``__slots__`` y guarda el
+    instante de envío como epoch float; ``sent_at`` solo crea el datetime
+    cuando alguien lo lee.
     """
     status: WebhookStatus
     webhook_trigger_id: str
@@ -89,15 +328,28 @@ class WebhookResponse:
     error_message: Optional[str] = None
     http_status_code: Optional[int] = None
     response_time_ms: float = 0.0
-    sent_at: datetime = field(default_factory=datetime.utcnow)
+    sent_at_ts: float = field(default_factory=time.time, repr=False)
+    retry_after_seconds: Optional[float] = None  # Header Retry-After de n8n
+    recoverable: bool = True  # Para fallos sin código HTTP (errores de transporte)
+    is_successful_flag: bool = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        # Precalculado una vez: el loop de reintentos y los callers lo consultan varias veces
+        code = self.http_status_code
+        self.is_successful_flag = (
+            self.status is WebhookStatus.SENT
+            and code is not None
+            and 200 <= code < 300
+        )
     
     def is_successful(self) -> bool:
         """Verificar si el webhook fue exitoso"""
-        return (
-            self.status == WebhookStatus.SENT and 
-            self.http_status_code and 
-            200 <= self.http_status_code < 300
-        )
+        return self.is_successful_flag
+    
+    @property
+    def sent_at(self) -> datetime:
+        """Instante de envío (UTC naive, como el resto de timestamps del servicio)."""
+        return datetime.fromtimestamp(self.sent_at_ts, tz=timezone.utc).replace(tzinfo=None)
     
     @property
     def response_id(self) -> str:
@@ -105,6 +357,59 @@ class WebhookResponse:
         return self.webhook_trigger_id
 
 
+def _failed_responses(
+    payloads: List[WebhookPayload],
+    error_message: str,
+    status: WebhookStatus = WebhookStatus.FAILED,
+    response_time_ms: float = 0.0,
+    recoverable: bool = True
+) -> List[WebhookResponse]:
+    """Misma respuesta fallida para cada payload de un lote."""
+    return [
+        WebhookResponse(
+            status=status,
+            webhook_trigger_id=payload.workflow_trigger_id,
+            error_message=error_message,
+            response_time_ms=response_time_ms,
+            recoverable=recoverable
+        )
+        for payload in payloads
+    ]
+
+
+def _batch_idempotency_key(payloads: List[WebhookPayload]) -> str:
+    """Clave estable de un lote: el mismo conjunto de eventos produce la misma clave."""
+    trigger_ids = "\n".join(payload.workflow_trigger_id for payload in payloads)
+    return f"batch-{hashlib.sha256(trigger_ids.encode()).hexdigest()[:32]}"
+
+
+def _error_preview(response_data: Optional[Dict[str, Any]]) -> str:
+    """Extracto (200 caracteres) del cuerpo ya acotado por _parse_response_body."""
+    if not response_data:
+        return ""
+    raw = response_data.get("raw_response")
+    text = raw if isinstance(raw, str) else orjson.dumps(response_data).decode()
+    return text[:200]
+
+
+_CONNECTION_TEST_PAYLOAD: Optional[WebhookPayload] = None
+
+
+def _connection_test_payload() -> WebhookPayload:
+    """Payload de prueba de conectividad, construido (y serializado) una sola vez."""
+    global _CONNECTION_TEST_PAYLOAD
+    if _CONNECTION_TEST_PAYLOAD is None:
+        _CONNECTION_TEST_PAYLOAD = WebhookPayload(
+            user_id="test-user",
+            meeting_id="test-meeting",
+            meeting_url="https://meet.google.com/test",
+            transcription_text="Test transcription for webhook connectivity",
+            language="en",
+            workflow_trigger_id="test-connection"
+        )
+    return _CONNECTION_TEST_PAYLOAD
+
+
 class WebhookTrigger:
     """
     🔗 Disparador de Webhooks para n8n/Make.
@@ -118,21 +423,20 @@ class WebhookTrigger:
         n8n_webhook_url: Optional[str] = None,
         timeout_seconds: int = 30,
         max_retries: int = 3,
-        retry_delay_seconds: float = 1.0
+        retry_delay_seconds: float = 1.0,
+        http_client: Optional[WebhookHTTPClient] = None,
+        max_delay_seconds: float = 30.0
     ):
         self.n8n_webhook_url = n8n_webhook_url
+        self._parsed_url = _parse_webhook_url(n8n_webhook_url)
         self.timeout_seconds = timeout_seconds
         self.max_retries = max_retries
         self.retry_delay_seconds = retry_delay_seconds
+        self.max_delay_seconds = max_delay_seconds
         
-        # HTTP Client configurado
-        self.http_client = httpx.AsyncClient(
-            timeout=httpx.Timeout(timeout_seconds),
-            headers={
-                "Content-Type": "application/json",
-                "User-Agent": "M2PRD-Gatekeeper/1.0"
-            }
-        )
+        # HTTP Client inyectado o, por defecto, el pool compartido del proceso
+        self.http_client = http_client or get_shared_http_client()
+        self.timeout = httpx.Timeout(connect=5, read=timeout_seconds, write=5, pool=5)
         
         # Logger
         self.logger = logging.getLogger(__name__)
@@ -167,55 +471,84 @@ class WebhookTrigger:
                 error_message="No webhook URL configured"
             )
         
-        self.logger.info(
-            f"🔗 Triggering n8n workflow for meeting {payload.meeting_id}",
-            extra={
-                "meeting_id": payload.meeting_id,
-                "user_id": payload.user_id,
-                "workflow_trigger_id": payload.workflow_trigger_id,
-                "webhook_url": target_url
-            }
-        )
+        # Con n8n caído, fallar rápido en vez de agotar reintentos y backoff
+        breaker = _breaker_for(target_url)
+        if time.monotonic() < breaker["open_until"]:
+            return WebhookResponse(
+                status=WebhookStatus.FAILED,
+                webhook_trigger_id=payload.workflow_trigger_id,
+                error_message="circuit_open",
+                recoverable=False
+            )
         
-        start_time = datetime.utcnow()
+        # Los extra/mensajes solo se construyen si el nivel está habilitado
+        info_enabled = self.logger.isEnabledFor(logging.INFO)
+        if info_enabled:
+            self.logger.info(
+                "Triggering n8n workflow for meeting %s", payload.meeting_id,
+                extra={
+                    "meeting_id": payload.meeting_id,
+                    "user_id": payload.user_id,
+                    "workflow_trigger_id": payload.workflow_trigger_id,
+                    "webhook_url": target_url
+                }
+            )
+        
+        response = await self._send_with_retries(
+            self._request_url(target_url), payload, info_enabled
+        )
+        self._record_breaker_outcome(breaker, response)
+        return response
+    
+    async def _send_with_retries(
+        self,
+        request_url: Union[str, httpx.URL],
+        payload: WebhookPayload,
+        info_enabled: bool
+    ) -> WebhookResponse:
+        """🔁 Loop de reintentos con backoff de trigger_n8n_workflow."""
+        start_ns = time.perf_counter_ns()
         
         # Intentar envío con reintentos
         for attempt in range(1, self.max_retries + 1):
+            response: Optional[WebhookResponse] = None
             try:
-                response = await self._send_webhook_request(target_url, payload, attempt)
+                response = await self._send_webhook_request(request_url, payload, attempt)
                 
                 if response.is_successful():
-                    self.logger.info(
-                        f"✅ n8n webhook triggered successfully for meeting {payload.meeting_id}",
-                        extra={
-                            "meeting_id": payload.meeting_id,
-                            "workflow_trigger_id": payload.workflow_trigger_id,
-                            "attempt": attempt,
-                            "response_time_ms": response.response_time_ms
-                        }
-                    )
+                    if info_enabled:
+                        self.logger.info(
+                            "n8n webhook triggered successfully for meeting %s", payload.meeting_id,
+                            extra={
+                                "meeting_id": payload.meeting_id,
+                                "workflow_trigger_id": payload.workflow_trigger_id,
+                                "attempt": attempt,
+                                "response_time_ms": response.response_time_ms
+                            }
+                        )
                     return response
                 else:
                     # Log warning pero continuar con reintentos si es aplicable
-                    self.logger.warning(
-                        f"⚠️ n8n webhook attempt {attempt} failed for meeting {payload.meeting_id}",
-                        extra={
-                            "meeting_id": payload.meeting_id,
-                            "attempt": attempt,
-                            "status_code": response.http_status_code,
-                            "error": response.error_message
-                        }
-                    )
+                    if self.logger.isEnabledFor(logging.WARNING):
+                        self.logger.warning(
+                            "n8n webhook attempt %d failed for meeting %s", attempt, payload.meeting_id,
+                            extra={
+                                "meeting_id": payload.meeting_id,
+                                "attempt": attempt,
+                                "status_code": response.http_status_code,
+                                "error": response.error_message
+                            }
+                        )
                     
-                    # Si es el último intento, retornar el error
-                    if attempt == self.max_retries:
+                    # Si es el último intento o el error no es recuperable, retornar el error
+                    if attempt == self.max_retries or not self._is_recoverable(response):
                         return response
                         
             except Exception as e:
                 error_msg = f"HTTP request failed on attempt {attempt}: {str(e)}"
                 
                 self.logger.error(
-                    f"❌ n8n webhook error on attempt {attempt} for meeting {payload.meeting_id}",
+                    "n8n webhook error on attempt %d for meeting %s", attempt, payload.meeting_id,
                     extra={
                         "meeting_id": payload.meeting_id,
                         "attempt": attempt,
@@ -224,18 +557,22 @@ class WebhookTrigger:
                     exc_info=True
                 )
                 
-                # Si es el último intento, retornar el error
-                if attempt == self.max_retries:
+                # Último intento o error no transitorio: no reintentar
+                if attempt == self.max_retries or not isinstance(e, _RECOVERABLE_ERRORS):
                     return WebhookResponse(
                         status=WebhookStatus.FAILED,
                         webhook_trigger_id=payload.workflow_trigger_id,
                         error_message=error_msg,
-                        response_time_ms=(datetime.utcnow() - start_time).total_seconds() * 1000
+                        response_time_ms=_elapsed_ms(start_ns)
                     )
             
-            # Esperar antes del siguiente intento
+            # Esperar antes del siguiente intento (respetando Retry-After de n8n)
             if attempt < self.max_retries:
-                await asyncio.sleep(self.retry_delay_seconds * attempt)  # Backoff exponencial
+                delay = self._backoff_delay(attempt)
+                if response is not None and response.retry_after_seconds is not None:
+                    delay = max(delay, response.retry_after_seconds)
+                # Una cancelación (shutdown, wait_for) interrumpe el sleep y se propaga
+                await asyncio.sleep(delay)
         
         # Este código no debería alcanzarse, pero por seguridad
         return WebhookResponse(
@@ -244,6 +581,244 @@ class WebhookTrigger:
             error_message="Max retries exceeded"
         )
     
+    async def trigger_many(
+        self,
+        payloads: List[WebhookPayload],
+        concurrency: int = 20
+    ) -> List[WebhookResponse]:
+        """
+        🚀 Disparar varios workflows en paralelo (acotado por ``concurrency``).
+        
+        Semántica allSettled: un fallo no cancela el resto del lote; las
+        excepciones se convierten en WebhookResponse FAILED.
+        
+        Args:
+            payloads: Payloads a enviar
+            concurrency: Máximo de webhooks en vuelo simultáneamente
+            
+        Returns:
+            List[WebhookResponse]: Una respuesta por payload, en el mismo orden
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        results: List[Optional[WebhookResponse]] = [None] * len(payloads)
+        
+        async def _trigger(index: int, payload: WebhookPayload) -> None:
+            # Cada task captura su error: el TaskGroup cancelaría al resto
+            async with semaphore:
+                try:
+                    results[index] = await self.trigger_n8n_workflow(payload)
+                except Exception as e:
+                    results[index] = WebhookResponse(
+                        status=WebhookStatus.FAILED,
+                        webhook_trigger_id=payload.workflow_trigger_id,
+                        error_message=f"Unexpected error: {e}"
+                    )
+        
+        async with asyncio.TaskGroup() as tg:
+            for index, payload in enumerate(payloads):
+                tg.create_task(_trigger(index, payload))
+        return results
+    
+    async def trigger_batch(
+        self,
+        payloads: List[WebhookPayload],
+        max_batch: int = 50,
+        webhook_url: Optional[str] = None
+    ) -> List[WebhookResponse]:
+        """
+        🧺 Enviar varios payloads agrupados en POSTs ``{"events": [...]}``.
+        
+        N payloads viajan en ceil(N / max_batch) requests en paralelo en lugar
+        de N. El workflow de n8n itera ``events`` y responde ``{"results": [...]}``
+        con el estado de cada workflow_trigger_id. Todos los payloads se conocen
+        de antemano, así que se trocean sin ventana de espera (WebhookBatcher
+        queda para eventos que llegan en momentos distintos).
+        
+        Args:
+            payloads: Payloads a enviar
+            max_batch: Máximo de eventos por request
+            webhook_url: URL del webhook (opcional, usa la configurada por defecto)
+            
+        Returns:
+            List[WebhookResponse]: Una respuesta por payload, en el mismo orden
+        """
+        chunks = [payloads[i:i + max_batch] for i in range(0, len(payloads), max_batch)]
+        batches = await asyncio.gather(
+            *(self._send_batch_request(chunk, webhook_url) for chunk in chunks)
+        )
+        return [response for batch in batches for response in batch]
+    
+    async def _send_batch_request(
+        self,
+        payloads: List[WebhookPayload],
+        webhook_url: Optional[str] = None
+    ) -> List[WebhookResponse]:
+        """
+        📡 Enviar un lote de eventos en un único POST y repartir los resultados.
+        
+        Un único intento: los eventos fallidos se devuelven FAILED para que el
+        caller decida si reenviarlos. Comparte circuit breaker, cabeceras de
+        idempotencia y lectura acotada del cuerpo con trigger_n8n_workflow.
+        """
+        target_url = webhook_url or self.n8n_webhook_url
+        if not target_url:
+            return _failed_responses(payloads, "No webhook URL configured")
+        
+        breaker = _breaker_for(target_url)
+        if time.monotonic() < breaker["open_until"]:
+            return _failed_responses(payloads, "circuit_open", recoverable=False)
+        
+        responses = await self._post_batch(self._request_url(target_url), payloads)
+        # Todas las respuestas de un lote comparten el resultado HTTP del POST
+        if responses:
+            self._record_breaker_outcome(breaker, responses[0])
+        return responses
+    
+    async def _post_batch(
+        self,
+        url: Union[str, httpx.URL],
+        payloads: List[WebhookPayload]
+    ) -> List[WebhookResponse]:
+        """📡 POST ``{"events": [...]}`` y fan-out de ``{"results": [...]}`` por evento."""
+        start_ns = time.perf_counter_ns()
+        body = orjson.dumps(
+            {"events": [payload.to_dict() for payload in payloads]},
+            option=orjson.OPT_UTC_Z
+        )
+        headers = {
+            **_JSON_HEADERS,
+            "Idempotency-Key": _batch_idempotency_key(payloads),
+            "X-Attempt": "1"
+        }
+        
+        try:
+            response = await self.http_client.post(
+                url, content=body, headers=headers, timeout=self.timeout
+            )
+        except httpx.TimeoutException:
+            return _failed_responses(
+                payloads, f"Request timeout after {self.timeout_seconds} seconds",
+                status=WebhookStatus.TIMEOUT, response_time_ms=_elapsed_ms(start_ns)
+            )
+        except httpx.RequestError as e:
+            return _failed_responses(
+                payloads, f"Request error: {e}", response_time_ms=_elapsed_ms(start_ns),
+                recoverable=isinstance(e, _RECOVERABLE_ERRORS)
+            )
+        
+        response_time = _elapsed_ms(start_ns)
+        # Cuerpo acotado a MAX_RESPONSE_BYTES
+        response_data = self._parse_response_body(response) or {}
+        if not 200 <= response.status_code < 300:
+            preview = _error_preview(response_data)
+            return [
+                WebhookResponse(
+                    status=WebhookStatus.FAILED,
+                    webhook_trigger_id=payload.workflow_trigger_id,
+                    error_message=f"HTTP {response.status_code}: {preview}",
+                    http_status_code=response.status_code,
+                    response_time_ms=response_time
+                )
+                for payload in payloads
+            ]
+        
+        # Fan-out: {"results": [{"workflow_trigger_id": ..., "status": "sent"}, ...]}
+        results = {
+            result.get("workflow_trigger_id"): result
+            for result in response_data.get("results", [])
+            if isinstance(result, dict)
+        }
+        responses = []
+        for payload in payloads:
+            result = results.get(payload.workflow_trigger_id)
+            if result is None:
+                status = WebhookStatus.FAILED
+                error_message = "Event missing from batch response"
+            elif result.get("status") == WebhookStatus.SENT.value:
+                status = WebhookStatus.SENT
+                error_message = None
+            else:
+                status = WebhookStatus.FAILED
+                error_message = result.get("error") or f"Event status: {result.get('status')}"
+            responses.append(WebhookResponse(
+                status=status,
+                webhook_trigger_id=payload.workflow_trigger_id,
+                response_data=result,
+                error_message=error_message,
+                http_status_code=response.status_code,
+                response_time_ms=response_time
+            ))
+        return responses
+    
+    def _backoff_delay(self, attempt: int) -> float:
+        """
+        ⏳ Backoff exponencial con jitter para el reintento tras ``attempt``.
+        
+        base * 2^(attempt-1), acotado a max_delay_seconds y multiplicado por un
+        factor aleatorio en [0.5, 1.5) para que los reintentos no vayan en bloque.
+        """
+        delay = min(self.max_delay_seconds, self.retry_delay_seconds * (2 ** (attempt - 1)))
+        return delay * random.uniform(0.5, 1.5)
+    
+    def _request_url(self, target_url: str) -> Union[str, httpx.URL]:
+        """URL ya parseada si es la configurada; otra se parsea una vez por envío."""
+        if target_url == self.n8n_webhook_url and self._parsed_url is not None:
+            return self._parsed_url
+        return _parse_webhook_url(target_url) or target_url
+    
+    @staticmethod
+    def _record_breaker_outcome(breaker: Dict[str, float], response: WebhookResponse) -> None:
+        """
+        Abrir el breaker tras BREAKER_FAILURE_THRESHOLD envíos fallidos seguidos.
+        
+        Solo cuentan los fallos que indican caída de n8n (transporte, timeout,
+        5xx); un 4xx demuestra que n8n responde y cierra el breaker igual que
+        un éxito.
+        """
+        code = response.http_status_code
+        if response.is_successful() or (code is not None and code < 500):
+            breaker["fails"] = 0
+            breaker["open_until"] = 0.0
+            return
+        breaker["fails"] += 1
+        if breaker["fails"] >= BREAKER_FAILURE_THRESHOLD:
+            # Sin resetear "fails": tras el cooldown un solo fallo lo reabre
+            breaker["open_until"] = time.monotonic() + BREAKER_COOLDOWN_SECONDS
+    
+    @staticmethod
+    def _is_recoverable(response: "WebhookResponse") -> bool:
+        """
+        🔁 Clasificar un intento fallido: timeouts, errores de conexión, 5xx,
+        408, 425 y 429 se reintentan; el resto de 4xx no se resolverá reintentando.
+        """
+        code = response.http_status_code
+        if code is None:
+            return response.recoverable
+        return code >= 500 or code in _RETRYABLE_CLIENT_ERRORS
+    
+    @staticmethod
+    def _parse_response_body(response: httpx.Response) -> Optional[Dict[str, Any]]:
+        """
+        📦 Interpretar el cuerpo de la respuesta de n8n sin procesar cuerpos enormes.
+        
+        Solo se decodifica JSON si el Content-Type lo declara; un cuerpo por encima
+        de MAX_RESPONSE_BYTES se descarta (solo queda un extracto para logging).
+        """
+        content = response.content
+        if not content:
+            return None
+        if len(content) > MAX_RESPONSE_BYTES:
+            return {
+                "raw_response": content[:200].decode("utf-8", errors="replace"),
+                "truncated": True
+            }
+        if response.headers.get("content-type", "").startswith("application/json"):
+            try:
+                return response.json()
+            except json.JSONDecodeError:
+                pass
+        return {"raw_response": content.decode("utf-8", errors="replace")}
+    
     # Alias para compatibilidad con endpoint
     async def trigger_workflow(self, payload: WebhookPayload, webhook_url: Optional[str] = None) -> WebhookResponse:
         """Alias para trigger_n8n_workflow para compatibilidad."""
@@ -251,35 +826,40 @@ class WebhookTrigger:
     
     async def _send_webhook_request(
         self, 
-        url: str, 
+        url: Union[str, httpx.URL], 
         payload: WebhookPayload, 
         attempt: int
     ) -> WebhookResponse:
         """
         📡 Enviar request HTTP al webhook.
+        
+        Cada intento lleva ``Idempotency-Key`` (workflow_trigger_id, igual en
+        todos los reintentos) y ``X-Attempt``. El primer nodo del workflow de
+        n8n debe deduplicar por esa clave (p.ej. SETNX en Redis con TTL corto)
+        para que un reintento tras una respuesta perdida no ejecute el
+        workflow dos veces.
         """
-        start_time = datetime.utcnow()
+        start_ns = time.perf_counter_ns()
+        headers = {
+            **_JSON_HEADERS,
+            "Idempotency-Key": payload.workflow_trigger_id,
+            "X-Attempt": str(attempt)
+        }
         
         try:
-            # Preparar datos JSON
-            json_data = payload.to_dict()
-            
-            # Realizar request POST
+            # Realizar request POST (cuerpo orjson precalculado)
             response = await self.http_client.post(
                 url,
-                json=json_data
+                content=payload.to_json_bytes(),
+                headers=headers,
+                timeout=self.timeout
             )
             
             # Calcular tiempo de respuesta
-            response_time = (datetime.utcnow() - start_time).total_seconds() * 1000
+            response_time = _elapsed_ms(start_ns)
             
-            # Procesar respuesta
-            response_data = None
-            try:
-                if response.content:
-                    response_data = response.json()
-            except json.JSONDecodeError:
-                response_data = {"raw_response": response.text}
+            # Procesar respuesta (cuerpo acotado a MAX_RESPONSE_BYTES)
+            response_data = self._parse_response_body(response)
             
             # Determinar status
             if 200 <= response.status_code < 300:
@@ -287,7 +867,8 @@ class WebhookTrigger:
                 error_message = None
             else:
                 status = WebhookStatus.FAILED
-                error_message = f"HTTP {response.status_code}: {response.text[:200]}"
+                preview = response.content[:200].decode("utf-8", errors="replace")
+                error_message = f"HTTP {response.status_code}: {preview}"
             
             return WebhookResponse(
                 status=status,
@@ -295,7 +876,8 @@ class WebhookTrigger:
                 response_data=response_data,
                 error_message=error_message,
                 http_status_code=response.status_code,
-                response_time_ms=response_time
+                response_time_ms=response_time,
+                retry_after_seconds=_parse_retry_after(response.headers.get("retry-after"))
             )
             
         except httpx.TimeoutException:
@@ -303,7 +885,7 @@ class WebhookTrigger:
                 status=WebhookStatus.TIMEOUT,
                 webhook_trigger_id=payload.workflow_trigger_id,
                 error_message=f"Request timeout after {self.timeout_seconds} seconds",
-                response_time_ms=(datetime.utcnow() - start_time).total_seconds() * 1000
+                response_time_ms=_elapsed_ms(start_ns)
             )
         
         except httpx.RequestError as e:
@@ -311,7 +893,8 @@ class WebhookTrigger:
                 status=WebhookStatus.FAILED,
                 webhook_trigger_id=payload.workflow_trigger_id,
                 error_message=f"Request error: {str(e)}",
-                response_time_ms=(datetime.utcnow() - start_time).total_seconds() * 1000
+                response_time_ms=_elapsed_ms(start_ns),
+                recoverable=isinstance(e, _RECOVERABLE_ERRORS)
             )
     
     def configure_webhook_url(self, webhook_url: str) -> None:
@@ -321,7 +904,8 @@ class WebhookTrigger:
         Permite configurar la URL dinámicamente cuando esté disponible.
         """
         self.n8n_webhook_url = webhook_url
-        self.logger.info(f"🔧 Webhook URL configured: {webhook_url}")
+        self._parsed_url = _parse_webhook_url(webhook_url)
+        self.logger.info("Webhook URL configured: %s", webhook_url)
     
     async def test_webhook_connection(
         self, 
@@ -332,32 +916,117 @@ class WebhookTrigger:
         
         Envía un payload de prueba para verificar que n8n responde correctamente.
         """
-        test_payload = WebhookPayload(
-            user_id="test-user",
-            meeting_id="test-meeting",
-            meeting_url="https://meet.google.com/test",
-            transcription_text="Test transcription for webhook connectivity",
-            language="en",
-            workflow_trigger_id="test-connection"
-        )
-        
-        return await self.trigger_n8n_workflow(test_payload, webhook_url)
+        return await self.trigger_n8n_workflow(_connection_test_payload(), webhook_url)
     
-    def get_callback_urls(self, base_url: str = "http://localhost:8002") -> Dict[str, str]:
+    @staticmethod
+    def get_callback_urls(base_url: str = "http://localhost:8002") -> Dict[str, str]:
         """
         📞 Generar URLs de callback para n8n.
         
         n8n puede usar estas URLs para notificar de vuelta al sistema.
         """
-        return {
-            "consumption_update": f"{base_url}/api/v1/consumption/process/update",
-            "status_update": f"{base_url}/api/v1/workflow/status",
-            "health_check": f"{base_url}/health"
-        }
+        return build_callback_urls(base_url)
     
     async def close(self):
-        """Cerrar el cliente HTTP"""
-        await self.http_client.aclose()
+        """
+        Liberar el cliente HTTP.
+        
+        El cliente compartido sobrevive a cada trigger: se cierra en el shutdown
+        de la aplicación (close_shared_http_client). Solo se cierra aquí un
+        cliente inyectado distinto del compartido.
+        """
+        if self.http_client is not _SHARED_CLIENT:
+            await self.http_client.aclose()
+
+
+class WebhookBatcher:
+    """
+    🧺 Agrupa webhooks enviados por separado en POSTs por lotes.
+    
+    Los callers hacen ``await batcher.submit(payload)``; una tarea de fondo
+    drena la cola y envía un lote cuando reúne ``max_batch`` eventos o vence
+    ``max_wait_ms`` desde el primero.
+    """
+    
+    def __init__(
+        self,
+        trigger: WebhookTrigger,
+        webhook_url: Optional[str] = None,
+        max_batch: int = 50,
+        max_wait_ms: int = 50
+    ):
+        self._trigger = trigger
+        self._webhook_url = webhook_url
+        self.max_batch = max_batch
+        self._max_wait = max_wait_ms / 1000
+        self._queue: "asyncio.Queue" = asyncio.Queue()
+        self._worker: Optional[asyncio.Task] = None
+        self._batch: List[tuple] = []  # Lote en formación (ya fuera de la cola)
+    
+    async def submit(self, payload: WebhookPayload) -> WebhookResponse:
+        """Encolar un payload y esperar su resultado dentro del lote."""
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((payload, future))
+        return await future
+    
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                self._batch = [await self._queue.get()]
+                deadline = loop.time() + self._max_wait
+                while len(self._batch) < self.max_batch:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        self._batch.append(
+                            await asyncio.wait_for(self._queue.get(), remaining)
+                        )
+                    except asyncio.TimeoutError:
+                        break
+                batch, self._batch = self._batch, []
+                await self._flush(batch)
+        except asyncio.CancelledError:
+            # Cancelado durante la ventana de agrupación: el lote en formación ya
+            # salió de la cola, así que se resuelve aquí como FAILED
+            batch, self._batch = self._batch, []
+            self._resolve(batch, _failed_responses([payload for payload, _ in batch], "cancelled"))
+            raise
+    
+    async def _flush(self, batch: List[tuple]) -> None:
+        payloads = [payload for payload, _ in batch]
+        try:
+            responses = await self._trigger._send_batch_request(payloads, self._webhook_url)
+        except asyncio.CancelledError:
+            # Ningún caller queda esperando un lote interrumpido
+            self._resolve(batch, _failed_responses(payloads, "cancelled"))
+            raise
+        except Exception as e:
+            responses = _failed_responses(payloads, f"Unexpected error: {e}")
+        self._resolve(batch, responses)
+    
+    @staticmethod
+    def _resolve(batch: List[tuple], responses: List[WebhookResponse]) -> None:
+        for (_, future), response in zip(batch, responses):
+            if not future.done():
+                future.set_result(response)
+    
+    async def close(self) -> None:
+        """Detener la tarea de fondo; los payloads aún encolados se marcan FAILED."""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        pending = []
+        while not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+        self._resolve(pending, _failed_responses([payload for payload, _ in pending], "cancelled"))
 
 
 # ================================================================================================
@@ -406,6 +1075,20 @@ def create_webhook_trigger(
 # 🔧 HELPER FUNCTIONS
 # ================================================================================================
 
+def build_callback_urls(base_url: str = "http://localhost:8002") -> Dict[str, str]:
+    """
+    📞 Generar URLs de callback para n8n (formateo puro, sin cliente HTTP).
+    
+    Args:
+        base_url: URL base del Gatekeeper
+    """
+    return {
+        "consumption_update": f"{base_url}/api/v1/consumption/process/update",
+        "status_update": f"{base_url}/api/v1/workflow/status",
+        "health_check": f"{base_url}/health"
+    }
+
+
 def create_webhook_payload_from_gatekeeper_data(
     request,  # ProcessStartRequest
     authorization_response,  # ConsumptionVerificationResponse
@@ -425,8 +1108,7 @@ def create_webhook_payload_from_gatekeeper_data(
         callback_url: URL de callback para actualizaciones
         callback_base_url: URL base para generar callbacks
     """
-    webhook_trigger = WebhookTrigger()
-    callback_urls = webhook_trigger.get_callback_urls(callback_base_url)
+    callback_urls = build_callback_urls(callback_base_url)
     
     return WebhookPayload(
         user_id=request.user_id,
@@ -0,0 +1,15 @@
+# ================================================================================================
+# 🧪 CONFIGURACIÓN COMPARTIDA DE PYTEST
+# ================================================================================================
+
+import asyncio
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """🔁 Un único event loop para toda la sesión (no uno por test)."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
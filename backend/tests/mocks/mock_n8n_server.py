@@ -6,14 +6,18 @@
 
 import asyncio
 import httpx
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Union
 import uvicorn
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 import time
 import random
+import itertools
+import os
 
 # Configurar logging
 logging.basicConfig(
@@ -22,6 +26,35 @@ logging.basicConfig(
 )
 logger = logging.getLogger("MockN8N")
 
+# IDs únicos sin syscall (int(time.time()) colisiona en el mismo segundo); el
+# PID los distingue entre workers de uvicorn
+_ID_PREFIX = os.getpid()
+_exec_counter = itertools.count(1)
+_prd_counter = itertools.count(1)
+
+# Procesos uvicorn; cola, breakers y contadores son por proceso
+SERVER_WORKERS = int(os.getenv("MOCK_N8N_WORKERS", os.cpu_count() or 1))
+
+# Pool acotado de workers: una ráfaga de webhooks encola en lugar de crear
+# una task por webhook; con la cola llena se responde 503 al Gatekeeper
+PROCESSING_WORKERS = 8
+PROCESSING_QUEUE_MAXSIZE = 1000
+
+_JSON_HEADERS = {"content-type": "application/json"}
+
+# Latencia simulada (segundos); a 0 para medir el techo real de throughput
+MOCK_PROC_DELAY_MIN = float(os.getenv("MOCK_PROC_DELAY_MIN", "2.0"))
+MOCK_PROC_DELAY_MAX = float(os.getenv("MOCK_PROC_DELAY_MAX", "5.0"))
+MOCK_NLP_DELAY_MIN = float(os.getenv("MOCK_NLP_DELAY_MIN", "0.5"))
+MOCK_NLP_DELAY_MAX = float(os.getenv("MOCK_NLP_DELAY_MAX", "1.5"))
+
+# Base para resolver las rutas de callback relativas que envía el Gatekeeper
+GATEKEEPER_BASE_URL = httpx.URL(os.getenv("GATEKEEPER_BASE_URL", "http://localhost:8002"))
+
+# Reintentos del callback al Gatekeeper (backoff exponencial + jitter)
+CALLBACK_MAX_ATTEMPTS = 3
+CALLBACK_MAX_DELAY_SECONDS = 8
+
 # ================================================================================================
 # 📦 MODELOS DE DATOS
 # ================================================================================================
@@ -39,18 +72,120 @@ class WebhookPayload(BaseModel):
     consumption_percentage: float
     workflow_trigger_id: str
     triggered_at: str
-    callbacks: Dict[str, str]
+    callbacks: Dict[str, str]  # Rutas relativas al Gatekeeper o URLs absolutas
     services: Dict[str, str]
 
 
+class CallbackPayload(BaseModel):
+    """Resultado del procesamiento que n8n devuelve al Gatekeeper."""
+    user_id: str
+    meeting_id: str
+    processing_id: str
+    actual_duration_minutes: int
+    prd_generated: bool
+    tasks_created: int
+    requirements_extracted: int
+    workflow_execution_id: str
+    processing_status: str
+    error_message: Optional[str] = None
+
+
+# ================================================================================================
+# ⚡ CIRCUIT BREAKER (callbacks al Gatekeeper)
+# ================================================================================================
+
+class CircuitOpenError(Exception):
+    """El breaker del host de callback está abierto: no se intenta el POST."""
+
+
+class CallbackCircuitBreaker:
+    """
+    ⚡ Breaker CLOSED → OPEN → HALF_OPEN por host del Gatekeeper.
+    
+    Tras ``fail_max`` fallos seguidos se abre y falla rápido durante
+    ``reset_timeout`` segundos; después deja pasar un intento de prueba
+    (HALF_OPEN) que lo cierra si tiene éxito o lo reabre si falla.
+    """
+    
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+    
+    def __init__(self, fail_max: int = 5, reset_timeout: float = 10.0):
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+    
+    def before_call(self) -> None:
+        """Lanza CircuitOpenError si el breaker sigue abierto."""
+        if self.state == self.OPEN:
+            if time.monotonic() - self.opened_at < self.reset_timeout:
+                raise CircuitOpenError("Gatekeeper callback circuit is open")
+            self.state = self.HALF_OPEN
+    
+    def call_succeeded(self) -> None:
+        self.state = self.CLOSED
+        self.failures = 0
+    
+    def call_failed(self) -> None:
+        self.failures += 1
+        if self.state == self.HALF_OPEN or self.failures >= self.fail_max:
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+
+
+# Compartidos entre callbacks: todos los del mismo host ven la misma caída
+_CALLBACK_BREAKERS: Dict[str, CallbackCircuitBreaker] = {}
+
+
+def get_callback_breaker(callback_url: httpx.URL) -> CallbackCircuitBreaker:
+    host = callback_url.netloc.decode("ascii")
+    breaker = _CALLBACK_BREAKERS.get(host)
+    if breaker is None:
+        breaker = _CALLBACK_BREAKERS[host] = CallbackCircuitBreaker()
+    return breaker
+
+
 # ================================================================================================
 # 🏗️ FASTAPI APPLICATION
 # ================================================================================================
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    ✅ Recursos compartidos del mock server.
+    
+    Un único AsyncClient reutiliza las conexiones keep-alive al Gatekeeper
+    en lugar de un handshake TCP/TLS por callback.
+    """
+    app.state.http = httpx.AsyncClient(
+        timeout=10.0,
+        limits=httpx.Limits(max_keepalive_connections=50, max_connections=100)
+    )
+    app.state.queue = asyncio.Queue(maxsize=PROCESSING_QUEUE_MAXSIZE)
+    workers = [
+        asyncio.create_task(processing_worker(app.state.queue))
+        for _ in range(PROCESSING_WORKERS)
+    ]
+    
+    yield
+    
+    # Terminar lo ya aceptado antes de soltar los workers y el cliente
+    await app.state.queue.join()
+    for worker in workers:
+        worker.cancel()
+    await asyncio.gather(*workers, return_exceptions=True)
+    await app.state.http.aclose()
+
+
 app = FastAPI(
     title="🧪 Mock n8n Server",
     description="Servidor simulado de n8n para testing local sin configurar n8n real",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse  # Respuestas serializadas con orjson
 )
 
 
@@ -73,29 +208,34 @@ async def mock_n8n_webhook(request: Request, payload: WebhookPayload):
     logger.info("=" * 80)
     logger.info("📥 MOCK N8N - Webhook recibido del Gatekeeper")
     logger.info("=" * 80)
-    logger.info(f"   Meeting ID: {payload.meeting_id}")
-    logger.info(f"   User ID: {payload.user_id}")
-    logger.info(f"   Processing ID: {payload.workflow_trigger_id}")
-    logger.info(f"   Transcription length: {len(payload.transcription_text)} chars")
-    logger.info(f"   Language: {payload.language}")
-    logger.info(f"   Callback URL: {payload.callbacks.get('consumption_update')}")
+    logger.info("   Meeting ID: %s", payload.meeting_id)
+    logger.info("   User ID: %s", payload.user_id)
+    logger.info("   Processing ID: %s", payload.workflow_trigger_id)
+    logger.info("   Transcription length: %d chars", len(payload.transcription_text))
+    logger.info("   Language: %s", payload.language)
+    logger.info("   Callback URL: %s", payload.callbacks.get('consumption_update'))
+    
+    # Mismo ID en la respuesta y en el callback
+    workflow_execution_id = f"mock-exec-{_ID_PREFIX}-{next(_exec_counter)}"
     
     # Simular procesamiento asíncrono (como haría n8n real)
-    asyncio.create_task(
-        simulate_processing(payload)
-    )
+    try:
+        app.state.queue.put_nowait((payload, workflow_execution_id))
+    except asyncio.QueueFull:
+        logger.warning("🚦 Cola de procesamiento llena, rechazando %s", payload.workflow_trigger_id)
+        raise HTTPException(status_code=503, detail="Processing queue is full, retry later")
     
     processing_time = (time.time() - start_time) * 1000
     
-    logger.info(f"✅ Webhook accepted in {processing_time:.2f}ms")
-    logger.info(f"🔄 Processing iniciado en background...")
+    logger.info("✅ Webhook accepted in %.2fms", processing_time)
+    logger.info("🔄 Processing iniciado en background...")
     logger.info("=" * 80 + "\n")
     
     # Responder inmediatamente (como n8n real)
     return {
         "status": "processing",
         "workflow_id": f"mock-{payload.workflow_trigger_id}",
-        "workflow_execution_id": f"mock-exec-{int(time.time())}",
+        "workflow_execution_id": workflow_execution_id,
         "message": "Webhook received, processing started"
     }
 
@@ -104,7 +244,27 @@ async def mock_n8n_webhook(request: Request, payload: WebhookPayload):
 # 🤖 SIMULACIÓN DE PROCESAMIENTO
 # ================================================================================================
 
-async def simulate_processing(payload: WebhookPayload):
+async def processing_worker(queue: asyncio.Queue):
+    """👷 Consume webhooks de la cola y los procesa de uno en uno."""
+    rng = random.Random()  # Propio del worker: sin compartir el RNG global
+    while True:
+        payload, workflow_execution_id = await queue.get()
+        try:
+            await simulate_processing(payload, workflow_execution_id, rng)
+        except CircuitOpenError:
+            logger.warning("⚡ [mock-%s] Gatekeeper no disponible, callback omitido", payload.workflow_trigger_id)
+        except Exception as e:
+            # simulate_processing ya reporta sus errores; el worker no debe morir
+            logger.error("❌ Worker error procesando %s: %s", payload.workflow_trigger_id, e)
+        finally:
+            queue.task_done()
+
+
+async def simulate_processing(
+    payload: WebhookPayload,
+    workflow_execution_id: str,
+    rng: random.Random
+):
     """
     🤖 Simula el procesamiento completo que n8n haría:
     1. Llamar al servicio IA/NLP
@@ -112,83 +272,96 @@ async def simulate_processing(payload: WebhookPayload):
     3. Crear tareas
     4. Enviar callback al Gatekeeper
     """
-    workflow_execution_id = f"mock-exec-{int(time.time())}"
+    # Resuelta una vez para el callback de éxito, el de fallo y sus reintentos
+    callback_url = GATEKEEPER_BASE_URL.join(payload.callbacks["consumption_update"])
     
     try:
-        logger.info(f"🔄 [mock-{payload.workflow_trigger_id}] Procesamiento iniciado")
+        logger.debug("🔄 [mock-%s] Procesamiento iniciado", payload.workflow_trigger_id)
         
         # Simular delay de procesamiento real (2-5 segundos)
-        processing_delay = random.uniform(2.0, 5.0)
-        logger.info(f"⏳ [mock-{payload.workflow_trigger_id}] Simulando procesamiento ({processing_delay:.1f}s)...")
-        await asyncio.sleep(processing_delay)
+        processing_delay = MOCK_PROC_DELAY_MIN + (MOCK_PROC_DELAY_MAX - MOCK_PROC_DELAY_MIN) * rng.random()
+        logger.debug(
+            "⏳ [mock-%s] Simulando procesamiento (%.1fs)...",
+            payload.workflow_trigger_id, processing_delay
+        )
+        if processing_delay > 0:
+            await asyncio.sleep(processing_delay)
         
         # Simular llamada al servicio IA/NLP
-        logger.info(f"🤖 [mock-{payload.workflow_trigger_id}] Llamando a IA/NLP service...")
-        nlp_results = await simulate_nlp_processing(payload)
+        logger.debug("🤖 [mock-%s] Llamando a IA/NLP service...", payload.workflow_trigger_id)
+        nlp_results = await simulate_nlp_processing(payload, rng)
         
         # Simular generación de PRD y tareas
-        logger.info(f"📄 [mock-{payload.workflow_trigger_id}] Generando PRD y tareas...")
-        prd_results = simulate_prd_generation(nlp_results)
+        logger.debug("📄 [mock-%s] Generando PRD y tareas...", payload.workflow_trigger_id)
+        prd_results = simulate_prd_generation(nlp_results, rng)
         
         # Calcular duración real del procesamiento
         actual_duration_minutes = int(processing_delay / 60 * payload.estimated_duration_minutes)
         if actual_duration_minutes < 1:
-            actual_duration_minutes = random.randint(1, 3)
+            actual_duration_minutes = 1 + int(rng.random() * 3)
         
         # Preparar callback payload
-        callback_payload = {
-            "user_id": payload.user_id,
-            "meeting_id": payload.meeting_id,
-            "processing_id": payload.workflow_trigger_id,
-            "actual_duration_minutes": actual_duration_minutes,
-            "prd_generated": True,
-            "tasks_created": prd_results["tasks_count"],
-            "requirements_extracted": prd_results["requirements_count"],
-            "workflow_execution_id": workflow_execution_id,
-            "processing_status": "completed",
-            "error_message": None
-        }
+        callback_payload = CallbackPayload(
+            user_id=payload.user_id,
+            meeting_id=payload.meeting_id,
+            processing_id=payload.workflow_trigger_id,
+            actual_duration_minutes=actual_duration_minutes,
+            prd_generated=True,
+            tasks_created=prd_results["tasks_count"],
+            requirements_extracted=prd_results["requirements_count"],
+            workflow_execution_id=workflow_execution_id,
+            processing_status="completed"
+        )
         
         # Enviar callback al Gatekeeper
-        logger.info(f"📤 [mock-{payload.workflow_trigger_id}] Enviando callback a Gatekeeper...")
+        logger.debug("📤 [mock-%s] Enviando callback a Gatekeeper...", payload.workflow_trigger_id)
         await send_callback_to_gatekeeper(
-            callback_url=payload.callbacks["consumption_update"],
-            callback_payload=callback_payload
+            callback_url=callback_url,
+            callback_payload=callback_payload,
+            rng=rng
         )
         
-        logger.info(f"✅ [mock-{payload.workflow_trigger_id}] Procesamiento completado exitosamente")
+        logger.info("✅ [mock-%s] Procesamiento completado exitosamente", payload.workflow_trigger_id)
         logger.info("=" * 80 + "\n")
         
+    except CircuitOpenError:
+        # El Gatekeeper está caído: un callback de fallo tampoco llegaría
+        raise
     except Exception as e:
-        logger.error(f"❌ [mock-{payload.workflow_trigger_id}] Error en procesamiento: {str(e)}")
+        logger.error("❌ [mock-%s] Error en procesamiento: %s", payload.workflow_trigger_id, e)
         
         # Enviar callback de fallo
-        error_callback_payload = {
-            "user_id": payload.user_id,
-            "meeting_id": payload.meeting_id,
-            "processing_id": payload.workflow_trigger_id,
-            "actual_duration_minutes": 0,
-            "prd_generated": False,
-            "tasks_created": 0,
-            "requirements_extracted": 0,
-            "workflow_execution_id": workflow_execution_id,
-            "processing_status": "failed",
-            "error_message": str(e)
-        }
+        error_callback_payload = CallbackPayload(
+            user_id=payload.user_id,
+            meeting_id=payload.meeting_id,
+            processing_id=payload.workflow_trigger_id,
+            actual_duration_minutes=0,
+            prd_generated=False,
+            tasks_created=0,
+            requirements_extracted=0,
+            workflow_execution_id=workflow_execution_id,
+            processing_status="failed",
+            error_message=str(e)
+        )
         
         await send_callback_to_gatekeeper(
-            callback_url=payload.callbacks["consumption_update"],
-            callback_payload=error_callback_payload
+            callback_url=callback_url,
+            callback_payload=error_callback_payload,
+            rng=rng
         )
 
 
-async def simulate_nlp_processing(payload: WebhookPayload) -> Dict[str, Any]:
+async def simulate_nlp_processing(payload: WebhookPayload, rng: random.Random) -> Dict[str, Any]:
     """Simula el procesamiento del servicio IA/NLP."""
     # Simular delay de NLP
-    await asyncio.sleep(random.uniform(0.5, 1.5))
+    nlp_delay = MOCK_NLP_DELAY_MIN + (MOCK_NLP_DELAY_MAX - MOCK_NLP_DELAY_MIN) * rng.random()
+    if nlp_delay > 0:
+        await asyncio.sleep(nlp_delay)
     
     # Simular extracción de requisitos
-    word_count = len(payload.transcription_text.split())
+    # Conteo por espacios: evita materializar la lista de palabras de split()
+    text = payload.transcription_text
+    word_count = text.count(" ") + 1 if text else 0
     requirements_count = max(3, int(word_count / 50))  # 1 requisito cada ~50 palabras
     
     return {
@@ -199,60 +372,115 @@ async def simulate_nlp_processing(payload: WebhookPayload) -> Dict[str, Any]:
     }
 
 
-def simulate_prd_generation(nlp_results: Dict[str, Any]) -> Dict[str, Any]:
+def simulate_prd_generation(nlp_results: Dict[str, Any], rng: random.Random) -> Dict[str, Any]:
     """Simula la generación de PRD y tareas."""
     requirements_count = nlp_results["requirements_count"]
     
     # Simular generación de tareas (1-2 tareas por requisito)
-    tasks_count = requirements_count + random.randint(0, requirements_count)
+    tasks_count = requirements_count + int(rng.random() * (requirements_count + 1))
     
     return {
         "prd_generated": True,
-        "prd_id": f"prd-mock-{int(time.time())}",
+        "prd_id": f"prd-mock-{_ID_PREFIX}-{next(_prd_counter)}",
         "requirements_count": requirements_count,
         "tasks_count": tasks_count
     }
 
 
-async def send_callback_to_gatekeeper(callback_url: str, callback_payload: Dict[str, Any]):
+async def send_callback_to_gatekeeper(
+    callback_url: Union[str, httpx.URL],
+    callback_payload: CallbackPayload,
+    rng: random.Random
+):
     """
     📤 Enviar callback al Gatekeeper con los resultados del procesamiento.
     
     Simula lo que n8n haría: hacer POST al callback endpoint del Gatekeeper.
+    Reintenta con backoff exponencial + jitter solo fallos transitorios
+    (transporte, timeout, 5xx); el callback es idempotente por processing_id.
+    El jitter usa el RNG propio del worker (``rng``), no el global.
+    
+    Raises:
+        CircuitOpenError: Si el breaker del host está (o queda) abierto
     """
-    logger.info(f"🔗 Enviando callback a: {callback_url}")
-    logger.info(f"📦 Payload: {callback_payload}")
+    callback_url = httpx.URL(callback_url)  # No-op si ya viene parseada
+    breaker = get_callback_breaker(callback_url)
+    trigger_id = callback_payload.processing_id
+    # Serializado una vez por pydantic-core y reutilizado en cada reintento
+    body = callback_payload.model_dump_json().encode("utf-8")
     
-    try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("🔗 Enviando callback a: %s", callback_url)
+        logger.debug("📦 Payload: %s", callback_payload)
+    
+    for attempt in range(CALLBACK_MAX_ATTEMPTS):
+        breaker.before_call()
+        try:
+            response = await app.state.http.post(
                 callback_url,
-                json=callback_payload
+                content=body,
+                headers=_JSON_HEADERS
             )
-            
-            if response.status_code == 200:
-                logger.info(f"✅ Callback enviado exitosamente: {response.status_code}")
-                logger.info(f"📥 Response: {response.json()}")
+        except httpx.TransportError as e:
+            breaker.call_failed()
+            logger.warning(
+                "⚠️ [mock-%s] Callback intento %d/%d falló: %s",
+                trigger_id, attempt + 1, CALLBACK_MAX_ATTEMPTS, e
+            )
+        except Exception as e:
+            breaker.call_failed()
+            logger.error("❌ Error enviando callback: %s", e)
+            return
+        else:
+            if 200 <= response.status_code < 300:
+                breaker.call_succeeded()
             else:
-                logger.warning(f"⚠️ Callback respondió con código: {response.status_code}")
-                logger.warning(f"Response: {response.text}")
-                
-    except Exception as e:
-        logger.error(f"❌ Error enviando callback: {str(e)}")
+                breaker.call_failed()
+            
+            if response.status_code < 500:
+                if response.status_code == 200:
+                    logger.info("✅ Callback enviado exitosamente: %d", response.status_code)
+                    logger.debug("📥 Response: %s", response.text)
+                else:
+                    logger.warning("⚠️ Callback respondió con código: %d", response.status_code)
+                    logger.warning("Response: %s", response.text)
+                return
+            
+            logger.warning(
+                "⚠️ [mock-%s] Callback intento %d/%d respondió con código: %d",
+                trigger_id, attempt + 1, CALLBACK_MAX_ATTEMPTS, response.status_code
+            )
+        
+        if attempt + 1 < CALLBACK_MAX_ATTEMPTS:
+            delay = min(2 ** attempt, CALLBACK_MAX_DELAY_SECONDS) + rng.random() * 0.5
+            await asyncio.sleep(delay)
+    
+    logger.error("❌ [mock-%s] Callback no entregado tras %d intentos", trigger_id, CALLBACK_MAX_ATTEMPTS)
 
 
 # ================================================================================================
 # 🏥 HEALTH CHECK
 # ================================================================================================
 
+# Timestamp del health check, regenerado como mucho una vez por segundo
+_hc_ts = 0.0
+_hc_str = ""
+
+
 @app.get("/health")
 async def health_check():
     """Health check del mock server."""
+    global _hc_ts, _hc_str
+    now = time.monotonic()
+    if now - _hc_ts > 1.0:
+        _hc_str = datetime.now(timezone.utc).isoformat()
+        _hc_ts = now
+    
     return {
         "status": "healthy",
         "service": "mock-n8n-server",
         "version": "1.0.0",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": _hc_str,
         "message": "🧪 Mock n8n server running for local testing"
     }
 
@@ -298,15 +526,21 @@ if __name__ == "__main__":
     logger.info("")
     logger.info("✅ El servidor simulará el comportamiento completo de n8n:")
     logger.info("   1. Recibir webhooks del Gatekeeper")
-    logger.info("   2. Simular procesamiento (2-5 segundos)")
+    logger.info("   2. Simular procesamiento (%g-%g segundos)", MOCK_PROC_DELAY_MIN, MOCK_PROC_DELAY_MAX)
     logger.info("   3. Enviar callback con resultados")
     logger.info("")
     logger.info("💡 Tip: Configura N8N_WEBHOOK_URL=http://localhost:5678/webhook/process-meeting")
     logger.info("=" * 80 + "\n")
     
+    # Con workers uvicorn necesita la app como import string
     uvicorn.run(
-        app,
+        "mock_n8n_server:app",
+        app_dir=os.path.dirname(os.path.abspath(__file__)),
+        workers=SERVER_WORKERS,
         host="0.0.0.0",
         port=5678,
-        log_level="info"
+        log_level="info",
+        loop="uvloop",      # Event loop en C (uvicorn[standard])
+        http="httptools",   # Parser HTTP en C en lugar de h11
+        access_log=False    # El webhook ya registra cada request
     )
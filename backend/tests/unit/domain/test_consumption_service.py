@@ -4,16 +4,15 @@
 # Tests unitarios que DEBEN FALLAR primero (TDD Red Phase)
 # El servicio aún NO está completamente implementado, por lo que estos tests fallarán
 
+import asyncio
+from types import SimpleNamespace
+
 import pytest
 from unittest.mock import Mock, AsyncMock
 from datetime import datetime, timedelta
 
 # Import del servicio a testear
-from app.domain.services.subscription_consumption_service import (
-    SubscriptionConsumptionService,
-    ConsumptionVerificationResult,
-    ConsumptionResult
-)
+from app.domain.services.subscription_consumption_service import SubscriptionConsumptionService
 
 # Import de entidades
 from app.domain.entities.user import User
@@ -25,17 +24,15 @@ from app.domain.entities.subscription import (
 
 # Import de excepciones
 from app.domain.exceptions.consumption_exceptions import (
+    EXCEPTION_STATUS_CODES,
     InsufficientHoursException,
     UserNotFoundException,
     SubscriptionNotFoundException,
     InvalidConsumptionException
 )
 
-# Import de interfaces (mocks)
-from app.domain.repositories.subscription_repository import (
-    SubscriptionRepository,
-    UserRepository
-)
+# Fecha fija: las entidades de los fixtures se comparten por módulo y deben ser iguales en cada test
+FIXED_NOW = datetime(2024, 1, 1)
 
 
 class TestSubscriptionConsumptionService:
@@ -52,15 +49,26 @@ class TestSubscriptionConsumptionService:
     3. REFACTOR: Mejorar código manteniendo tests verdes
     """
     
+    # Stubs con solo los métodos que usa el servicio: sin la introspección de
+    # Mock(spec=...); los tests configuran return_value / side_effect
     @pytest.fixture
     def mock_subscription_repository(self):
         """🎭 Mock del repositorio de suscripciones."""
-        return Mock(spec=SubscriptionRepository)
+        return SimpleNamespace(
+            get_active_subscription_by_user_id=AsyncMock(),
+            begin_transaction=AsyncMock(),
+            update_subscription=AsyncMock(),
+            commit_transaction=AsyncMock(),
+            rollback_transaction=AsyncMock()
+        )
     
     @pytest.fixture
     def mock_user_repository(self):
         """👤 Mock del repositorio de usuarios."""
-        return Mock(spec=UserRepository)
+        return SimpleNamespace(
+            get_user_by_id=AsyncMock(),
+            get_users_with_active_subscriptions=AsyncMock()
+        )
     
     @pytest.fixture
     def consumption_service(self, mock_subscription_repository, mock_user_repository):
@@ -70,7 +78,7 @@ class TestSubscriptionConsumptionService:
             user_repository=mock_user_repository
         )
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def valid_user(self):
         """👤 Usuario válido para tests."""
         return User(
@@ -79,252 +87,317 @@ class TestSubscriptionConsumptionService:
             full_name="Test User",
             is_active=True,
             is_verified=True,
-            created_at=datetime.utcnow()
-        )
-    
-    @pytest.fixture
-    def active_subscription_with_hours(self):
-        """💰 Suscripción activa con horas disponibles."""
-        now = datetime.utcnow()
-        return Subscription(
-            id="sub-456",
-            user_id="user-123",
-            plan=SubscriptionPlan.PROFESSIONAL,
-            status=SubscriptionStatus.ACTIVE,
-            monthly_hours_limit=100.0,
-            available_hours=75.0,
-            consumed_hours=25.0,
-            monthly_price=99.99,
-            created_at=now,
-            current_period_start=now,
-            current_period_end=now + timedelta(days=30)
+            created_at=FIXED_NOW
         )
     
     # ========================================
     # 🔴 RED PHASE TESTS - DEBEN FALLAR
     # ========================================
     
-    @pytest.mark.asyncio
-    async def test_verificar_consumo_disponible_should_allow_when_user_has_sufficient_hours(
+    @pytest.mark.parametrize(
+        "required_hours, user_fixture, subscription_fixture, expected_exception, "
+        "expected_attributes, expected_message, expected_lookups",
+        [
+            pytest.param(
+                10.0, "valid_user", "active_subscription_with_hours", None,
+                {}, None, (1, 1),
+                id="allow_when_user_has_sufficient_hours"
+            ),
+            pytest.param(
+                100.0, "valid_user", "active_subscription_with_hours", InsufficientHoursException,
+                {"required_hours": 100.0, "available_hours": 75.0, "subscription_status": "active"},
+                "Insufficient hours", (1, 1),
+                id="insufficient_hours_when_not_enough"
+            ),
+            pytest.param(
+                10.0, None, None, UserNotFoundException,
+                {}, None, (1, 0),
+                id="user_not_found_when_user_missing"
+            ),
+            pytest.param(
+                10.0, "valid_user", None, SubscriptionNotFoundException,
+                {}, None, (1, 1),
+                id="subscription_not_found_when_no_active_subscription"
+            ),
+            pytest.param(
+                -5.0, None, None, InvalidConsumptionException,
+                {"invalid_hours": -5.0}, "positive", (0, 0),
+                id="invalid_consumption_for_negative_hours"
+            ),
+        ]
+    )
+    async def test_verificar_consumo_disponible(
         self,
+        request,
         consumption_service,
         mock_user_repository,
         mock_subscription_repository,
-        valid_user,
-        active_subscription_with_hours
+        required_hours,
+        user_fixture,
+        subscription_fixture,
+        expected_exception,
+        expected_attributes,
+        expected_message,
+        expected_lookups
     ):
         """
-        🔴 TDD RED: Test que define el comportamiento principal (DEBE FALLAR).
+        🔴 TDD RED: Reglas de verificación de consumo (RF8.0) en un único test parametrizado.
         
         COMPORTAMIENTO ESPERADO:
-        - Usuario válido con 75 horas disponibles
-        - Requiere 10 horas para procesamiento
-        - DEBE permitir el consumo
-        - DEBE retornar información completa del estado
-        
-        Este test FALLARÁ porque:
-        1. El servicio puede no estar completamente implementado
-        2. Los mocks necesitan configuración específica
-        3. La lógica de negocio puede tener bugs
+        - 75 horas disponibles y 10 requeridas: permite el consumo (quedan 65)
+        - 100 horas requeridas: InsufficientHoursException con el detalle del saldo
+        - Usuario inexistente: UserNotFoundException sin consultar suscripciones
+        - Sin suscripción activa: SubscriptionNotFoundException
+        - Horas negativas: InvalidConsumptionException sin acceder a los repositorios
         """
-        # ===== GIVEN (Preparar mocks y datos) =====
+        # ===== GIVEN =====
         user_id = "user-123"
-        required_hours = 10.0
+        user = request.getfixturevalue(user_fixture) if user_fixture else None
+        subscription = request.getfixturevalue(subscription_fixture) if subscription_fixture else None
         
-        # Configurar mocks para simular comportamiento exitoso
-        mock_user_repository.get_user_by_id = AsyncMock(return_value=valid_user)
-        mock_subscription_repository.get_active_subscription_by_user_id = AsyncMock(
-            return_value=active_subscription_with_hours
-        )
-        
-        # ===== WHEN (Ejecutar función bajo test) =====
-        result = await consumption_service.verificar_consumo_disponible(user_id, required_hours)
+        mock_user_repository.get_user_by_id.return_value = user
+        mock_subscription_repository.get_active_subscription_by_user_id.return_value = subscription
         
-        # ===== THEN (Verificar comportamiento esperado) =====
-        # 🎯 Verificaciones CRÍTICAS para RF8.0
-        assert result.can_consume is True, "Debe permitir consumo cuando hay horas suficientes"
-        assert result.user.id == user_id, "Debe retornar el usuario correcto"
-        assert result.subscription.id == "sub-456", "Debe retornar la suscripción correcta"
-        assert result.remaining_hours == 65.0, f"Debe calcular horas restantes: 75 - 10 = 65, got {result.remaining_hours}"
-        assert result.consumption_percentage > 0, "Debe calcular porcentaje de consumo"
+        # ===== WHEN & THEN =====
+        if expected_exception is None:
+            result = await consumption_service.verificar_consumo_disponible(user_id, required_hours)
+            
+            # 🎯 Verificaciones CRÍTICAS para RF8.0
+            assert result.can_consume is True, "Debe permitir consumo cuando hay horas suficientes"
+            assert result.user.id == user_id, "Debe retornar el usuario correcto"
+            assert result.subscription.id == "sub-456", "Debe retornar la suscripción correcta"
+            assert result.remaining_hours == 65.0, f"Debe calcular horas restantes: 75 - 10 = 65, got {result.remaining_hours}"
+            assert result.consumption_percentage > 0, "Debe calcular porcentaje de consumo"
+        else:
+            with pytest.raises(expected_exception) as exc_info:
+                await consumption_service.verificar_consumo_disponible(user_id, required_hours)
+            
+            # 🔍 Verificar detalles de la excepción
+            exception = exc_info.value
+            assert exception.user_id == user_id
+            for attribute, value in expected_attributes.items():
+                assert getattr(exception, attribute) == value
+            if expected_message:
+                assert expected_message in str(exception)
         
-        # 🔍 Verificar que se llamaron los métodos correctos (behavior verification)
-        mock_user_repository.get_user_by_id.assert_called_once_with(user_id)
-        mock_subscription_repository.get_active_subscription_by_user_id.assert_called_once_with(user_id)
+        # 🔍 Verificar qué repositorios se consultaron (behavior verification)
+        user_lookups, subscription_lookups = expected_lookups
+        assert mock_user_repository.get_user_by_id.await_count == user_lookups
+        assert mock_subscription_repository.get_active_subscription_by_user_id.await_count == subscription_lookups
+        if user_lookups:
+            assert mock_user_repository.get_user_by_id.call_args.args == (user_id,)
+        if subscription_lookups:
+            assert mock_subscription_repository.get_active_subscription_by_user_id.call_args.args == (user_id,)
     
-    @pytest.mark.asyncio
-    async def test_verificar_consumo_disponible_should_raise_insufficient_hours_when_not_enough(
+    async def test_verificar_consumo_disponible_bulk_should_resolve_all_users_in_one_call(
         self,
         consumption_service,
         mock_user_repository,
-        mock_subscription_repository,
         valid_user,
         active_subscription_with_hours
     ):
         """
-        🔴 TDD RED: Test para rechazo por horas insuficientes (DEBE FALLAR).
+        🔴 TDD RED: Verificación masiva con una sola consulta al repositorio.
         
         COMPORTAMIENTO ESPERADO:
-        - Usuario con 75 horas disponibles
-        - Requiere 100 horas (más de las disponibles)
-        - DEBE lanzar InsufficientHoursException
-        - DEBE incluir información detallada del error
+        - Un único acceso batch al repositorio para todos los usuarios
+        - Resultados en el mismo orden que la entrada
+        - Los rechazos se reportan por elemento sin romper el lote
         """
         # ===== GIVEN =====
-        user_id = "user-123"
-        required_hours = 100.0  # Más de las 75 disponibles
-        
-        mock_user_repository.get_user_by_id = AsyncMock(return_value=valid_user)
-        mock_subscription_repository.get_active_subscription_by_user_id = AsyncMock(
-            return_value=active_subscription_with_hours
-        )
+        mock_user_repository.get_users_with_active_subscriptions.return_value = {
+            "user-123": (valid_user, active_subscription_with_hours)
+        }
+        items = [
+            ("user-123", 10.0),
+            ("missing-user", 1.0),
+            ("user-123", 100.0),
+            ("user-123", 0.0),
+        ]
         
-        # ===== WHEN & THEN (Verificar que lanza excepción) =====
-        with pytest.raises(InsufficientHoursException) as exc_info:
-            await consumption_service.verificar_consumo_disponible(user_id, required_hours)
+        # ===== WHEN =====
+        results = await consumption_service.verificar_consumo_disponible_bulk(items)
         
-        # 🔍 Verificar detalles de la excepción
-        exception = exc_info.value
-        assert exception.user_id == user_id
-        assert exception.required_hours == required_hours
-        assert exception.available_hours == 75.0
-        assert exception.subscription_status == "active"
-        assert "Insufficient hours" in str(exception)
+        # ===== THEN =====
+        bulk_lookup = mock_user_repository.get_users_with_active_subscriptions
+        assert bulk_lookup.call_count == 1
+        assert bulk_lookup.call_args.args == (["user-123", "missing-user"],)
+        assert [r.user_id for r in results] == ["user-123", "missing-user", "user-123", "user-123"]
+        assert results[0].authorized is True
+        assert results[0].result.remaining_hours == 65.0
+        assert isinstance(results[1].error, UserNotFoundException)
+        assert isinstance(results[2].error, InsufficientHoursException)
+        assert isinstance(results[3].error, InvalidConsumptionException)
     
-    @pytest.mark.asyncio
-    async def test_verificar_consumo_disponible_should_raise_user_not_found_when_user_missing(
+    async def test_verificar_consumo_disponible_bulk_should_report_missing_subscription(
         self,
         consumption_service,
         mock_user_repository,
-        mock_subscription_repository
+        valid_user
     ):
         """
-        🔴 TDD RED: Test para usuario inexistente (DEBE FALLAR).
-        
-        COMPORTAMIENTO ESPERADO:
-        - Usuario que no existe en el sistema
-        - DEBE lanzar UserNotFoundException
-        - NO debe llamar al repositorio de suscripciones
+        🔴 TDD RED: Usuario sin suscripción activa dentro de un lote.
         """
         # ===== GIVEN =====
-        user_id = "non-existent-user"
-        required_hours = 10.0
-        
-        # Mock retorna None (usuario no encontrado)
-        mock_user_repository.get_user_by_id = AsyncMock(return_value=None)
-        
-        # ===== WHEN & THEN =====
-        with pytest.raises(UserNotFoundException) as exc_info:
-            await consumption_service.verificar_consumo_disponible(user_id, required_hours)
+        mock_user_repository.get_users_with_active_subscriptions.return_value = {"user-123": (valid_user, None)}
         
-        # 🔍 Verificar que no se llamó al repositorio de suscripciones
-        mock_subscription_repository.get_active_subscription_by_user_id.assert_not_called()
+        # ===== WHEN =====
+        results = await consumption_service.verificar_consumo_disponible_bulk([("user-123", 1.0)])
         
-        # 🔍 Verificar detalles de la excepción
-        exception = exc_info.value
-        assert exception.user_id == user_id
+        # ===== THEN =====
+        assert results[0].authorized is False
+        assert isinstance(results[0].error, SubscriptionNotFoundException)
+
     
-    @pytest.mark.asyncio
-    async def test_verificar_consumo_disponible_should_raise_subscription_not_found_when_no_active_subscription(
+    async def test_obtener_estado_consumo_should_report_without_raising_when_no_hours(
         self,
         consumption_service,
         mock_user_repository,
         mock_subscription_repository,
-        valid_user
+        valid_user,
+        subscription_with_no_hours
     ):
         """
-        🔴 TDD RED: Test para usuario sin suscripción activa (DEBE FALLAR).
+        🔴 TDD RED: Consulta de estado de solo lectura.
         
         COMPORTAMIENTO ESPERADO:
-        - Usuario válido pero sin suscripción activa
-        - DEBE lanzar SubscriptionNotFoundException
+        - Usuario sin horas disponibles
+        - NO debe lanzar InsufficientHoursException
+        - DEBE reportar can_consume=False y el estado actual
         """
         # ===== GIVEN =====
-        user_id = "user-123"
-        required_hours = 10.0
+        mock_user_repository.get_user_by_id.return_value = valid_user
+        mock_subscription_repository.get_active_subscription_by_user_id.return_value = subscription_with_no_hours
         
-        mock_user_repository.get_user_by_id = AsyncMock(return_value=valid_user)
-        # Mock retorna None (sin suscripción activa)
-        mock_subscription_repository.get_active_subscription_by_user_id = AsyncMock(return_value=None)
+        # ===== WHEN =====
+        estado = await consumption_service.obtener_estado_consumo("user-123")
         
-        # ===== WHEN & THEN =====
-        with pytest.raises(SubscriptionNotFoundException) as exc_info:
-            await consumption_service.verificar_consumo_disponible(user_id, required_hours)
-        
-        # 🔍 Verificar detalles de la excepción
-        exception = exc_info.value
-        assert exception.user_id == user_id
+        # ===== THEN =====
+        assert estado.can_consume is False
+        assert estado.remaining_hours == 0.0
+        assert estado.consumption_percentage == 100.0
+
     
-    @pytest.mark.asyncio
-    async def test_verificar_consumo_disponible_should_raise_invalid_consumption_for_negative_hours(
+    async def test_consumir_horas_should_record_audit_after_commit_without_blocking(
         self,
-        consumption_service,
         mock_user_repository,
-        mock_subscription_repository
+        mock_subscription_repository,
+        valid_user,
+        active_subscription_with_hours
     ):
         """
-        🔴 TDD RED: Test para validación de horas negativas (DEBE FALLAR).
+        🔴 TDD RED: La auditoría se ejecuta en segundo plano tras el commit.
+        """
+        # ===== GIVEN =====
+        audit_repository = Mock()
+        audit_repository.record_consumption = AsyncMock()
+        service = SubscriptionConsumptionService(
+            subscription_repository=mock_subscription_repository,
+            user_repository=mock_user_repository,
+            audit_repository=audit_repository
+        )
+        mock_user_repository.get_user_by_id.return_value = valid_user
+        mock_subscription_repository.get_active_subscription_by_user_id.return_value = active_subscription_with_hours
+        mock_subscription_repository.update_subscription.side_effect = lambda subscription: subscription
         
-        COMPORTAMIENTO ESPERADO:
-        - Horas requeridas negativas o cero
-        - DEBE lanzar InvalidConsumptionException
-        - NO debe acceder a los repositorios
+        # ===== WHEN =====
+        result = await service.consumir_horas("user-123", 5.0)
+        await asyncio.sleep(0)
+        
+        # ===== THEN =====
+        assert result.success is True
+        assert result.remaining_hours == 70.0
+        audit_repository.record_consumption.assert_awaited_once_with(
+            user_id="user-123",
+            subscription_id="sub-456",
+            hours_consumed=5.0,
+            description="Meeting processing"
+        )
+
+    
+    async def test_consumir_horas_should_not_rollback_when_audit_fails_after_commit(
+        self,
+        mock_user_repository,
+        mock_subscription_repository,
+        valid_user,
+        active_subscription_with_hours
+    ):
+        """
+        🔴 TDD RED: Un fallo síncrono de la auditoría no deshace un consumo confirmado.
         """
         # ===== GIVEN =====
-        user_id = "user-123"
-        invalid_hours = -5.0  # Horas negativas
+        audit_repository = Mock()
+        audit_repository.record_consumption = Mock(side_effect=RuntimeError("audit down"))
+        service = SubscriptionConsumptionService(
+            subscription_repository=mock_subscription_repository,
+            user_repository=mock_user_repository,
+            audit_repository=audit_repository
+        )
+        mock_user_repository.get_user_by_id.return_value = valid_user
+        mock_subscription_repository.get_active_subscription_by_user_id.return_value = active_subscription_with_hours
+        mock_subscription_repository.update_subscription.side_effect = lambda subscription: subscription
         
-        # ===== WHEN & THEN =====
-        with pytest.raises(InvalidConsumptionException) as exc_info:
-            await consumption_service.verificar_consumo_disponible(user_id, invalid_hours)
+        # ===== WHEN =====
+        result = await service.consumir_horas("user-123", 5.0)
         
-        # 🔍 Verificar que no se accedió a los repositorios
-        mock_user_repository.get_user_by_id.assert_not_called()
-        mock_subscription_repository.get_active_subscription_by_user_id.assert_not_called()
+        # ===== THEN =====
+        assert result.success is True
+        mock_subscription_repository.commit_transaction.assert_awaited_once()
+        mock_subscription_repository.rollback_transaction.assert_not_called()
+    
+    def test_exception_error_codes_should_come_from_registration(self):
+        """
+        🔴 TDD RED: El código de error se declara una vez, en @register_exception.
+        """
+        # ===== GIVEN / WHEN =====
+        error = UserNotFoundException("user-123")
         
-        # 🔍 Verificar detalles de la excepción
-        exception = exc_info.value
-        assert exception.user_id == user_id
-        assert exception.invalid_hours == invalid_hours
-        assert "positive" in exception.reason.lower()
-
+        # ===== THEN =====
+        assert error.error_code == "USER_NOT_FOUND"
+        assert EXCEPTION_STATUS_CODES[error.error_code] == 404
+        assert InsufficientHoursException("user-123", 5.0, 1.0).error_code == "INSUFFICIENT_HOURS"
 
 # ====================================
 # 🧪 TEST FIXTURES ADICIONALES
 # ====================================
 
-@pytest.fixture
-def subscription_with_no_hours():
-    """💸 Suscripción sin horas disponibles."""
-    now = datetime.utcnow()
+# Variantes de suscripción: (id, plan, status, límite mensual, disponibles, consumidas, precio)
+SUBSCRIPTION_VARIANTS = {
+    "active_hours": ("sub-456", SubscriptionPlan.PROFESSIONAL, SubscriptionStatus.ACTIVE, 100.0, 75.0, 25.0, 99.99),
+    "no_hours": ("sub-no-hours", SubscriptionPlan.BASIC, SubscriptionStatus.ACTIVE, 10.0, 0.0, 10.0, 29.99),
+    "suspended": ("sub-suspended", SubscriptionPlan.PROFESSIONAL, SubscriptionStatus.SUSPENDED, 100.0, 50.0, 50.0, 99.99),
+}
+
+
+def build_subscription(variant: str) -> Subscription:
+    """🏭 Construye la suscripción de ``SUBSCRIPTION_VARIANTS`` para ``user-123``."""
+    sub_id, plan, status, limit, available, consumed, price = SUBSCRIPTION_VARIANTS[variant]
     return Subscription(
-        id="sub-no-hours",
+        id=sub_id,
         user_id="user-123",
-        plan=SubscriptionPlan.BASIC,
-        status=SubscriptionStatus.ACTIVE,
-        monthly_hours_limit=10.0,
-        available_hours=0.0,  # Sin horas disponibles
-        consumed_hours=10.0,
-        monthly_price=29.99,
-        created_at=now,
-        current_period_start=now,
-        current_period_end=now + timedelta(days=30)
+        plan=plan,
+        status=status,
+        monthly_hours_limit=limit,
+        available_hours=available,
+        consumed_hours=consumed,
+        monthly_price=price,
+        created_at=FIXED_NOW,
+        current_period_start=FIXED_NOW,
+        current_period_end=FIXED_NOW + timedelta(days=30)
     )
 
-@pytest.fixture  
+
+@pytest.fixture(scope="module")
+def active_subscription_with_hours():
+    """💰 Suscripción activa con horas disponibles."""
+    return build_subscription("active_hours")
+
+@pytest.fixture(scope="module")
+def subscription_with_no_hours():
+    """💸 Suscripción sin horas disponibles."""
+    return build_subscription("no_hours")
+
+@pytest.fixture(scope="module")
 def suspended_subscription():
     """🚫 Suscripción suspendida."""
-    now = datetime.utcnow()
-    return Subscription(
-        id="sub-suspended",
-        user_id="user-123", 
-        plan=SubscriptionPlan.PROFESSIONAL,
-        status=SubscriptionStatus.SUSPENDED,  # Suspendida
-        monthly_hours_limit=100.0,
-        available_hours=50.0,
-        consumed_hours=50.0,
-        monthly_price=99.99,
-        created_at=now,
-        current_period_start=now,
-        current_period_end=now + timedelta(days=30)
-    )
\ No newline at end of file
+    return build_subscription("suspended")
@@ -3,13 +3,15 @@
 API principal para procesamiento de transcripciones y extracción de requisitos.
 """
 
+import asyncio
 import time
 from contextlib import asynccontextmanager
 from typing import Dict, Any
 
-from fastapi import FastAPI, HTTPException, status
+from fastapi import FastAPI, HTTPException, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
+import orjson
 import structlog
 
 from config import settings
@@ -17,19 +19,49 @@ from models import (
     TranscriptionResult,
     Requirement,
     PRD,
+    RequirementType,
+    RequirementPriority,
+    AssigneeRole,
     TranscriptionException,
     RequirementExtractionException
 )
 
+# Entorno resuelto una sola vez al importar
+_IS_DEV = settings.is_development()
+_IS_PROD = settings.is_production()
+
 # ================================================================================================
 # 🔍 LOGGING CONFIGURATION
 # ================================================================================================
+# La configuración por defecto de structlog incluye merge_contextvars: el contexto
+# de cada request se enlaza una sola vez con bind_contextvars en el endpoint
 logger = structlog.get_logger(__name__)
+bind_contextvars = structlog.contextvars.bind_contextvars
+clear_contextvars = structlog.contextvars.clear_contextvars
 
 
 # ================================================================================================
 # 🚀 LIFESPAN EVENTS - Startup y Shutdown
 # ================================================================================================
+def _load_spacy_model():
+    """
+    ✅ Carga el modelo spaCy (import incluido) fuera del event loop.
+    
+    Returns:
+        Pipeline de spaCy, o None si spaCy o el modelo no están instalados
+    """
+    try:
+        import spacy
+        # Solo tokenizer + tagger: la extracción no usa parser, NER ni lematizador
+        return spacy.load(
+            settings.spacy_model,
+            disable=["parser", "ner", "lemmatizer", "attribute_ruler"]
+        )
+    except (ImportError, OSError) as e:
+        logger.warning("spacy_model_unavailable", model=settings.spacy_model, error=str(e))
+        return None
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
@@ -53,10 +85,18 @@ async def lifespan(app: FastAPI):
     )
     
     try:
-        # TODO: Inicializar servicios
-        # - Cargar modelo spaCy
-        # - Inicializar clientes (Deepgram, OpenAI)
-        # - Verificar conexiones
+        # Parte estática del health check, construida una sola vez
+        app.state.health_base = {
+            "status": "healthy",
+            "service": settings.app_name,
+            "version": settings.app_version,
+            "environment": settings.environment
+        }
+        
+        # Modelo spaCy cargado una sola vez por proceso, fuera del event loop
+        app.state.nlp = await asyncio.to_thread(_load_spacy_model)
+        
+        # TODO: Verificar conexiones
         
         logger.info(
             "application_startup_completed",
@@ -92,8 +132,9 @@ app = FastAPI(
     version=settings.app_version,
     description="Módulo de IA/NLP para procesamiento de transcripciones y extracción de requisitos",
     lifespan=lifespan,
-    docs_url="/docs" if settings.is_development() else None,
-    redoc_url="/redoc" if settings.is_development() else None
+    default_response_class=ORJSONResponse,
+    docs_url="/docs" if _IS_DEV else None,
+    redoc_url="/redoc" if _IS_DEV else None
 )
 
 
@@ -104,22 +145,36 @@ app = FastAPI(
 # CORS Middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"] if settings.is_development() else ["http://localhost:3000"],
+    allow_origins=["*"] if _IS_DEV else ["http://localhost:3000"],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["Authorization", "Content-Type"],
 )
 
 
+@app.middleware("http")
+async def add_process_time(request: Request, call_next):
+    """
+    ✅ Processing Time - Mide cada request una sola vez (header X-Processing-Time).
+    """
+    start = time.perf_counter()
+    response = await call_next(request)
+    response.headers["X-Processing-Time"] = f"{time.perf_counter() - start:.6f}"
+    return response
+
+
 # ================================================================================================
 # 📊 HEALTH CHECK ENDPOINTS
 # ================================================================================================
 
+# Respuesta constante del liveness probe (ya serializada, no se construye por request)
+_ALIVE_BYTES = b'{"alive":true}'
+
 @app.get(
     "/health",
     tags=["Health"],
     summary="Health check endpoint",
-    response_model=Dict[str, Any]
+    response_class=ORJSONResponse
 )
 async def health_check():
     """
@@ -128,13 +183,7 @@ async def health_check():
     Returns:
         dict: Estado del servicio y sus dependencias
     """
-    return {
-        "status": "healthy",
-        "service": settings.app_name,
-        "version": settings.app_version,
-        "environment": settings.environment,
-        "timestamp": time.time()
-    }
+    return ORJSONResponse({**app.state.health_base, "timestamp": time.time()})
 
 
 @app.get(
@@ -143,10 +192,12 @@ async def health_check():
     summary="Readiness probe",
     response_model=Dict[str, bool]
 )
-async def readiness_check():
+async def readiness_check(response: Response):
     """
     ✅ Readiness Check - Verifica si el servicio está listo para recibir tráfico.
     
+    ``ready`` se deriva de los recursos cargados: sin modelo spaCy responde 503.
+    
     Returns:
         dict: Estado de preparación del servicio
     """
@@ -154,14 +205,15 @@ async def readiness_check():
         # TODO: Verificar dependencias críticas
         # - Conexión a Deepgram API
         # - Conexión a OpenAI API
-        # - Modelo spaCy cargado
-        
-        return {
-            "ready": True,
+        checks = {
             "deepgram_api": True,  # TODO: Verificar real
             "openai_api": True,    # TODO: Verificar real
-            "spacy_model": True    # TODO: Verificar real
+            "spacy_model": getattr(app.state, "nlp", None) is not None
         }
+        ready = all(checks.values())
+        if not ready:
+            response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        return {"ready": ready, **checks}
     except Exception as e:
         logger.error("readiness_check_failed", error=str(e))
         raise HTTPException(
@@ -174,7 +226,7 @@ async def readiness_check():
     "/health/live",
     tags=["Health"],
     summary="Liveness probe",
-    response_model=Dict[str, bool]
+    response_class=Response
 )
 async def liveness_check():
     """
@@ -183,7 +235,7 @@ async def liveness_check():
     Returns:
         dict: Estado de vida del servicio
     """
-    return {"alive": True}
+    return Response(content=_ALIVE_BYTES, media_type="application/json")
 
 
 # ================================================================================================
@@ -214,14 +266,11 @@ async def transcribe_audio(
     Raises:
         HTTPException: Si falla la transcripción
     """
-    start_time = time.time()
+    clear_contextvars()
+    bind_contextvars(meeting_url=meeting_url, language=language)
     
     try:
-        logger.info(
-            "transcription_started",
-            meeting_url=meeting_url,
-            language=language
-        )
+        logger.info("transcription_started")
         
         # TODO: Implementar lógica de transcripción
         # 1. Validar URL
@@ -238,12 +287,8 @@ async def transcribe_audio(
             words_count=15
         )
         
-        processing_time = time.time() - start_time
-        
         logger.info(
             "transcription_completed",
-            meeting_url=meeting_url,
-            processing_time_seconds=processing_time,
             words_count=mock_transcription.words_count
         )
         
@@ -255,14 +300,12 @@ async def transcribe_audio(
                 "confidence": mock_transcription.confidence,
                 "duration_seconds": mock_transcription.duration_seconds,
                 "words_count": mock_transcription.words_count
-            },
-            "processing_time_seconds": processing_time
+            }
         }
         
     except TranscriptionException as e:
         logger.error(
             "transcription_failed",
-            meeting_url=meeting_url,
             error=str(e),
             exc_info=True
         )
@@ -273,7 +316,6 @@ async def transcribe_audio(
     except Exception as e:
         logger.error(
             "transcription_error",
-            meeting_url=meeting_url,
             error=str(e),
             exc_info=True
         )
@@ -287,6 +329,36 @@ async def transcribe_audio(
 # 📝 API ENDPOINTS - REQUIREMENT EXTRACTION (RF3.0, RF4.0)
 # ================================================================================================
 
+# MOCK Response: requisitos construidos y serializados una sola vez al importar
+_MOCK_REQUIREMENTS = [
+    Requirement(
+        id="req-1",
+        description="Implementar autenticación de usuarios con JWT",
+        type=RequirementType.FUNCTIONAL,
+        priority=RequirementPriority.P0,
+        assignee_role=AssigneeRole.BACKEND_DEVELOPER,
+        keywords=["autenticación", "JWT", "usuarios"],
+        confidence_score=0.92
+    ),
+    Requirement(
+        id="req-2",
+        description="Crear dashboard responsive para visualización de datos",
+        type=RequirementType.FUNCTIONAL,
+        priority=RequirementPriority.P1,
+        assignee_role=AssigneeRole.FRONTEND_DEVELOPER,
+        keywords=["dashboard", "responsive", "UI"],
+        confidence_score=0.88
+    )
+]
+_MOCK_REQUIREMENTS_COUNT = len(_MOCK_REQUIREMENTS)
+_MOCK_REQUIREMENTS_BODY = orjson.dumps({
+    "status": "success",
+    "data": {
+        "requirements": [req.to_dict() for req in _MOCK_REQUIREMENTS],
+        "total_requirements": _MOCK_REQUIREMENTS_COUNT
+    }
+})
+
 @app.post(
     "/api/v1/extract-requirements",
     tags=["Requirements"],
@@ -311,14 +383,14 @@ async def extract_requirements(
     Raises:
         HTTPException: Si falla la extracción
     """
-    start_time = time.time()
+    clear_contextvars()
+    bind_contextvars(
+        text_length=len(transcription_text),
+        extract_assignees=extract_assignees
+    )
     
     try:
-        logger.info(
-            "requirement_extraction_started",
-            text_length=len(transcription_text),
-            extract_assignees=extract_assignees
-        )
+        logger.info("requirement_extraction_started")
         
         # TODO: Implementar lógica de extracción
         # 1. Usar OpenAI GPT-4 o spaCy según configuración
@@ -327,45 +399,12 @@ async def extract_requirements(
         # 4. Aplicar Strategy Pattern para algoritmos intercambiables
         
         # MOCK Response por ahora
-        from models import RequirementType, RequirementPriority, AssigneeRole
-        
-        mock_requirements = [
-            Requirement(
-                id="req-1",
-                description="Implementar autenticación de usuarios con JWT",
-                type=RequirementType.FUNCTIONAL,
-                priority=RequirementPriority.P0,
-                assignee_role=AssigneeRole.BACKEND_DEVELOPER,
-                keywords=["autenticación", "JWT", "usuarios"],
-                confidence_score=0.92
-            ),
-            Requirement(
-                id="req-2",
-                description="Crear dashboard responsive para visualización de datos",
-                type=RequirementType.FUNCTIONAL,
-                priority=RequirementPriority.P1,
-                assignee_role=AssigneeRole.FRONTEND_DEVELOPER,
-                keywords=["dashboard", "responsive", "UI"],
-                confidence_score=0.88
-            )
-        ]
-        
-        processing_time = time.time() - start_time
-        
         logger.info(
             "requirement_extraction_completed",
-            requirements_count=len(mock_requirements),
-            processing_time_seconds=processing_time
+            requirements_count=_MOCK_REQUIREMENTS_COUNT
         )
         
-        return {
-            "status": "success",
-            "data": {
-                "requirements": [req.to_dict() for req in mock_requirements],
-                "total_requirements": len(mock_requirements)
-            },
-            "processing_time_seconds": processing_time
-        }
+        return Response(content=_MOCK_REQUIREMENTS_BODY, media_type="application/json")
         
     except RequirementExtractionException as e:
         logger.error(
@@ -425,14 +464,11 @@ async def generate_prd(
     Raises:
         HTTPException: Si falla la generación del PRD
     """
-    start_time = time.time()
+    clear_contextvars()
+    bind_contextvars(meeting_id=meeting_id, meeting_url=meeting_url)
     
     try:
-        logger.info(
-            "prd_generation_started",
-            meeting_id=meeting_id,
-            meeting_url=meeting_url
-        )
+        logger.info("prd_generation_started")
         
         # TODO: Implementar flujo completo
         # 1. Transcribir
@@ -441,13 +477,7 @@ async def generate_prd(
         # 4. Asignar tareas
         
         # MOCK Response por ahora
-        processing_time = time.time() - start_time
-        
-        logger.info(
-            "prd_generation_completed",
-            meeting_id=meeting_id,
-            processing_time_seconds=processing_time
-        )
+        logger.info("prd_generation_completed")
         
         return {
             "status": "success",
@@ -458,14 +488,12 @@ async def generate_prd(
                 "requirements_count": 2,
                 "tasks_count": 2,
                 "complexity_level": "LOW"
-            },
-            "processing_time_seconds": processing_time
+            }
         }
         
     except Exception as e:
         logger.error(
             "prd_generation_error",
-            meeting_id=meeting_id,
             error=str(e),
             exc_info=True
         )
@@ -485,6 +513,12 @@ if __name__ == "__main__":
         "app:app",
         host=settings.host,
         port=settings.port,
-        reload=settings.is_development(),
-        log_level=settings.log_level.lower()
+        loop="uvloop",
+        http="httptools",
+        reload=_IS_DEV,
+        # reload y workers son excluyentes en uvicorn
+        workers=None if _IS_DEV else settings.workers,
+        log_level=settings.log_level.lower(),
+        # En producción el middleware X-Processing-Time cubre el access log
+        access_log=not _IS_PROD
     )
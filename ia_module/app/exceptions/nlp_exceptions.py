@@ -3,7 +3,8 @@
 # ================================================================================================
 # Excepciones de dominio para el módulo de procesamiento de lenguaje natural
 
-from typing import Optional, List
+from functools import cached_property
+from typing import Optional, List, Tuple
 
 
 class NLPDomainException(Exception):
@@ -12,12 +13,31 @@ class NLPDomainException(Exception):
     
     Representa violaciones de reglas de negocio específicas del procesamiento
     de lenguaje natural que no deben tratarse como errores técnicos.
+    
+    Con ``message_args`` el mensaje es una plantilla %-style que solo se
+    formatea al leer ``message`` (o ``str(exc)``) por primera vez.
     """
     
-    def __init__(self, message: str, error_code: Optional[str] = None):
+    def __init__(
+        self,
+        message: str,
+        error_code: Optional[str] = None,
+        message_args: Tuple = ()
+    ):
         super().__init__(message)
-        self.message = message
+        self._message_template = message
+        self._message_args = message_args
         self.error_code = error_code or "NLP_DOMAIN_ERROR"
+    
+    @cached_property
+    def message(self) -> str:
+        """Mensaje final, formateado bajo demanda."""
+        if not self._message_args:
+            return self._message_template
+        return self._message_template % self._message_args
+    
+    def __str__(self) -> str:
+        return self.message
 
 
 class InvalidTranscriptionException(NLPDomainException):
@@ -52,9 +72,10 @@ class ProcessingFailedException(NLPDomainException):
         message: str,
         meeting_id: str = "",
         processing_stage: str = "unknown",
-        original_exception: Optional[Exception] = None
+        original_exception: Optional[Exception] = None,
+        message_args: Tuple = ()
     ):
-        super().__init__(message, "PROCESSING_FAILED")
+        super().__init__(message, "PROCESSING_FAILED", message_args)
         self.meeting_id = meeting_id
         self.processing_stage = processing_stage
         self.original_exception = original_exception
@@ -239,32 +260,55 @@ def create_processing_error(
     """
     🏭 Factory function para crear excepción de procesamiento.
     
-    Simplifica la creación de excepciones con contexto completo.
+    Simplifica la creación de excepciones con contexto completo. El mensaje
+    (incluido el repr del contexto) se formatea solo si se llega a leer.
     """
-    context_str = f" Context: {context}" if context else ""
-    message = f"Processing failed at stage '{stage}': {str(original_error)}{context_str}"
+    if context:
+        message = "Processing failed at stage '%s': %s Context: %s"
+        message_args = (stage, original_error, context)
+    else:
+        message = "Processing failed at stage '%s': %s"
+        message_args = (stage, original_error)
     
     return ProcessingFailedException(
         message=message,
         meeting_id=meeting_id,
         processing_stage=stage,
-        original_exception=original_error
+        original_exception=original_error,
+        message_args=message_args
     )
 
 
+# Errores que admiten reintento
+RECOVERABLE_ERRORS = (
+    APITimeout,
+    ModelLoadException,
+    ConfigurationException
+)
+
+
 def is_recoverable_error(exception: Exception) -> bool:
     """
     🔄 Determinar si un error es recuperable.
     
     Ayuda a decidir si se debe reintentar el procesamiento o fallar completamente.
     """
-    recoverable_errors = [
-        APITimeout,
-        ModelLoadException,
-        ConfigurationException
-    ]
-    
-    return any(isinstance(exception, error_type) for error_type in recoverable_errors)
+    return isinstance(exception, RECOVERABLE_ERRORS)
+
+
+# Mensajes para el usuario final por error_code
+USER_FRIENDLY_MESSAGES = {
+    "INVALID_TRANSCRIPTION": "La transcripción proporcionada está vacía o es demasiado corta para procesar.",
+    "PROCESSING_FAILED": "Ocurrió un error durante el procesamiento. Por favor, inténtelo nuevamente.",
+    "REQUIREMENT_EXTRACTION_FAILED": "No se pudieron extraer requisitos de esta transcripción. Verifique que contenga información técnica relevante.",
+    "TASK_ASSIGNMENT_FAILED": "Se extrajeron los requisitos pero no se pudieron asignar tareas automáticamente.",
+    "LANGUAGE_DETECTION_FAILED": "No se pudo detectar el idioma de la transcripción o el idioma no está soportado.",
+    "MODEL_LOAD_FAILED": "Error técnico en el sistema de procesamiento. Contacte al administrador.",
+    "INSUFFICIENT_DATA": "La transcripción es muy breve para realizar un análisis completo. Proporcione más contenido.",
+    "API_TIMEOUT": "El procesamiento está tardando más de lo esperado. Intente con una transcripción más corta.",
+    "PRIORITY_DETECTION_FAILED": "Se extrajeron los requisitos pero no se pudieron determinar las prioridades automáticamente."
+}
+DEFAULT_USER_FRIENDLY_MESSAGE = "Ocurrió un error inesperado durante el procesamiento."
 
 
 def get_user_friendly_message(exception: NLPDomainException) -> str:
@@ -273,19 +317,4 @@ def get_user_friendly_message(exception: NLPDomainException) -> str:
     
     Convierte excepciones técnicas en mensajes comprensibles para usuarios.
     """
-    user_messages = {
-        "INVALID_TRANSCRIPTION": "La transcripción proporcionada está vacía o es demasiado corta para procesar.",
-        "PROCESSING_FAILED": "Ocurrió un error durante el procesamiento. Por favor, inténtelo nuevamente.",
-        "REQUIREMENT_EXTRACTION_FAILED": "No se pudieron extraer requisitos de esta transcripción. Verifique que contenga información técnica relevante.",
-        "TASK_ASSIGNMENT_FAILED": "Se extrajeron los requisitos pero no se pudieron asignar tareas automáticamente.",
-        "LANGUAGE_DETECTION_FAILED": "No se pudo detectar el idioma de la transcripción o el idioma no está soportado.",
-        "MODEL_LOAD_FAILED": "Error técnico en el sistema de procesamiento. Contacte al administrador.",
-        "INSUFFICIENT_DATA": "La transcripción es muy breve para realizar un análisis completo. Proporcione más contenido.",
-        "API_TIMEOUT": "El procesamiento está tardando más de lo esperado. Intente con una transcripción más corta.",
-        "PRIORITY_DETECTION_FAILED": "Se extrajeron los requisitos pero no se pudieron determinar las prioridades automáticamente."
-    }
-    
-    return user_messages.get(
-        exception.error_code,
-        "Ocurrió un error inesperado durante el procesamiento."
-    )
\ No newline at end of file
+    return USER_FRIENDLY_MESSAGES.get(exception.error_code, DEFAULT_USER_FRIENDLY_MESSAGE)
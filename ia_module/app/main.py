@@ -5,7 +5,7 @@
 
 from fastapi import FastAPI, HTTPException, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from contextlib import asynccontextmanager
 import logging
@@ -113,9 +113,7 @@ async def lifespan(app: FastAPI):
     logger.info("🤖 Starting IA/NLP Microservice")
     logger.info("📋 RF3.0 + RF4.0: Requirement Extraction & Task Assignment")
     
-    # TODO: Inicializar modelos NLP pesados aquí
-    # await load_spacy_models()
-    # await load_transformers_models()
+    # NLPProcessor es rule-based: no hay modelos spaCy que cargar en el arranque
     
     yield
     
@@ -164,7 +162,8 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # ================================================================================================
@@ -174,14 +173,8 @@ app = FastAPI(
 # CORS - Configuración para permitir llamadas del orquestador
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[
-        "http://localhost:3000",        # Frontend local (si aplica)
-        "http://localhost:8000",        # Backend local
-        "http://localhost:8002",        # Gatekeeper service
-        "https://n8n.company.com",      # n8n workflows
-        "https://make.com",             # Make.com workflows
-        "*"                             # Temporal para desarrollo
-    ],
+    # Frontend local (3000), backend local (8000), Gatekeeper (8002) y orquestadores n8n/Make
+    allow_origin_regex=r"^(http://localhost:(3000|8000|8002)|https://(n8n\.company\.com|make\.com))$",
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE"],
     allow_headers=["*"],
@@ -195,11 +188,15 @@ async def log_nlp_requests(request: Request, call_next):
     
     Crítico para monitoreo de performance y debugging de IA.
     """
-    start_time = time.time()
+    start = time.perf_counter()
+    # Hora de recepción reutilizada por los exception handlers
+    request.state.received_at = time.time()
     
     # Log de request NLP
     logger.info(
-        f"🤖 NLP Request: {request.method} {request.url.path}",
+        "🤖 NLP Request: %s %s",
+        request.method,
+        request.url.path,
         extra={
             "method": request.method,
             "path": request.url.path,
@@ -212,12 +209,14 @@ async def log_nlp_requests(request: Request, call_next):
     response = await call_next(request)
     
     # Calcular tiempo de procesamiento (crítico para NLP)
-    process_time = time.time() - start_time
+    process_time = time.perf_counter() - start
     
     # Log específico para operaciones NLP
     if "process" in request.url.path:
         logger.info(
-            f"🧠 NLP Processing: {response.status_code} ({process_time:.3f}s)",
+            "🧠 NLP Processing: %s (%.3fs)",
+            response.status_code,
+            process_time,
             extra={
                 "status_code": response.status_code,
                 "processing_time_seconds": process_time,
@@ -236,6 +235,25 @@ async def log_nlp_requests(request: Request, call_next):
 # 🚨 EXCEPTION HANDLERS
 # ================================================================================================
 
+def _received_at(request: Request) -> float:
+    """Hora de recepción fijada por el middleware (o la actual si no pasó por él)."""
+    return getattr(request.state, "received_at", None) or time.time()
+
+
+# Mapeo específico de errores NLP a códigos HTTP
+NLP_ERROR_STATUS = {
+    "INVALID_TRANSCRIPTION": status.HTTP_400_BAD_REQUEST,
+    "PROCESSING_FAILED": status.HTTP_500_INTERNAL_SERVER_ERROR,
+    "REQUIREMENT_EXTRACTION_FAILED": status.HTTP_422_UNPROCESSABLE_ENTITY,
+    "TASK_ASSIGNMENT_FAILED": status.HTTP_422_UNPROCESSABLE_ENTITY,
+    "LANGUAGE_DETECTION_FAILED": status.HTTP_422_UNPROCESSABLE_ENTITY,
+    "MODEL_LOAD_FAILED": status.HTTP_503_SERVICE_UNAVAILABLE,
+    "INSUFFICIENT_DATA": status.HTTP_400_BAD_REQUEST,
+    "API_TIMEOUT": status.HTTP_408_REQUEST_TIMEOUT,
+    "PRIORITY_DETECTION_FAILED": status.HTTP_422_UNPROCESSABLE_ENTITY
+}
+
+
 @app.exception_handler(NLPDomainException)
 async def nlp_domain_exception_handler(request: Request, exc: NLPDomainException):
     """
@@ -244,7 +262,9 @@ async def nlp_domain_exception_handler(request: Request, exc: NLPDomainException
     Convierte excepciones técnicas en respuestas comprensibles.
     """
     logger.warning(
-        f"🚨 NLP Domain Exception: {exc.error_code} - {exc.message}",
+        "🚨 NLP Domain Exception: %s - %s",
+        exc.error_code,
+        exc,
         extra={
             "error_code": exc.error_code,
             "message": exc.message,
@@ -253,26 +273,13 @@ async def nlp_domain_exception_handler(request: Request, exc: NLPDomainException
         }
     )
     
-    # Mapeo específico de errores NLP
-    status_mapping = {
-        "INVALID_TRANSCRIPTION": status.HTTP_400_BAD_REQUEST,
-        "PROCESSING_FAILED": status.HTTP_500_INTERNAL_SERVER_ERROR,
-        "REQUIREMENT_EXTRACTION_FAILED": status.HTTP_422_UNPROCESSABLE_ENTITY,
-        "TASK_ASSIGNMENT_FAILED": status.HTTP_422_UNPROCESSABLE_ENTITY,
-        "LANGUAGE_DETECTION_FAILED": status.HTTP_422_UNPROCESSABLE_ENTITY,
-        "MODEL_LOAD_FAILED": status.HTTP_503_SERVICE_UNAVAILABLE,
-        "INSUFFICIENT_DATA": status.HTTP_400_BAD_REQUEST,
-        "API_TIMEOUT": status.HTTP_408_REQUEST_TIMEOUT,
-        "PRIORITY_DETECTION_FAILED": status.HTTP_422_UNPROCESSABLE_ENTITY
-    }
-    
-    return JSONResponse(
-        status_code=status_mapping.get(exc.error_code, status.HTTP_400_BAD_REQUEST),
+    return ORJSONResponse(
+        status_code=NLP_ERROR_STATUS.get(exc.error_code, status.HTTP_400_BAD_REQUEST),
         content={
             "error": exc.error_code,
             "message": exc.message,
             "user_friendly_message": get_user_friendly_message(exc),
-            "timestamp": time.time(),
+            "timestamp": _received_at(request),
             "service": "ia-nlp-microservice"
         }
     )
@@ -284,7 +291,8 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     ✅ Handler para errores de validación de requests NLP.
     """
     logger.warning(
-        f"❌ NLP Request Validation Error: {request.url.path}",
+        "❌ NLP Request Validation Error: %s",
+        request.url.path,
         extra={
             "path": request.url.path,
             "errors": exc.errors(),
@@ -292,13 +300,13 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
         }
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "error": "VALIDATION_ERROR",
             "message": "Invalid request data for NLP processing",
             "details": exc.errors(),
-            "timestamp": time.time(),
+            "timestamp": _received_at(request),
             "service": "ia-nlp-microservice"
         }
     )
@@ -312,7 +320,8 @@ async def general_exception_handler(request: Request, exc: Exception):
     CRÍTICO: Errores en IA pueden afectar toda la funcionalidad del sistema.
     """
     logger.error(
-        f"💥 Unexpected NLP Error: {str(exc)}",
+        "💥 Unexpected NLP Error: %s",
+        exc,
         extra={
             "path": request.url.path,
             "error_type": type(exc).__name__,
@@ -322,12 +331,12 @@ async def general_exception_handler(request: Request, exc: Exception):
         exc_info=True
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "error": "INTERNAL_NLP_ERROR",
             "message": "An unexpected error occurred in NLP processing",
-            "timestamp": time.time(),
+            "timestamp": _received_at(request),
             "service": "ia-nlp-microservice"
         }
     )
@@ -383,7 +392,8 @@ async def procesar_transcripcion_nlp(request: ProcessingRequest) -> ProcessingRe
     try:
         # Log del inicio del procesamiento
         logger.info(
-            f"🧠 Starting NLP processing for meeting {request.meeting_id}",
+            "🧠 Starting NLP processing for meeting %s",
+            request.meeting_id,
             extra={
                 "meeting_id": request.meeting_id,
                 "text_length": len(request.transcription_text),
@@ -392,12 +402,13 @@ async def procesar_transcripcion_nlp(request: ProcessingRequest) -> ProcessingRe
             }
         )
         
-        # Procesamiento principal
-        result = nlp_processor.procesar_transcripcion(request)
+        # Procesamiento principal (en un hilo, sin bloquear el event loop)
+        result = await nlp_processor.procesar_transcripcion_async(request)
         
         # Log del resultado
         logger.info(
-            f"✅ NLP processing completed for meeting {request.meeting_id}",
+            "✅ NLP processing completed for meeting %s",
+            request.meeting_id,
             extra={
                 "meeting_id": request.meeting_id,
                 "success": result.success,
@@ -422,7 +433,9 @@ async def procesar_transcripcion_nlp(request: ProcessingRequest) -> ProcessingRe
     except Exception as e:
         # Log del error y re-raise para exception handler general
         logger.error(
-            f"💥 Unexpected error processing meeting {request.meeting_id}: {str(e)}",
+            "💥 Unexpected error processing meeting %s: %s",
+            request.meeting_id,
+            e,
             extra={
                 "meeting_id": request.meeting_id,
                 "error_type": type(e).__name__,
@@ -452,13 +465,14 @@ async def procesar_transcripcion_async(request: ProcessingRequest) -> Processing
     Para transcripciones muy largas o cuando se requiere procesamiento no bloqueante.
     """
     try:
-        logger.info(f"🚀 Starting async NLP processing for meeting {request.meeting_id}")
+        logger.info("🚀 Starting async NLP processing for meeting %s", request.meeting_id)
         
         # Procesamiento asíncrono
         result = await nlp_processor.procesar_transcripcion_async(request)
         
         logger.info(
-            f"✅ Async NLP processing completed for meeting {request.meeting_id}",
+            "✅ Async NLP processing completed for meeting %s",
+            request.meeting_id,
             extra={
                 "meeting_id": request.meeting_id,
                 "processing_mode": "async",
@@ -471,7 +485,9 @@ async def procesar_transcripcion_async(request: ProcessingRequest) -> Processing
         
     except Exception as e:
         logger.error(
-            f"💥 Async processing error for meeting {request.meeting_id}: {str(e)}",
+            "💥 Async processing error for meeting %s: %s",
+            request.meeting_id,
+            e,
             exc_info=True
         )
         raise e
@@ -3,6 +3,7 @@
 # ================================================================================================
 # Servicio principal que implementa la lógica de procesamiento NLP
 
+import asyncio
 import time
 import re
 from typing import List, Dict, Optional, Protocol
@@ -389,9 +390,8 @@ class NLPProcessor:
     
     async def procesar_transcripcion_async(self, request: ProcessingRequest) -> ProcessingResult:
         """🟢 GREEN - Versión asíncrona del procesamiento"""
-        # Para la fase GREEN, simplemente llamamos a la versión síncrona
-        # En REFACTOR se implementará procesamiento verdaderamente asíncrono
-        return self.procesar_transcripcion(request)
+        # El procesamiento es CPU-bound: se ejecuta en un hilo para no bloquear el event loop
+        return await asyncio.to_thread(self.procesar_transcripcion, request)
     
     def _validate_request(self, request: ProcessingRequest) -> None:
         """Validar request de procesamiento"""
@@ -481,4 +481,4 @@ class NLPProcessor:
         # Ajustar confianza basada en número de requisitos encontrados
         requirement_count_factor = min(len(requirements) / 5, 1.0)
         
-        return avg_confidence * requirement_count_factor
\ No newline at end of file
+        return avg_confidence * requirement_count_factor
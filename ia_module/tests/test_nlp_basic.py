@@ -3,6 +3,8 @@
 # ================================================================================================
 # Test simplificado para confirmar que el ciclo TDD está completo
 
+import threading
+
 import pytest
 from app.services.nlp_processor import NLPProcessor
 from app.models.nlp_models import ProcessingRequest, RequirementType, DeveloperRole
@@ -128,5 +130,34 @@ class TestNLPBasicFunctionality:
         assigned_roles = {task.assigned_role for task in result.assigned_tasks}
         assert len(assigned_roles) >= 1  # Al menos un rol fue asignado
 
+    @pytest.mark.asyncio
+    async def test_async_processing_runs_off_the_event_loop_thread(self):
+        """🟢 GREEN: El procesamiento asíncrono se ejecuta en un hilo aparte"""
+        # Given
+        processor = NLPProcessor()
+        worker_threads = []
+        original_process = processor.procesar_transcripcion
+        
+        def recording_process(request):
+            worker_threads.append(threading.get_ident())
+            return original_process(request)
+        
+        processor.procesar_transcripcion = recording_process
+        request = ProcessingRequest(
+            transcription_text="""
+            Necesitamos implementar una API backend para usuarios.
+            También crear una interfaz frontend responsive.
+            """,
+            meeting_id="async-thread-test",
+            language="es"
+        )
+        
+        # When
+        result = await processor.procesar_transcripcion_async(request)
+        
+        # Then
+        assert result.meeting_id == "async-thread-test"
+        assert worker_threads and worker_threads[0] != threading.get_ident()
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
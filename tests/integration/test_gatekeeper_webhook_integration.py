@@ -4,7 +4,10 @@
 # Tests que verifican la integración completa entre Gatekeeper y n8n webhook
 
 import pytest
+import asyncio
 import json
+import httpx
+import orjson
 from unittest.mock import AsyncMock, Mock, patch
 from httpx import Response
 from datetime import datetime
@@ -13,8 +16,11 @@ from backend.app.api.v1.consumption_router import ProcessStartRequest, ProcessSt
 from backend.app.services.webhook_trigger import (
     WebhookTrigger, 
     WebhookPayload, 
+    WebhookResponse,
     WebhookStatus,
-    create_webhook_trigger
+    WebhookBatcher,
+    create_webhook_trigger,
+    reset_circuit_breakers
 )
 from backend.app.domain.value_objects.consumption_response import ConsumptionVerificationResponse
 
@@ -68,6 +74,25 @@ class TestGatekeeperWebhookIntegration:
         assert payload.consumption_callback_url == callback_url
         assert payload.workflow_trigger_id == processing_id
     
+    def test_payload_helper_should_not_instantiate_webhook_trigger(
+        self, sample_gatekeeper_request, sample_authorization_response
+    ):
+        """GREEN: Test para construir el payload sin crear un WebhookTrigger (ni cliente HTTP)"""
+        from backend.app.services.webhook_trigger import create_webhook_payload_from_gatekeeper_data
+        
+        # When
+        with patch.object(WebhookTrigger, "__init__", side_effect=AssertionError("no trigger")):
+            payload = create_webhook_payload_from_gatekeeper_data(
+                request=sample_gatekeeper_request,
+                authorization_response=sample_authorization_response,
+                processing_id="proc-1",
+                callback_url="/api/v1/consumption/process/update",
+                callback_base_url="http://gatekeeper:8002"
+            )
+        
+        # Then
+        assert payload.status_callback_url == "http://gatekeeper:8002/api/v1/workflow/status"
+    
     @pytest.mark.asyncio
     async def test_should_trigger_webhook_successfully_with_mock_n8n(self):
         """GREEN: Test para disparar webhook exitosamente con n8n mock"""
@@ -84,6 +109,7 @@ class TestGatekeeperWebhookIntegration:
         }
         mock_response.text = '{"success": true}'
         mock_response.content = b'{"success": true}'
+        mock_response.headers = {"content-type": "application/json"}
         
         # Patch HTTP client
         with patch.object(webhook_trigger.http_client, 'post', return_value=mock_response) as mock_post:
@@ -111,9 +137,9 @@ class TestGatekeeperWebhookIntegration:
             
             # Verify HTTP call was made correctly
             mock_post.assert_called_once()
-            call_args = mock_post.call_args
-            assert call_args[1]["json"]["user_id"] == "user-123"
-            assert call_args[1]["json"]["transcription_text"] == "Test transcription"
+            sent_data = orjson.loads(mock_post.call_args[1]["content"])
+            assert sent_data["user_id"] == "user-123"
+            assert sent_data["transcription_text"] == "Test transcription"
     
     @pytest.mark.asyncio
     async def test_should_handle_webhook_failure_with_retries(self):
@@ -127,6 +153,7 @@ class TestGatekeeperWebhookIntegration:
         mock_response.json.return_value = {"error": "Service temporarily unavailable"}
         mock_response.text = 'Service temporarily unavailable'
         mock_response.content = b'Service temporarily unavailable'
+        mock_response.headers = {"content-type": "text/plain"}
         
         with patch.object(webhook_trigger.http_client, 'post', return_value=mock_response) as mock_post:
             
@@ -150,6 +177,163 @@ class TestGatekeeperWebhookIntegration:
             
             # Verify retries (development environment = 2 retries)
             assert mock_post.call_count == 2
+            
+            # Misma Idempotency-Key en cada reintento para que n8n deduplique
+            sent_headers = [call[1]["headers"] for call in mock_post.call_args_list]
+            assert {h["Idempotency-Key"] for h in sent_headers} == {payload.workflow_trigger_id}
+            assert [h["X-Attempt"] for h in sent_headers] == ["1", "2"]
+    
+    @pytest.mark.asyncio
+    async def test_should_trigger_many_webhooks_concurrently_with_partial_failures(self):
+        """GREEN: Test para trigger_many (allSettled: un fallo no envenena el lote)"""
+        # Given
+        webhook_trigger = create_webhook_trigger(environment="development")
+        webhook_trigger.configure_webhook_url("https://test-n8n.com/webhook/process-meeting")
+        payloads = [
+            WebhookPayload(
+                user_id="user-123",
+                meeting_id=f"meeting-{i}",
+                meeting_url="https://meet.google.com/test",
+                transcription_text="Test transcription",
+                workflow_trigger_id=f"trigger-{i}"
+            )
+            for i in range(3)
+        ]
+        ok_response = WebhookResponse(
+            status=WebhookStatus.SENT, webhook_trigger_id="ok", http_status_code=200
+        )
+        
+        async def fake_trigger(payload, webhook_url=None):
+            if payload.meeting_id == "meeting-1":
+                raise RuntimeError("boom")
+            return ok_response
+        
+        with patch.object(webhook_trigger, 'trigger_n8n_workflow', side_effect=fake_trigger):
+            # When
+            responses = await webhook_trigger.trigger_many(payloads, concurrency=2)
+        
+        # Then
+        assert [r.status for r in responses] == [
+            WebhookStatus.SENT, WebhookStatus.FAILED, WebhookStatus.SENT
+        ]
+        assert responses[1].webhook_trigger_id == "trigger-1"
+        assert "boom" in responses[1].error_message
+    
+    @pytest.mark.asyncio
+    async def test_should_coalesce_payloads_into_batched_requests(self):
+        """GREEN: Test para trigger_batch (un POST por lote y fan-out de resultados)"""
+        # Given
+        webhook_trigger = create_webhook_trigger(environment="development")
+        webhook_trigger.configure_webhook_url("https://test-n8n.com/webhook/process-meeting")
+        payloads = [
+            WebhookPayload(
+                user_id="user-123",
+                meeting_id=f"meeting-{i}",
+                meeting_url="https://meet.google.com/test",
+                transcription_text="Test transcription",
+                workflow_trigger_id=f"trigger-{i}"
+            )
+            for i in range(3)
+        ]
+        
+        async def fake_post(url, content=None, headers=None, timeout=None):
+            events = orjson.loads(content)["events"]
+            # trigger-1 no aparece en la respuesta de n8n
+            results = [
+                {"workflow_trigger_id": e["workflow_trigger_id"], "status": "sent"}
+                for e in events if e["workflow_trigger_id"] != "trigger-1"
+            ]
+            return httpx.Response(
+                200,
+                content=orjson.dumps({"results": results}),
+                headers={"content-type": "application/json"}
+            )
+        
+        with patch.object(webhook_trigger.http_client, 'post', side_effect=fake_post) as mock_post:
+            # When
+            responses = await webhook_trigger.trigger_batch(payloads, max_batch=2)
+        
+        # Then
+        assert mock_post.call_count == 2
+        headers = [call.kwargs["headers"] for call in mock_post.call_args_list]
+        assert all(h["Idempotency-Key"].startswith("batch-") for h in headers)
+        assert headers[0]["Idempotency-Key"] != headers[1]["Idempotency-Key"]
+        assert [r.webhook_trigger_id for r in responses] == ["trigger-0", "trigger-1", "trigger-2"]
+        assert [r.status for r in responses] == [
+            WebhookStatus.SENT, WebhookStatus.FAILED, WebhookStatus.SENT
+        ]
+        assert responses[1].error_message == "Event missing from batch response"
+    
+    @pytest.mark.asyncio
+    async def test_batch_should_fail_fast_when_circuit_is_open(self):
+        """GREEN: Test para que los lotes respeten el circuit breaker del host"""
+        # Given - Lotes que fallan con 503 hasta abrir el breaker
+        webhook_trigger = create_webhook_trigger(environment="development")
+        webhook_trigger.configure_webhook_url("https://test-n8n.com/webhook/batch-breaker")
+        payloads = [
+            WebhookPayload(
+                user_id="user-123",
+                meeting_id="meeting-1",
+                meeting_url="https://meet.google.com/test",
+                transcription_text="Test transcription"
+            )
+        ]
+        unavailable = httpx.Response(503, content=b"Service Unavailable")
+        
+        with patch.object(webhook_trigger.http_client, 'post', return_value=unavailable) as mock_post:
+            # When
+            for _ in range(3):
+                await webhook_trigger.trigger_batch(payloads)
+            calls_before_open = mock_post.call_count
+            responses = await webhook_trigger.trigger_batch(payloads)
+        
+        # Then
+        assert responses[0].error_message == "circuit_open"
+        assert mock_post.call_count == calls_before_open
+    
+    @pytest.mark.asyncio
+    async def test_batcher_close_should_fail_payloads_in_coalescing_window(self):
+        """GREEN: Test para close() con un lote aún en formación (ningún submit queda colgado)"""
+        # Given - Ventana de agrupación larga: el lote no llega a enviarse
+        webhook_trigger = create_webhook_trigger(environment="development")
+        webhook_trigger.configure_webhook_url("https://test-n8n.com/webhook/process-meeting")
+        batcher = WebhookBatcher(webhook_trigger, max_batch=10, max_wait_ms=60_000)
+        payload = WebhookPayload(
+            user_id="user-123",
+            meeting_id="meeting-1",
+            meeting_url="https://meet.google.com/test",
+            transcription_text="Test transcription",
+            workflow_trigger_id="trigger-1"
+        )
+        
+        with patch.object(webhook_trigger.http_client, 'post') as mock_post:
+            submitted = asyncio.create_task(batcher.submit(payload))
+            await asyncio.sleep(0.01)  # El worker ya sacó el payload de la cola
+            
+            # When
+            await batcher.close()
+            response = await asyncio.wait_for(submitted, timeout=1)
+        
+        # Then
+        mock_post.assert_not_called()
+        assert response.status == WebhookStatus.FAILED
+        assert response.webhook_trigger_id == "trigger-1"
+    
+    def test_default_workflow_trigger_ids_should_be_unique(self):
+        """GREEN: Test para Idempotency-Key única aunque se creen payloads en el mismo segundo"""
+        # Given / When
+        payloads = [
+            WebhookPayload(
+                user_id="user-123",
+                meeting_id=f"meeting-{i}",
+                meeting_url="https://meet.google.com/test",
+                transcription_text="Test transcription"
+            )
+            for i in range(50)
+        ]
+        
+        # Then
+        assert len({p.workflow_trigger_id for p in payloads}) == len(payloads)
     
     def test_webhook_payload_to_dict_contains_all_required_fields(self):
         """GREEN: Test para verificar que el payload contiene todos los campos necesarios para n8n"""
@@ -192,6 +376,86 @@ class TestGatekeeperWebhookIntegration:
         assert "triggered_at" in payload_dict
         assert isinstance(payload_dict["triggered_at"], str)  # ISO format
     
+    def test_webhook_payload_should_omit_callbacks_when_not_configured(self):
+        """GREEN: Test para payload compacto (slots, sin callbacks vacíos)"""
+        # Given
+        payload = WebhookPayload(
+            user_id="user-123",
+            meeting_id="meeting-456",
+            meeting_url="https://meet.google.com/test-meeting",
+            transcription_text="Test transcription content"
+        )
+        
+        # When
+        payload_dict = payload.to_dict()
+        
+        # Then
+        assert "callbacks" not in payload_dict
+        assert "nlp_service_url" in payload_dict["services"]
+        assert not hasattr(payload, "__dict__")
+    
+    def test_webhook_payload_json_body_should_be_serialized_once(self):
+        """GREEN: Test para el cuerpo orjson memoizado entre reintentos"""
+        # Given
+        payload = WebhookPayload(
+            user_id="user-123",
+            meeting_id="meeting-456",
+            meeting_url="https://meet.google.com/test-meeting",
+            transcription_text="Test transcription content"
+        )
+        
+        # When
+        first_body = payload.to_json_bytes()
+        second_body = payload.to_json_bytes()
+        
+        # Then
+        assert first_body is second_body
+        assert orjson.loads(first_body) == payload.to_dict()
+    
+    def test_should_bound_and_type_check_n8n_response_body(self):
+        """GREEN: Test para no procesar cuerpos enormes ni JSON sin Content-Type JSON"""
+        from backend.app.services.webhook_trigger import MAX_RESPONSE_BYTES
+        
+        # Given
+        oversized = Response(
+            200,
+            content=b"x" * (MAX_RESPONSE_BYTES + 1),
+            headers={"content-type": "application/json"}
+        )
+        plain_text = Response(200, content=b'{"looks": "json"}', headers={"content-type": "text/plain"})
+        json_body = Response(200, content=b'{"success": true}', headers={"content-type": "application/json"})
+        
+        # When / Then
+        assert WebhookTrigger._parse_response_body(oversized)["truncated"] is True
+        assert WebhookTrigger._parse_response_body(plain_text) == {"raw_response": '{"looks": "json"}'}
+        assert WebhookTrigger._parse_response_body(json_body) == {"success": True}
+    
+    def test_webhook_response_success_flag_is_precomputed(self):
+        """GREEN: Test para is_successful (SENT + 2xx) calculado al construir"""
+        # Given / When
+        sent = WebhookResponse(status=WebhookStatus.SENT, webhook_trigger_id="t", http_status_code=204)
+        no_code = WebhookResponse(status=WebhookStatus.SENT, webhook_trigger_id="t")
+        failed = WebhookResponse(status=WebhookStatus.FAILED, webhook_trigger_id="t", http_status_code=200)
+        
+        # Then
+        assert sent.is_successful() is True
+        assert no_code.is_successful() is False
+        assert failed.is_successful() is False
+    
+    def test_webhook_response_should_use_slots_and_lazy_sent_at(self):
+        """GREEN: Test para WebhookResponse sin __dict__ y sent_at derivado del epoch"""
+        # Given
+        before = datetime.utcnow().replace(microsecond=0)
+        
+        # When
+        response = WebhookResponse(status=WebhookStatus.SENT, webhook_trigger_id="t")
+        
+        # Then
+        assert not hasattr(response, "__dict__")
+        assert isinstance(response.sent_at, datetime)
+        assert response.sent_at.tzinfo is None
+        assert response.sent_at >= before
+    
     @pytest.mark.asyncio 
     async def test_should_handle_no_webhook_url_configured(self):
         """GREEN: Test para manejo de webhook no configurado"""
@@ -232,6 +496,47 @@ class TestGatekeeperWebhookIntegration:
         assert unknown_trigger.timeout_seconds == 30
         assert unknown_trigger.max_retries == 2
     
+    def test_webhook_triggers_should_share_pooled_http_client(self):
+        """GREEN: Test para reutilizar el pool HTTP entre triggers (keep-alive)"""
+        # Given
+        injected_client = Mock()
+        
+        # When
+        dev_trigger = create_webhook_trigger(environment="development")
+        prod_trigger = create_webhook_trigger(environment="production")
+        injected_trigger = WebhookTrigger(http_client=injected_client)
+        
+        # Then
+        assert dev_trigger.http_client is prod_trigger.http_client
+        assert injected_trigger.http_client is injected_client
+        assert prod_trigger.timeout.read == 60
+    
+    @pytest.mark.asyncio
+    async def test_should_post_to_precompiled_webhook_url(self):
+        """GREEN: Test para reutilizar la URL parseada en cada envío"""
+        # Given
+        webhook_trigger = create_webhook_trigger(environment="development")
+        webhook_trigger.configure_webhook_url("https://test-n8n.com/webhook/process-meeting")
+        payload = WebhookPayload(
+            user_id="user-123",
+            meeting_id="meeting-456",
+            meeting_url="https://meet.google.com/test",
+            transcription_text="Test transcription"
+        )
+        
+        with patch.object(
+            webhook_trigger.http_client, 'post',
+            return_value=httpx.Response(200, content=b"")
+        ) as mock_post:
+            # When
+            await webhook_trigger.trigger_workflow(payload)
+        
+        # Then
+        posted_url = mock_post.call_args[0][0]
+        assert isinstance(posted_url, httpx.URL)
+        assert posted_url is webhook_trigger._parsed_url
+        assert posted_url.host == "test-n8n.com"
+    
     @pytest.mark.asyncio
     async def test_integration_complete_gatekeeper_to_webhook_flow(self):
         """REFACTOR: Test de integración completa del flujo Gatekeeper → Webhook"""
@@ -264,6 +569,7 @@ class TestGatekeeperWebhookIntegration:
         }
         mock_response.text = '{"success": true}'
         mock_response.content = b'{"success": true}'
+        mock_response.headers = {"content-type": "application/json"}
         
         # Create webhook trigger
         webhook_trigger = create_webhook_trigger(environment="development")
@@ -296,7 +602,7 @@ class TestGatekeeperWebhookIntegration:
             
             # Verify n8n received correct data structure
             mock_post.assert_called_once()
-            sent_data = mock_post.call_args[1]["json"]
+            sent_data = orjson.loads(mock_post.call_args[1]["content"])
             
             # Verify all critical data was sent to n8n
             assert sent_data["user_id"] == "user-123"
@@ -313,7 +619,59 @@ class TestGatekeeperWebhookIntegration:
             # Verify service URLs for n8n
             assert "nlp_service_url" in sent_data["services"]
             assert "gatekeeper_service_url" in sent_data["services"]
+    
+    @pytest.mark.asyncio
+    async def test_aiohttp_client_should_return_httpx_response(self):
+        """GREEN: Test para el cliente aiohttp del hot path (misma respuesta que httpx)"""
+        pytest.importorskip("aiohttp")
+        from backend.app.services.webhook_trigger import AiohttpWebhookClient
+        
+        # Given - Sesión aiohttp simulada (cuerpo servido en streaming)
+        session, _ = _mock_aiohttp_session(
+            [b'{"success": ', b'true}'], content_type="application/json"
+        )
+        
+        webhook_trigger = WebhookTrigger(
+            n8n_webhook_url="https://test-n8n.com/webhook/aiohttp",
+            http_client=AiohttpWebhookClient(session)
+        )
+        payload = WebhookPayload(
+            user_id="user-123",
+            meeting_id="meeting-456",
+            meeting_url="https://meet.google.com/test",
+            transcription_text="Test transcription"
+        )
+        
+        # When
+        response = await webhook_trigger.trigger_workflow(payload)
+        
+        # Then
+        assert response.is_successful()
+        assert response.response_data == {"success": True}
+        assert orjson.loads(session.post.call_args[1]["data"])["meeting_id"] == "meeting-456"
 
+    
+    @pytest.mark.asyncio
+    async def test_aiohttp_client_should_stop_reading_oversized_bodies(self):
+        """GREEN: Test para el tope de lectura del cliente aiohttp (MAX_RESPONSE_BYTES)"""
+        pytest.importorskip("aiohttp")
+        from backend.app.services.webhook_trigger import (
+            AiohttpWebhookClient, MAX_RESPONSE_BYTES
+        )
+        
+        # Given - Cuerpo cuatro veces mayor que el tope, en trozos de 8 KiB
+        chunk = b"x" * 8192
+        chunks = [chunk] * (4 * MAX_RESPONSE_BYTES // len(chunk))
+        session, consumed = _mock_aiohttp_session(chunks, content_type="text/plain")
+        client = AiohttpWebhookClient(session)
+        
+        # When
+        response = await client.post("https://test-n8n.com/webhook/aiohttp", content=b"{}")
+        
+        # Then - Se deja de leer al superar el tope y el cuerpo queda acotado
+        assert len(response.content) == MAX_RESPONSE_BYTES + 1
+        assert len(consumed) < len(chunks)
+        assert WebhookTrigger._parse_response_body(response)["truncated"] is True
 
 class TestWebhookTriggerCircuitBreaker:
     """✅ Tests específicos para tolerancia a fallos (RNF5.0)"""
@@ -329,6 +687,7 @@ class TestWebhookTriggerCircuitBreaker:
         mock_response.status_code = 500
         mock_response.text = "Internal Server Error"
         mock_response.content = b"Internal Server Error"
+        mock_response.headers = {"content-type": "text/plain"}
         
         # Mock sleep para verificar backoff
         with patch('asyncio.sleep') as mock_sleep, \
@@ -348,8 +707,175 @@ class TestWebhookTriggerCircuitBreaker:
             
             # Then - Verify exponential backoff
             # Development environment: max_retries = 2, retry_delay = 1.0
-            # Expected delays: 1.0 * 1 = 1.0 second
-            mock_sleep.assert_called_once_with(1.0)
+            # Expected delays: 1.0 * 2^0 = 1.0 second, con jitter [0.5, 1.5)
+            mock_sleep.assert_called_once()
+            assert 0.5 <= mock_sleep.call_args[0][0] < 1.5
+    
+    def test_backoff_should_grow_exponentially_up_to_max_delay(self):
+        """GREEN: Test para el backoff exponencial acotado (jitter neutralizado)"""
+        # Given
+        webhook_trigger = WebhookTrigger(retry_delay_seconds=1.0, max_delay_seconds=5.0)
+        
+        # When
+        with patch('random.uniform', return_value=1.0):
+            delays = [webhook_trigger._backoff_delay(attempt) for attempt in range(1, 6)]
+        
+        # Then
+        assert delays == [1.0, 2.0, 4.0, 5.0, 5.0]
+    
+    @pytest.mark.asyncio
+    async def test_should_honor_retry_after_header_on_rate_limit(self):
+        """GREEN: Test para respetar Retry-After de n8n (429) en el backoff"""
+        # Given
+        webhook_trigger = create_webhook_trigger(environment="development")
+        
+        rate_limited = Response(
+            429,
+            content=b"Too Many Requests",
+            headers={"content-type": "text/plain", "retry-after": "7"}
+        )
+        
+        with patch('asyncio.sleep') as mock_sleep, \
+             patch.object(webhook_trigger.http_client, 'post', return_value=rate_limited) as mock_post:
+            
+            payload = WebhookPayload(
+                user_id="user-123",
+                meeting_id="meeting-456",
+                meeting_url="https://meet.google.com/test",
+                transcription_text="Test transcription"
+            )
+            
+            webhook_trigger.configure_webhook_url("https://test-n8n.com/webhook/rate-limited")
+            
+            # When
+            response = await webhook_trigger.trigger_workflow(payload)
+            
+            # Then - 429 es recuperable y la espera no baja del Retry-After
+            assert response.retry_after_seconds == 7.0
+            assert mock_post.call_count == 2
+            mock_sleep.assert_called_once_with(7.0)
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("error, expected_calls", [
+        (httpx.ConnectError("connection refused"), 5),
+        (httpx.UnsupportedProtocol("unknown scheme"), 1),
+        (httpx.InvalidURL("bad url"), 1),
+    ])
+    async def test_should_only_retry_transient_transport_errors(self, error, expected_calls):
+        """GREEN: Test para fallar rápido ante errores de configuración (URL inválida)"""
+        # Given
+        webhook_trigger = create_webhook_trigger(environment="production")
+        
+        with patch('asyncio.sleep'), \
+             patch.object(webhook_trigger.http_client, 'post', side_effect=error) as mock_post:
+            
+            payload = WebhookPayload(
+                user_id="user-123",
+                meeting_id="meeting-456",
+                meeting_url="https://meet.google.com/test",
+                transcription_text="Test transcription"
+            )
+            
+            webhook_trigger.configure_webhook_url("https://test-n8n.com/webhook/transport")
+            
+            # When
+            response = await webhook_trigger.trigger_workflow(payload)
+            
+            # Then
+            assert response.status == WebhookStatus.FAILED
+            assert mock_post.call_count == expected_calls
+    
+    @pytest.mark.asyncio
+    async def test_should_open_circuit_after_consecutive_failures(self):
+        """GREEN: Test para fallar rápido con n8n caído (sin reintentos ni backoff)"""
+        # Given
+        webhook_trigger = create_webhook_trigger(environment="development")
+        webhook_trigger.configure_webhook_url("https://test-n8n.com/webhook/outage")
+        payload = WebhookPayload(
+            user_id="user-123",
+            meeting_id="meeting-456",
+            meeting_url="https://meet.google.com/test",
+            transcription_text="Test transcription"
+        )
+        
+        with patch('asyncio.sleep'), \
+             patch.object(
+                 webhook_trigger.http_client, 'post',
+                 side_effect=httpx.ConnectError("connection refused")
+             ) as mock_post:
+            
+            # When - 3 envíos agotan sus reintentos y el 4º no sale
+            for _ in range(3):
+                await webhook_trigger.trigger_workflow(payload)
+            calls_before_open = mock_post.call_count
+            response = await webhook_trigger.trigger_workflow(payload)
+            
+            # Then
+            assert response.status == WebhookStatus.FAILED
+            assert response.error_message == "circuit_open"
+            assert mock_post.call_count == calls_before_open
+    
+    @pytest.mark.asyncio
+    async def test_should_propagate_cancellation_during_backoff(self):
+        """GREEN: Test para que wait_for vea un timeout (no un FAILED) si vence durante el backoff"""
+        # Given - 503 recuperable y backoff de segundos
+        webhook_trigger = create_webhook_trigger(environment="development")
+        webhook_trigger.configure_webhook_url("https://test-n8n.com/webhook/cancelled")
+        unavailable = Response(503, content=b"Service Unavailable")
+        payload = WebhookPayload(
+            user_id="user-123",
+            meeting_id="meeting-456",
+            meeting_url="https://meet.google.com/test",
+            transcription_text="Test transcription"
+        )
+        
+        with patch.object(webhook_trigger.http_client, 'post', return_value=unavailable) as mock_post:
+            # When / Then
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(webhook_trigger.trigger_workflow(payload), timeout=0.05)
+        
+        assert mock_post.call_count == 1
+    
+    def test_should_parse_retry_after_http_date(self):
+        """GREEN: Test para Retry-After en formato HTTP-date"""
+        from backend.app.services.webhook_trigger import _parse_retry_after
+        
+        assert _parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0  # Ya pasada
+        assert _parse_retry_after("not-a-date") is None
+        assert _parse_retry_after(None) is None
+    
+    @pytest.mark.asyncio
+    async def test_should_not_retry_unrecoverable_client_errors(self):
+        """GREEN: Test para no reintentar 4xx irrecuperables (p.ej. 404)"""
+        # Given
+        webhook_trigger = create_webhook_trigger(environment="production")
+        
+        mock_response = Mock(spec=Response)
+        mock_response.status_code = 404
+        mock_response.text = "Not Found"
+        mock_response.content = b"Not Found"
+        mock_response.headers = {"content-type": "text/plain"}
+        mock_response.json.side_effect = json.JSONDecodeError("Expecting value", "Not Found", 0)
+        
+        with patch('asyncio.sleep') as mock_sleep, \
+             patch.object(webhook_trigger.http_client, 'post', return_value=mock_response) as mock_post:
+            
+            payload = WebhookPayload(
+                user_id="user-123",
+                meeting_id="meeting-456",
+                meeting_url="https://meet.google.com/test",
+                transcription_text="Test transcription"
+            )
+            
+            webhook_trigger.configure_webhook_url("https://test-n8n.com/webhook/missing")
+            
+            # When
+            response = await webhook_trigger.trigger_workflow(payload)
+            
+            # Then - Un único intento, sin esperas
+            assert response.http_status_code == 404
+            assert mock_post.call_count == 1
+            mock_sleep.assert_not_called()
     
     @pytest.mark.asyncio
     async def test_should_timeout_after_configured_seconds(self):
@@ -395,6 +921,13 @@ def sample_gatekeeper_request():
         language="es"
     )
 
+@pytest.fixture(autouse=True)
+def closed_circuit_breakers():
+    """Fixture que cierra los breakers (estado de proceso) entre tests"""
+    reset_circuit_breakers()
+    yield
+    reset_circuit_breakers()
+
 @pytest.fixture
 def sample_authorization_response():
     """Fixture con respuesta típica de autorización"""
@@ -419,4 +952,24 @@ def mock_successful_n8n_response():
     }
     mock_response.text = '{"success": true}'
     mock_response.content = b'{"success": true}'
-    return mock_response
\ No newline at end of file
+    mock_response.headers = {"content-type": "application/json"}
+    return mock_response
+
+
+def _mock_aiohttp_session(chunks, content_type, status=200):
+    """Sesión aiohttp simulada cuyo cuerpo se sirve con content.iter_chunked."""
+    consumed = []
+    
+    async def iter_chunked(size):
+        for chunk in chunks:
+            consumed.append(chunk)
+            yield chunk
+    
+    aiohttp_response = Mock()
+    aiohttp_response.status = status
+    aiohttp_response.headers = {"Content-Type": content_type}
+    aiohttp_response.content.iter_chunked = iter_chunked
+    session = Mock()
+    session.post.return_value.__aenter__ = AsyncMock(return_value=aiohttp_response)
+    session.post.return_value.__aexit__ = AsyncMock(return_value=False)
+    return session, consumed
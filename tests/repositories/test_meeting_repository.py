@@ -9,9 +9,13 @@ from datetime import datetime
 from unittest.mock import Mock
 from uuid import uuid4
 
+from sqlalchemy import event
+
 # Imports ajustados para Docker (PYTHONPATH=/app)
-from app.models import Meeting, MeetingStatus
+from app.models import Meeting, MeetingStatus, PRD, Task
 from app.repositories.meeting_repository import MeetingRepository
+from app.repositories.prd_repository import PRDRepository
+from app.repositories.read_cache import TTLCache
 from app.database import DatabaseSessionManager
 
 
@@ -57,6 +61,29 @@ class TestMeetingRepositoryACID:
         assert saved_meeting.user_id == meeting.user_id
         assert saved_meeting.status == MeetingStatus.PENDING
     
+    def test_should_save_meeting_with_a_single_insert(self, meeting_repository, db_manager):
+        """🔴 RED - Test para save sin SELECT de refresh cuando no hay valores de BD."""
+        # Given
+        statements = []
+        event.listen(
+            db_manager.engine,
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *args: statements.append(statement)
+        )
+        meeting = Meeting(
+            id=f"meeting-{uuid4().hex[:8]}",
+            meeting_url="https://meet.google.com/single-insert",
+            user_id="user-123"
+        )
+        
+        # When
+        saved = meeting_repository.save(meeting)
+        
+        # Then
+        assert [s.split()[0] for s in statements] == ["INSERT"]
+        assert saved.created_at is not None
+        assert saved.status == MeetingStatus.PENDING
+    
     def test_should_rollback_on_save_error(self, meeting_repository, db_manager):
         """
         🔴 RED - Test para ATOMICITY en caso de error.
@@ -114,6 +141,33 @@ class TestMeetingRepositoryACID:
         assert "meeting_url is required" in str(exc_info.value).lower() or \
                "user_id is required" in str(exc_info.value).lower()
     
+    def test_should_normalize_text_fields_on_assignment(self, meeting_repository):
+        """🔴 RED - Test para la normalización (strip) en el modelo."""
+        # Given
+        meeting = Meeting(
+            id=f"meeting-{uuid4().hex[:8]}",
+            meeting_url="  https://meet.google.com/padded  ",
+            user_id=" user-123 "
+        )
+        
+        # When
+        saved = meeting_repository.save(meeting)
+        
+        # Then
+        assert saved.meeting_url == "https://meet.google.com/padded"
+        assert saved.user_id == "user-123"
+    
+    def test_should_reject_non_http_meeting_url(self, meeting_repository):
+        """🔴 RED - Test para URLs sin esquema http(s)://."""
+        meeting = Meeting(
+            id=f"meeting-{uuid4().hex[:8]}",
+            meeting_url="httpmeet.google.com/abc",
+            user_id="user-123"
+        )
+        
+        with pytest.raises(ValueError, match="valid URL"):
+            meeting_repository.save(meeting)
+    
     def test_should_maintain_referential_integrity(self, meeting_repository):
         """
         🔴 RED - Test para CONSISTENCY de integridad referencial.
@@ -266,6 +320,57 @@ class TestMeetingRepositoryACID:
         assert len(user_meetings) == 2
         assert all(m.user_id == user_id for m in user_meetings)
     
+    def test_should_paginate_and_stream_meetings_by_user(self, meeting_repository):
+        """🔴 RED - Test para limit/offset y streaming con yield_per."""
+        # Given
+        meetings = [
+            Meeting(
+                id=f"meeting-{i}-{uuid4().hex[:8]}",
+                meeting_url=f"https://meet.google.com/page-{i}",
+                user_id="user-page",
+                status=MeetingStatus.PENDING,
+                created_at=datetime(2024, 1, i + 1)
+            )
+            for i in range(5)
+        ]
+        meeting_repository.save_many(meetings)
+        
+        # When
+        page = meeting_repository.get_by_user_id("user-page", limit=2, offset=2)
+        streamed = list(meeting_repository.iter_by_user_id("user-page", batch=2))
+        
+        # Then
+        assert [m.id for m in page] == [meetings[2].id, meetings[3].id]
+        assert [m.id for m in streamed] == [m.id for m in meetings]
+    
+    def test_should_stream_user_meetings_inside_a_transaction(
+        self, meeting_repository, db_manager
+    ):
+        """🔴 RED - yield_per usa cursor de servidor: no puede ir en AUTOCOMMIT."""
+        # Given
+        meeting_repository.save(Meeting(
+            id=f"meeting-{uuid4().hex[:8]}",
+            meeting_url="https://meet.google.com/stream",
+            user_id="user-stream",
+            status=MeetingStatus.PENDING
+        ))
+        isolation_levels = []
+        
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            isolation_levels.append(conn.get_execution_options().get("isolation_level"))
+        
+        event.listen(db_manager.engine, "before_cursor_execute", capture)
+        
+        # When
+        try:
+            streamed = list(meeting_repository.iter_by_user_id("user-stream"))
+        finally:
+            event.remove(db_manager.engine, "before_cursor_execute", capture)
+        
+        # Then
+        assert len(streamed) == 1
+        assert isolation_levels and "AUTOCOMMIT" not in isolation_levels
+    
     def test_should_update_meeting_status(self, meeting_repository):
         """🔴 RED - Test para UPDATE de estado."""
         # Given
@@ -285,7 +390,27 @@ class TestMeetingRepositoryACID:
         
         # Then
         assert updated.status == MeetingStatus.PROCESSING
-        assert updated.processing_started_at is not None
+        assert isinstance(updated.processing_started_at, datetime)
+    
+    def test_domain_transitions_should_stamp_readable_datetimes(self, meeting_repository):
+        """🔴 RED - Test para timestamps de dominio legibles antes y después de guardar."""
+        # Given
+        meeting = Meeting(
+            id=f"meeting-{uuid4().hex[:8]}",
+            meeting_url="https://meet.google.com/transitions",
+            user_id="user-123",
+            status=MeetingStatus.PENDING
+        )
+        
+        # When
+        meeting.mark_as_processing()
+        meeting.mark_as_completed()
+        
+        # Then
+        assert isinstance(meeting.processing_started_at, datetime)
+        assert isinstance(meeting.processing_completed_at, datetime)
+        saved = meeting_repository.save(meeting)
+        assert saved.processing_completed_at >= saved.processing_started_at
     
     def test_should_delete_meeting(self, meeting_repository):
         """🔴 RED - Test para DELETE."""
@@ -305,6 +430,54 @@ class TestMeetingRepositoryACID:
         assert result is True
         assert meeting_repository.get_by_id(meeting.id) is None
     
+    def test_should_cascade_delete_prd_and_tasks_in_database(
+        self, meeting_repository, db_manager
+    ):
+        """🔴 RED - DELETE de la reunión: PRD y tareas caen por ON DELETE CASCADE."""
+        # Given
+        meeting = meeting_repository.save(Meeting(
+            id=f"meeting-{uuid4().hex[:8]}",
+            meeting_url="https://meet.google.com/cascade",
+            user_id="user-123"
+        ))
+        with db_manager.transaction() as session:
+            prd = PRD(
+                id=f"prd-{uuid4().hex[:8]}",
+                title="PRD",
+                requirements=[],
+                meeting_id=meeting.id
+            )
+            session.add(prd)
+            session.add(Task(
+                id=f"task-{uuid4().hex[:8]}",
+                title="Task",
+                assigned_role="Backend Developer",
+                prd_id=prd.id
+            ))
+        statements = []
+        event.listen(
+            db_manager.engine,
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *args: statements.append(statement)
+        )
+        
+        # When
+        result = meeting_repository.delete(meeting.id)
+        
+        # Then - un único DELETE; los hijos los borra la BD
+        assert result is True
+        assert [s for s in statements if s.startswith("DELETE")] == [
+            "DELETE FROM meetings WHERE meetings.id = ?"
+        ]
+        with db_manager.read_session() as session:
+            assert session.get(PRD, prd.id) is None
+            assert session.query(Task).count() == 0
+    
+    def test_should_return_false_when_deleting_missing_meeting(self, meeting_repository):
+        """🔴 RED - DELETE de una reunión inexistente."""
+        # When / Then
+        assert meeting_repository.delete("meeting-missing") is False
+    
     def test_should_get_pending_meetings(self, meeting_repository):
         """🔴 RED - Test para query por estado PENDING."""
         # Given
@@ -337,3 +510,199 @@ class TestMeetingRepositoryACID:
         # Then
         assert len(pending_meetings) == 2
         assert all(m.status == MeetingStatus.PENDING for m in pending_meetings)
+    
+    def test_should_claim_only_processable_meetings_oldest_first(self, meeting_repository):
+        """🔴 RED - Test para el poll de reuniones procesables (PENDING y retry_count < 3)."""
+        # Given
+        oldest = Meeting(
+            id=f"meeting-{uuid4().hex[:8]}",
+            meeting_url="https://meet.google.com/oldest",
+            user_id="user-123",
+            status=MeetingStatus.PENDING,
+            created_at=datetime(2024, 1, 1)
+        )
+        newest = Meeting(
+            id=f"meeting-{uuid4().hex[:8]}",
+            meeting_url="https://meet.google.com/newest",
+            user_id="user-123",
+            status=MeetingStatus.PENDING,
+            created_at=datetime(2024, 1, 2)
+        )
+        exhausted = Meeting(
+            id=f"meeting-{uuid4().hex[:8]}",
+            meeting_url="https://meet.google.com/exhausted",
+            user_id="user-456",
+            status=MeetingStatus.PENDING,
+            retry_count=3
+        )
+        
+        meeting_repository.save(newest)
+        meeting_repository.save(oldest)
+        meeting_repository.save(exhausted)
+        
+        # When
+        claimed = meeting_repository.claim_processable_meetings(limit=10)
+        
+        # Then
+        assert [m.id for m in claimed] == [oldest.id, newest.id]
+        assert all(m.status == MeetingStatus.PROCESSING for m in claimed)
+        assert meeting_repository.get_by_id(oldest.id).status == MeetingStatus.PROCESSING
+        assert meeting_repository.get_by_id(exhausted.id).status == MeetingStatus.PENDING
+    
+    def test_should_claim_disjoint_batches_across_calls(self, meeting_repository):
+        """🔴 RED - Test para que dos pollers no reclamen las mismas reuniones."""
+        # Given
+        meetings = [
+            Meeting(
+                id=f"meeting-{uuid4().hex[:8]}",
+                meeting_url=f"https://meet.google.com/claim-{i}",
+                user_id="user-123",
+                status=MeetingStatus.PENDING,
+                created_at=datetime(2024, 1, i + 1)
+            )
+            for i in range(3)
+        ]
+        meeting_repository.save_many(meetings)
+        
+        # When
+        first = meeting_repository.claim_processable_meetings(limit=2)
+        second = meeting_repository.claim_processable_meetings(limit=2)
+        
+        # Then
+        first_ids = {m.id for m in first}
+        second_ids = {m.id for m in second}
+        assert len(first_ids) == 2
+        assert first_ids.isdisjoint(second_ids)
+        assert first_ids | second_ids == {m.id for m in meetings}
+        assert meeting_repository.claim_processable_meetings(limit=2) == []
+    
+    def test_should_eager_load_prd_and_tasks_for_user_meetings(
+        self, meeting_repository, db_manager
+    ):
+        """🔴 RED - Test para precargar meeting.prd.tasks sin consultas lazy (N+1)."""
+        # Given
+        meeting = meeting_repository.save(Meeting(
+            id=f"meeting-{uuid4().hex[:8]}",
+            meeting_url="https://meet.google.com/eager",
+            user_id="user-eager",
+            status=MeetingStatus.COMPLETED
+        ))
+        with db_manager.transaction() as session:
+            prd = PRD(
+                id=f"prd-{uuid4().hex[:8]}",
+                title="PRD",
+                requirements=[{"id": "req-1", "type": "functional"}],
+                meeting_id=meeting.id
+            )
+            session.add(prd)
+            session.add(Task(
+                id=f"task-{uuid4().hex[:8]}",
+                title="Task",
+                assigned_role="Backend Developer",
+                prd_id=prd.id
+            ))
+        
+        # When - la sesión ya está cerrada al acceder a las relaciones
+        meetings = meeting_repository.get_by_user_id(
+            "user-eager", load=("prd", "prd.tasks")
+        )
+        
+        # Then
+        assert len(meetings) == 1
+        assert meetings[0].prd.title == "PRD"
+        assert [t.title for t in meetings[0].prd.tasks] == ["Task"]
+    
+    def test_should_reject_unknown_eager_load_path(self, meeting_repository):
+        """🔴 RED - Test para rutas de carga no soportadas."""
+        with pytest.raises(ValueError, match="Unsupported eager load path"):
+            meeting_repository.get_by_id("meeting-1", load=("tasks",))
+    
+    def test_should_serve_repeated_get_by_id_from_cache_until_write(
+        self, meeting_repository, db_manager
+    ):
+        """🔴 RED - Test para la caché de lecturas por id y su invalidación."""
+        # Given
+        meeting = meeting_repository.save(Meeting(
+            id=f"meeting-{uuid4().hex[:8]}",
+            meeting_url="https://meet.google.com/cached",
+            user_id="user-123",
+            status=MeetingStatus.PENDING
+        ))
+        first = meeting_repository.get_by_id(meeting.id)
+        
+        # When - cambio fuera del repositorio: la caché aún sirve el valor previo
+        with db_manager.transaction() as session:
+            session.get(Meeting, meeting.id).error_message = "out of band"
+        cached = meeting_repository.get_by_id(meeting.id)
+        meeting_repository.update_status(meeting.id, MeetingStatus.PROCESSING)
+        fresh = meeting_repository.get_by_id(meeting.id)
+        
+        # Then
+        assert cached.error_message is None
+        assert fresh.status == MeetingStatus.PROCESSING
+        assert fresh.error_message == "out of band"
+    
+    def test_should_hand_out_independent_copies_from_cache(self, meeting_repository):
+        """🔴 RED - Test para que mutar una lectura cacheada no afecte a las siguientes."""
+        # Given
+        meeting = meeting_repository.save(Meeting(
+            id=f"meeting-{uuid4().hex[:8]}",
+            meeting_url="https://meet.google.com/copies",
+            user_id="user-123",
+            status=MeetingStatus.PENDING
+        ))
+        first = meeting_repository.get_by_id(meeting.id)
+        
+        # When
+        first.status = MeetingStatus.FAILED
+        second = meeting_repository.get_by_id(meeting.id)
+        
+        # Then
+        assert second is not first
+        assert second.status == MeetingStatus.PENDING
+    
+    def test_should_drop_cached_prd_when_meeting_delete_cascades(
+        self, meeting_repository, db_manager
+    ):
+        """🔴 RED - Test para invalidar la caché de PRDs tras el borrado en cascada."""
+        # Given
+        meeting = meeting_repository.save(Meeting(
+            id=f"meeting-{uuid4().hex[:8]}",
+            meeting_url="https://meet.google.com/cached-prd",
+            user_id="user-123",
+            status=MeetingStatus.COMPLETED
+        ))
+        prd_repository = PRDRepository(db_manager)
+        prd = prd_repository.save(PRD(
+            id=f"prd-{uuid4().hex[:8]}",
+            title="PRD",
+            requirements=[{"id": "req-1", "type": "functional"}],
+            meeting_id=meeting.id
+        ))
+        assert prd_repository.get_by_id(prd.id) is not None
+        assert prd_repository.get_by_meeting_id(meeting.id) is not None
+        
+        # When
+        meeting_repository.delete(meeting.id)
+        
+        # Then
+        assert prd_repository.get_by_id(prd.id) is None
+        assert prd_repository.get_by_meeting_id(meeting.id) is None
+    
+    def test_ttl_cache_should_expire_and_evict_least_recently_used(self):
+        """🔴 RED - Test para expiración por TTL y desalojo LRU."""
+        # Given
+        now = [0.0]
+        cache = TTLCache(maxsize=2, ttl=10, timer=lambda: now[0])
+        cache.set("a", 1)
+        cache.set("b", 2)
+        
+        # When
+        cache.get("a")          # "b" pasa a ser el menos usado
+        cache.set("c", 3)
+        
+        # Then
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        now[0] = 10.0
+        assert cache.get("a") is None
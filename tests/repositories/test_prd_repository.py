@@ -9,7 +9,7 @@ from uuid import uuid4
 from datetime import datetime
 
 # Imports ajustados para Docker (PYTHONPATH=/app)
-from app.models import PRD, Meeting, MeetingStatus
+from app.models import PRD, Meeting, MeetingStatus, Task
 from app.repositories.prd_repository import PRDRepository
 from app.repositories.meeting_repository import MeetingRepository
 from app.database import DatabaseSessionManager
@@ -79,7 +79,7 @@ class TestPRDRepositoryACID:
             description="PRD para módulo de autenticación",
             requirements=requirements,
             meeting_id=sample_meeting.id,
-            confidence_score="0.85",
+            confidence_score=0.85,
             language_detected="es"
         )
         
@@ -176,6 +176,27 @@ class TestPRDRepositoryACID:
         assert retrieved.id == saved_prd.id
         assert retrieved.title == saved_prd.title
     
+    def test_should_skip_requirements_json_when_not_requested(
+        self, prd_repository, sample_meeting
+    ):
+        """🔴 RED - Test para la carga diferida de requirements."""
+        # Given
+        saved_prd = prd_repository.save(PRD(
+            id=f"prd-{uuid4().hex[:8]}",
+            title="Metadata only",
+            requirements=[{"id": "req-1", "type": "functional"}],
+            meeting_id=sample_meeting.id
+        ))
+        
+        # When
+        metadata = prd_repository.get_by_id(saved_prd.id, with_requirements=False)
+        full = prd_repository.get_by_id(saved_prd.id)
+        
+        # Then
+        assert metadata.title == "Metadata only"
+        assert "requirements" not in metadata.__dict__
+        assert full.requirements == [{"id": "req-1", "type": "functional"}]
+    
     def test_should_return_none_for_nonexistent_prd(self, prd_repository):
         """🔴 RED - Test para PRD inexistente."""
         # When
@@ -231,6 +252,75 @@ class TestPRDRepositoryACID:
         assert len(functional_reqs) == 2
         assert all(req["type"] == "functional" for req in functional_reqs)
     
+    def test_should_not_leak_requirement_mutations_through_cache(
+        self, prd_repository, sample_meeting
+    ):
+        """🔴 RED - Test para que la caché entregue copias independientes del JSON."""
+        # Given
+        prd = prd_repository.save(PRD(
+            id=f"prd-{uuid4().hex[:8]}",
+            title="Cached PRD",
+            requirements=[{"id": "req-1", "type": "functional"}],
+            meeting_id=sample_meeting.id
+        ))
+        first = prd_repository.get_by_id(prd.id)
+        
+        # When
+        first.requirements[0]["type"] = "non_functional"
+        second = prd_repository.get_by_id(prd.id)
+        
+        # Then
+        assert second.requirements == [{"id": "req-1", "type": "functional"}]
+    
+    def test_should_refresh_cached_requirement_views_after_add_requirement(self):
+        """🔴 RED - Test para invalidar los filtros memoizados al mutar requisitos."""
+        # Given
+        prd = PRD(
+            id=f"prd-{uuid4().hex[:8]}",
+            title="Cached PRD",
+            requirements=[{"id": "req-1", "type": "functional"}],
+            meeting_id="meeting-1"
+        )
+        assert len(prd.functional_requirements) == 1
+        
+        # When
+        prd.add_requirement({"id": "req-2", "type": "functional"})
+        prd.requirements = prd.requirements + [{"id": "req-3", "type": "non_functional"}]
+        
+        # Then
+        assert len(prd.functional_requirements) == 2
+        assert len(prd.non_functional_requirements) == 1
+    
+    def test_should_get_prds_by_requirement_type(
+        self, prd_repository, meeting_repository, sample_meeting
+    ):
+        """🔴 RED - Test para filtrar PRDs por tipo de requisito."""
+        # Given
+        other_meeting = meeting_repository.save(Meeting(
+            id=f"meeting-{uuid4().hex[:8]}",
+            meeting_url="https://meet.google.com/other",
+            user_id="user-123",
+            status=MeetingStatus.COMPLETED
+        ))
+        functional = prd_repository.save(PRD(
+            id=f"prd-{uuid4().hex[:8]}",
+            title="Functional PRD",
+            requirements=[{"id": "req-1", "type": "functional"}],
+            meeting_id=sample_meeting.id
+        ))
+        prd_repository.save(PRD(
+            id=f"prd-{uuid4().hex[:8]}",
+            title="Non-functional PRD",
+            requirements=[{"id": "req-1", "type": "non_functional"}],
+            meeting_id=other_meeting.id
+        ))
+        
+        # When
+        result = prd_repository.get_by_requirement_type("functional")
+        
+        # Then
+        assert [prd.id for prd in result] == [functional.id]
+    
     def test_should_calculate_prd_complexity(self, prd_repository, sample_meeting):
         """🔴 RED - Test para cálculo de complejidad del PRD."""
         # Given - PRD con 5 requisitos (complejidad MEDIA)
@@ -303,6 +393,52 @@ class TestPRDRepositoryACID:
         assert result is True
         assert prd_repository.get_by_id(saved_prd.id) is None
     
+    def test_should_delete_prd_with_its_tasks(
+        self, prd_repository, sample_meeting, db_manager
+    ):
+        """🔴 RED - Test para DELETE de PRD junto con sus tareas."""
+        # Given
+        saved_prd = prd_repository.save(PRD(
+            id=f"prd-{uuid4().hex[:8]}",
+            title="PRD with tasks",
+            requirements=[{"id": "req-1", "description": "Test"}],
+            meeting_id=sample_meeting.id
+        ))
+        with db_manager.transaction() as session:
+            session.add(Task(
+                id=f"task-{uuid4().hex[:8]}",
+                title="Child task",
+                assigned_role="Backend Developer",
+                prd_id=saved_prd.id
+            ))
+        
+        # When
+        result = prd_repository.delete(saved_prd.id)
+        
+        # Then
+        assert result is True
+        assert prd_repository.has_prd_for_meeting(sample_meeting.id) is False
+        with db_manager.read_session() as session:
+            assert session.query(Task).filter_by(prd_id=saved_prd.id).count() == 0
+    
+    def test_should_check_prd_existence_for_meeting(
+        self, prd_repository, sample_meeting
+    ):
+        """🔴 RED - Test para EXISTS sin cargar el PRD."""
+        # Given
+        assert prd_repository.has_prd_for_meeting(sample_meeting.id) is False
+        
+        # When
+        prd_repository.save(PRD(
+            id=f"prd-{uuid4().hex[:8]}",
+            title="Existing PRD",
+            requirements=[{"id": "req-1", "description": "Test"}],
+            meeting_id=sample_meeting.id
+        ))
+        
+        # Then
+        assert prd_repository.has_prd_for_meeting(sample_meeting.id) is True
+    
     def test_should_return_false_when_deleting_nonexistent_prd(
         self, prd_repository
     ):
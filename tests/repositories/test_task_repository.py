@@ -9,7 +9,7 @@ from uuid import uuid4
 
 # Imports ajustados para Docker (PYTHONPATH=/app)
 from app.models import Task, TaskPriority, TaskStatus, PRD, Meeting, MeetingStatus
-from app.repositories.task_repository import TaskRepository
+from app.repositories.task_repository import BULK_INSERT_THRESHOLD, TaskRepository, TaskSummary
 from app.repositories.prd_repository import PRDRepository
 from app.repositories.meeting_repository import MeetingRepository
 from app.database import DatabaseSessionManager
@@ -82,7 +82,7 @@ class TestTaskRepositoryACID:
             status=TaskStatus.PENDING,
             requirement_id="req-1",
             prd_id=sample_prd.id,
-            confidence_score="0.90"
+            confidence_score=0.90
         )
         
         # When
@@ -93,6 +93,7 @@ class TestTaskRepositoryACID:
         assert saved_task.id == task.id
         assert saved_task.title == task.title
         assert saved_task.assigned_role == "Backend Developer"
+        assert saved_task.confidence_score == 0.90
         assert saved_task.priority == TaskPriority.HIGH
         assert saved_task.prd_id == sample_prd.id
     
@@ -214,6 +215,54 @@ class TestTaskRepositoryACID:
         assert len(prd_tasks) == 3
         assert all(task.prd_id == sample_prd.id for task in prd_tasks)
     
+    @pytest.mark.parametrize("batch_size", [3, BULK_INSERT_THRESHOLD])
+    def test_should_save_many_tasks_in_one_transaction(
+        self, task_repository, sample_prd, batch_size
+    ):
+        """🔴 RED - Test para guardar un lote de tareas (add_all y bulk insert)."""
+        # Given
+        tasks = [
+            Task(
+                id=f"task-{uuid4().hex[:8]}",
+                title=f"Task {i}",
+                assigned_role="Backend Developer",
+                prd_id=sample_prd.id
+            )
+            for i in range(batch_size)
+        ]
+        
+        # When
+        saved = task_repository.save_many(tasks)
+        
+        # Then
+        assert len(saved) == batch_size
+        prd_tasks = task_repository.get_by_prd_id(sample_prd.id)
+        assert len(prd_tasks) == batch_size
+        assert all(task.status == TaskStatus.PENDING for task in prd_tasks)
+    
+    def test_should_reject_whole_batch_when_one_task_is_invalid(
+        self, task_repository, sample_prd
+    ):
+        """🔴 RED - Test para validar todo el lote antes de persistir."""
+        # Given
+        valid = Task(
+            id=f"task-{uuid4().hex[:8]}",
+            title="Valid",
+            assigned_role="Backend Developer",
+            prd_id=sample_prd.id
+        )
+        invalid = Task(
+            id=f"task-{uuid4().hex[:8]}",
+            title="",
+            assigned_role="Backend Developer",
+            prd_id=sample_prd.id
+        )
+        
+        # When & Then
+        with pytest.raises(ValueError):
+            task_repository.save_many([valid, invalid])
+        assert task_repository.get_by_prd_id(sample_prd.id) == []
+    
     def test_should_get_tasks_by_assigned_role(self, task_repository, sample_prd):
         """🔴 RED - Test para filtrar tareas por rol asignado."""
         # Given
@@ -283,6 +332,40 @@ class TestTaskRepositoryACID:
         assert len(high_priority_tasks) == 2
         assert all(task.is_high_priority() for task in high_priority_tasks)
     
+    def test_should_get_high_priority_tasks_summary(self, task_repository, sample_prd):
+        """🔴 RED - Test para el resumen de alta prioridad (solo columnas del dashboard)."""
+        # Given
+        critical_task = task_repository.save(Task(
+            id=f"task-{uuid4().hex[:8]}",
+            title="Critical Task",
+            description="Descripción larga que el resumen no debe cargar",
+            assigned_role="Backend Developer",
+            priority=TaskPriority.CRITICAL,
+            prd_id=sample_prd.id
+        ))
+        task_repository.save(Task(
+            id=f"task-{uuid4().hex[:8]}",
+            title="Low Priority Task",
+            assigned_role="QA Engineer",
+            priority=TaskPriority.LOW,
+            prd_id=sample_prd.id
+        ))
+        
+        # When
+        summaries = task_repository.get_high_priority_tasks_summary()
+        
+        # Then
+        assert summaries == [
+            TaskSummary(
+                id=critical_task.id,
+                title="Critical Task",
+                assigned_role="Backend Developer",
+                priority=TaskPriority.CRITICAL,
+                status=TaskStatus.PENDING
+            )
+        ]
+        assert isinstance(summaries[0].priority, TaskPriority)
+    
     # ===== UPDATE OPERATIONS TESTS =====
     
     def test_should_update_task_status(self, task_repository, sample_prd):
@@ -306,6 +389,37 @@ class TestTaskRepositoryACID:
         # Then
         assert updated_task.status == TaskStatus.IN_PROGRESS
     
+    def test_should_update_many_task_statuses_in_one_statement(
+        self, task_repository, sample_prd
+    ):
+        """🔴 RED - Test para la transición de estado en bloque."""
+        # Given
+        tasks = task_repository.save_many([
+            Task(
+                id=f"task-{uuid4().hex[:8]}",
+                title=f"Task {i}",
+                assigned_role="Backend Developer",
+                prd_id=sample_prd.id
+            )
+            for i in range(3)
+        ])
+        
+        # When
+        updated = task_repository.update_many_status(
+            [tasks[0].id, tasks[1].id, "nonexistent-task"], TaskStatus.COMPLETED
+        )
+        task_repository.bulk_link_external_tasks([
+            {"id": tasks[2].id, "external_task_id": "JIRA-9", "external_task_url": "https://jira/JIRA-9"}
+        ])
+        
+        # Then
+        assert updated == 2
+        by_id = {t.id: t for t in task_repository.get_by_prd_id(sample_prd.id)}
+        assert by_id[tasks[0].id].status == TaskStatus.COMPLETED
+        assert by_id[tasks[1].id].status == TaskStatus.COMPLETED
+        assert by_id[tasks[2].id].status == TaskStatus.PENDING
+        assert by_id[tasks[2].id].external_task_id == "JIRA-9"
+    
     def test_should_link_external_task(self, task_repository, sample_prd):
         """🔴 RED - Test para vincular tarea con sistema externo (Jira)."""
         # Given
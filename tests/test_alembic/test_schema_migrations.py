@@ -109,9 +109,9 @@ class TestAlembicMigrations:
         for col_name in required_columns:
             assert col_name in columns, f"Columna '{col_name}' falta en tabla tasks"
         
-        # Verificar ENUMs
-        assert columns["priority"]["type"].__class__.__name__ == "ENUM"
-        assert columns["status"]["type"].__class__.__name__ == "ENUM"
+        # Verificar IntEnums persistidos como SMALLINT
+        assert columns["priority"]["type"].__class__.__name__ == "SMALLINT"
+        assert columns["status"]["type"].__class__.__name__ == "SMALLINT"
     
     # ===== TESTS DE PRIMARY KEYS =====
     
@@ -144,6 +144,8 @@ class TestAlembicMigrations:
             "FK debe estar en columna 'meeting_id'"
         assert "id" in meeting_fk["referred_columns"], \
             "FK debe apuntar a columna 'id' de meetings"
+        assert meeting_fk["options"].get("ondelete") == "CASCADE", \
+            "FK prds → meetings debe ser ON DELETE CASCADE"
     
     def test_tasks_table_should_have_foreign_key_to_prds(self, inspector):
         """🔴 RED → 🟢 GREEN: Validar FK de tasks → prds."""
@@ -157,6 +159,8 @@ class TestAlembicMigrations:
             "FK debe estar en columna 'prd_id'"
         assert "id" in prd_fk["referred_columns"], \
             "FK debe apuntar a columna 'id' de prds"
+        assert prd_fk["options"].get("ondelete") == "CASCADE", \
+            "FK tasks → prds debe ser ON DELETE CASCADE"
     
     # ===== TESTS DE ÍNDICES (PERFORMANCE OPTIMIZATION) =====
     
@@ -169,7 +173,8 @@ class TestAlembicMigrations:
         expected_indexes = [
             "ix_meetings_id",
             "ix_meetings_status",
-            "ix_meetings_user_id"
+            "ix_meetings_user_status",
+            "ix_meetings_processable"
         ]
         
         for idx_name in expected_indexes:
@@ -182,15 +187,23 @@ class TestAlembicMigrations:
         
         expected_indexes = [
             "ix_tasks_id",
-            "ix_tasks_assigned_role",
-            "ix_tasks_prd_id",
             "ix_tasks_priority",
-            "ix_tasks_status"
+            "ix_tasks_status",
+            "ix_tasks_prd_priority",
+            "ix_tasks_role_status"
         ]
         
         for idx_name in expected_indexes:
             assert idx_name in index_names, f"Índice '{idx_name}' falta en tasks"
     
+    def test_prds_table_should_have_requirements_gin_index(self, inspector):
+        """🔴 RED → 🟢 GREEN: Validar índice GIN sobre prds.requirements."""
+        indexes = inspector.get_indexes("prds")
+        index_names = {idx["name"] for idx in indexes}
+        
+        assert "ix_prds_requirements" in index_names, \
+            "Índice 'ix_prds_requirements' falta en prds"
+    
     # ===== TESTS DE UNIQUE CONSTRAINTS =====
     
     def test_prds_table_should_have_unique_meeting_id(self, inspector):
@@ -216,9 +229,9 @@ class TestAlembicMigrations:
             assert current_version is not None, \
                 "No hay versión de Alembic aplicada"
             
-            # La versión actual debe ser '164cf67dea8e' (Initial schema)
-            assert current_version == "164cf67dea8e", \
-                f"Versión aplicada '{current_version}' no es la esperada '164cf67dea8e'"
+            # La versión actual debe ser 'd4f7b1e9a3c6' (FKs con ON DELETE CASCADE)
+            assert current_version == "d4f7b1e9a3c6", \
+                f"Versión aplicada '{current_version}' no es la esperada 'd4f7b1e9a3c6'"
     
     # ===== TESTS DE INTEGRIDAD END-TO-END =====
     
@@ -242,7 +255,7 @@ class TestAlembicMigrations:
                 title="Test PRD",
                 requirements=[{"id": "req-1", "type": "functional"}],
                 meeting_id=meeting.id,
-                confidence_score="0.95",
+                confidence_score=0.95,
                 language_detected="es"
             )
             session.add(prd)
@@ -256,7 +269,7 @@ class TestAlembicMigrations:
                 priority=TaskPriority.HIGH,
                 status=TaskStatus.PENDING,
                 prd_id=prd.id,
-                confidence_score="0.90"
+                confidence_score=0.90
             )
             session.add(task)
             session.flush()